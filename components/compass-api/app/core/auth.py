@@ -3,10 +3,11 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 
+from app.core.cache import PRINCIPALS_CACHE, get_cache
 from app.core.config import settings
 from app.models import UserInDB
 from app.models.user import User
-from app.services.user_service import UserService
+from app.services.user_service import get_user_service
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
@@ -26,10 +27,23 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
     except InvalidTokenError:
         raise credentials_exception
 
-    user_service = UserService()
-    user = await user_service.get_user_by_username(username)
+    # Authenticated users are cached by token subject; user writes invalidate the cache
+    principal_cache = None
+    if settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS > 0:
+        principal_cache = get_cache(
+            PRINCIPALS_CACHE,
+            maxsize=settings.AUTH_PRINCIPAL_CACHE_SIZE,
+            ttl=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+        user = principal_cache.get(username)
+        if user is not None:
+            return user
+
+    user = await get_user_service().get_user_by_username(username)
     if user is None:
         raise credentials_exception
+    if principal_cache is not None:
+        principal_cache[username] = user
     return user
 
 
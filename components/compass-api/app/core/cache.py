@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+
+from cachetools import TTLCache
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+from app.core.config import settings
+from app.core.mongodb import get_database
+
+logger = logging.getLogger(__name__)
+
+# Cache namespaces shared across services
+CATEGORIES_CACHE = "categories"
+GROUPS_CACHE = "groups"
+LOGINS_CACHE = "logins"
+PRINCIPALS_CACHE = "principals"
+TAGS_CACHE = "tags"
+SUGGEST_CACHE = "suggest"
+USER_PROFILES_CACHE = "user_profiles"
+TECH_RADAR_CACHE = "tech_radar"
+
+# Capped collection used to broadcast invalidations to other worker processes
+INVALIDATION_COLLECTION = "cache_invalidations"
+INVALIDATION_COLLECTION_SIZE = 1024 * 1024  # 1 MB
+
+_caches: Dict[str, TTLCache] = {}
+# Identifies invalidations published by this process
+_origin = uuid.uuid4().hex
+
+
+def get_cache(namespace: str, maxsize: int = 100, ttl: int = 3600) -> TTLCache:
+    """Get the process-wide cache of a namespace, creating it on first use.
+
+    Args:
+        namespace: Name of the cache, shared by every caller using the same name
+        maxsize: Maximum number of entries, only used when the cache is created
+        ttl: Time to live of entries in seconds, only used when the cache is created
+
+    Returns:
+        The TTLCache instance for the namespace
+    """
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = _caches[namespace] = TTLCache(maxsize=maxsize, ttl=ttl)
+    return cache
+
+
+def clear_local(*namespaces: str) -> None:
+    """Clear the caches of the given namespaces in this process only"""
+    for namespace in namespaces:
+        cache = _caches.get(namespace)
+        if cache is not None:
+            cache.clear()
+
+
+def clear_local_entry(namespace: str, key) -> None:
+    """Remove a single entry from the cache of a namespace in this process only"""
+    cache = _caches.get(namespace)
+    if cache is not None:
+        cache.pop(key, None)
+
+
+async def invalidate(*namespaces: str) -> None:
+    """Clear the caches of the given namespaces.
+
+    When CACHE_INVALIDATION_BROADCAST_ENABLED is set, the invalidation is also
+    published so that other worker processes clear their copies.
+    """
+    clear_local(*namespaces)
+
+    if not settings.CACHE_INVALIDATION_BROADCAST_ENABLED:
+        return
+
+    try:
+        await get_database()[INVALIDATION_COLLECTION].insert_one(
+            {"namespaces": list(namespaces), "origin": _origin, "created_at": datetime.utcnow()}
+        )
+    except PyMongoError as e:
+        logger.error(f"Failed to broadcast cache invalidation for {', '.join(namespaces)}: {str(e)}")
+
+
+class CacheInvalidationListener:
+    """Tails the invalidation collection and clears caches invalidated by other processes"""
+
+    def __init__(self, poll_interval: float = 1.0):
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Create the capped invalidation collection if needed and start listening"""
+        try:
+            await db.create_collection(INVALIDATION_COLLECTION, capped=True, size=INVALIDATION_COLLECTION_SIZE)
+        except CollectionInvalid:
+            pass  # Collection already exists
+
+        collection = db[INVALIDATION_COLLECTION]
+        latest = await collection.find_one({}, {"_id": 1}, sort=[("$natural", -1)])
+        self._task = asyncio.create_task(self._listen(collection, latest["_id"] if latest else None))
+        logger.info("Cache invalidation listener started")
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self, collection, last_id) -> None:
+        while True:
+            try:
+                last_id = await self._tail(collection, last_id)
+            except PyMongoError as e:
+                logger.error(f"Cache invalidation listener error: {str(e)}")
+            # Tailable cursors die when the collection is empty; wait before re-opening
+            await asyncio.sleep(self.poll_interval)
+
+    async def _tail(self, collection, last_id):
+        """Apply invalidations after last_id until the tailable cursor dies, returning the last one seen
+
+        ObjectIds from different processes are not ordered by insertion, so a re-opened cursor
+        resumes in $natural (insertion) order after the last seen invalidation rather than
+        querying for greater ids. If that invalidation has left the capped collection, all
+        remaining ones are applied; clearing a cache too often is harmless.
+        """
+        skipping = last_id is not None and await collection.find_one({"_id": last_id}, {"_id": 1}) is not None
+        cursor = collection.find({}, cursor_type=CursorType.TAILABLE_AWAIT)
+        while cursor.alive:
+            try:
+                invalidation = await cursor.next()
+            except StopAsyncIteration:
+                # An await-data wait ended without new invalidations; the cursor stays open
+                continue
+            if skipping:
+                skipping = invalidation["_id"] != last_id
+                continue
+            last_id = invalidation["_id"]
+            if invalidation.get("origin") != _origin:
+                clear_local(*invalidation.get("namespaces", []))
+        return last_id
+
+
+cache_invalidation_listener = CacheInvalidationListener()
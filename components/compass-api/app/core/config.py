@@ -10,6 +10,9 @@ class Settings(BaseSettings):
     MONGODB_TLS_CERT_PATH: Optional[str] = None
     MONGODB_TLS_CA_PATH: Optional[str] = None
     MONGODB_TLS_KEY_PATH: Optional[str] = None
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = None
 
     # JWT settings
     JWT_SECRET_KEY: str
@@ -28,6 +31,33 @@ class Settings(BaseSettings):
     # Avatar Server settings
     AVATAR_SERVER_URL: str = ""
     AVATAR_SERVER_ENABLED: bool = False
+    # In-memory avatar cache bound in bytes; fetched avatars are also kept in AVATAR_CACHE_DIR when set
+    AVATAR_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    AVATAR_CACHE_TTL_SECONDS: int = 86400
+    AVATAR_CACHE_DIR: str = ""
+    # How long browsers and proxies may reuse an avatar without revalidating it
+    AVATAR_HTTP_MAX_AGE_SECONDS: int = 3600
+
+    # Shared HTTP client for the auth and avatar servers
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 50
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CLIENT_VERIFY_SSL: bool = False
+    # Consecutive failures after which a server is skipped for HTTP_CLIENT_CIRCUIT_RESET_SECONDS
+    HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    HTTP_CLIENT_CIRCUIT_RESET_SECONDS: float = 30.0
+
+    # Authenticated user cache; changes made outside the user APIs apply after at most the TTL, 0 disables it
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    AUTH_PRINCIPAL_CACHE_SIZE: int = 1000
+
+    # Successful external auth server logins are reused for this many seconds, 0 disables it
+    AUTH_LOGIN_CACHE_TTL_SECONDS: int = 0
+    AUTH_LOGIN_CACHE_SIZE: int = 1000
+
+    # Password hashing pool; calls beyond PASSWORD_HASH_MAX_PENDING waiting ones are rejected with 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 100
 
     # Default Admin settings
     DEFAULT_ADMIN_USERNAME: str = "admin"
@@ -35,6 +65,24 @@ class Settings(BaseSettings):
     DEFAULT_ADMIN_EMAIL: str = "admin@techcompass.com"
     DEFAULT_ADMIN_FULLNAME: str = "System Admin"
 
+    # Cache settings
+    CACHE_INVALIDATION_BROADCAST_ENABLED: bool = False
+
+    # Use the collection metadata count as the total of unfiltered solution lists
+    SOLUTIONS_ESTIMATED_TOTAL_ENABLED: bool = False
+
+    # In-memory search index settings
+    SEARCH_INDEX_ENABLED: bool = False
+    SEARCH_INDEX_REFRESH_SECONDS: int = 300
+
+    # History records are written in the background in "async" mode; when its queue is full, a request
+    # waits for room ("block"), writes its records itself ("sync") or drops them ("drop")
+    HISTORY_WRITE_MODE: Literal["sync", "async"] = "async"
+    HISTORY_QUEUE_SIZE: int = 10000
+    HISTORY_QUEUE_OVERFLOW: Literal["block", "sync", "drop"] = "sync"
+    HISTORY_BATCH_SIZE: int = 100
+    HISTORY_FLUSH_TIMEOUT_SECONDS: float = 10.0
+
     # Rate limiting
     RATE_LIMIT_PER_MINUTE: int = 100
     AUTH_RATE_LIMIT_PER_MINUTE: int = 1000
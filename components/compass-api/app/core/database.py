@@ -1,11 +1,8 @@
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.core.config import settings
-
-client = AsyncIOMotorClient(settings.MONGODB_URL)
-database = client[settings.DATABASE_NAME]
+from app.core import mongodb
 
 
 def get_database() -> AsyncIOMotorDatabase:
-    """Get database instance."""
-    return database
+    """Get database instance from the process-wide MongoDB client."""
+    return mongodb.get_database()
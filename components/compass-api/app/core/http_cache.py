@@ -0,0 +1,84 @@
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Tuple
+
+from fastapi import Request
+
+# A single byte range; several ranges in one header are not supported
+BYTE_RANGE_PATTERN = re.compile(r"bytes=(?P<first>\d*)-(?P<last>\d*)", re.IGNORECASE)
+
+
+def format_http_date(value: datetime) -> str:
+    """Format a naive UTC datetime as an HTTP date (RFC 7231)"""
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag using weak comparison"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate.removeprefix("W/") == etag.removeprefix("W/") for candidate in candidates)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Check whether a conditional GET can be answered with 304 Not Modified.
+
+    If-None-Match takes precedence over If-Modified-Since, as required by RFC 7232.
+
+    Args:
+        request: The incoming request
+        etag: The current ETag of the resource (including quotes)
+        last_modified: Optional naive UTC datetime of the last change to the resource
+
+    Returns:
+        True if the client's cached copy is still valid
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+    return False
+
+
+def parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single byte range of a Range header (RFC 7233)
+
+    Args:
+        range_header: The Range header value, such as "bytes=0-1023", "bytes=1024-" or "bytes=-512"
+        size: The size of the resource in bytes
+
+    Returns:
+        The (start, end) offsets of the range, end inclusive; None if the header should be
+        ignored because it is malformed or asks for several ranges
+
+    Raises:
+        ValueError: If the range cannot be satisfied for a resource of this size
+    """
+    match = BYTE_RANGE_PATTERN.fullmatch(range_header.strip())
+    if not match or not (match["first"] or match["last"]):
+        return None
+
+    if not match["first"]:
+        # Suffix range: the last N bytes
+        suffix = int(match["last"])
+        if suffix == 0 or size == 0:
+            raise ValueError("Range not satisfiable")
+        return max(size - suffix, 0), size - 1
+
+    start = int(match["first"])
+    last = int(match["last"]) if match["last"] else size - 1
+    if start >= size or last < start:
+        raise ValueError("Range not satisfiable")
+    return start, min(last, size - 1)
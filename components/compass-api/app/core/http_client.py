@@ -0,0 +1,143 @@
+import importlib.util
+import logging
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(httpx.RequestError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Stops calling a failing host for a while after consecutive failures.
+
+    After failure_threshold consecutive failures the circuit opens and requests fail
+    fast. Once reset_timeout seconds have passed, one trial request is let through:
+    success closes the circuit again, failure keeps it open for another period.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, letting a trial request through after the reset timeout"""
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            # Half-open: allow this request and fail fast for others until it completes
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class SharedHttpClient:
+    """Process-wide HTTP client for calls to external servers (auth server, avatar server).
+
+    Reusing one client keeps connections alive between requests, so a login or an
+    avatar fetch costs one request round trip instead of a new TCP and TLS handshake.
+    Connection limits and timeouts bound the resources a slow server can hold, and a
+    circuit breaker per host fails fast while a server keeps failing.
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _create_client(self) -> httpx.AsyncClient:
+        http2 = importlib.util.find_spec("h2") is not None
+        return httpx.AsyncClient(
+            http2=http2,
+            verify=settings.HTTP_CLIENT_VERIFY_SSL,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(settings.HTTP_CLIENT_TIMEOUT_SECONDS),
+        )
+
+    async def start(self) -> None:
+        """Create the shared client"""
+        if self._client is None:
+            self._client = self._create_client()
+            logger.info("Shared HTTP client started")
+
+    async def stop(self) -> None:
+        """Close the shared client and its connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared client, creating it if the application lifespan did not"""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _get_breaker(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                failure_threshold=settings.HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=settings.HTTP_CLIENT_CIRCUIT_RESET_SECONDS,
+            )
+        return breaker
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared client and the circuit breaker of the target host
+
+        Network errors, timeouts and 5xx responses count as failures of the host.
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+            httpx.RequestError: If the request fails
+        """
+        host = httpx.URL(url).host
+        breaker = self._get_breaker(host)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {host}, skipping request")
+
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.RequestError:
+            breaker.record_failure()
+            if breaker.is_open:
+                logger.warning(f"Circuit opened for {host} after {breaker.failures} consecutive failures")
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+shared_http_client = SharedHttpClient()
@@ -0,0 +1,139 @@
+import logging
+from typing import Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+# Field weights for the solutions text search index
+SOLUTION_TEXT_WEIGHTS = {
+    "name": 10,  # Highest priority
+    "brief": 8,  # Second priority
+    "description": 5,  # Third priority
+    "category": 3,
+    "department": 3,
+    "team": 3,
+    "maintainer_name": 2,
+    "pros": 1,
+    "cons": 1,
+}
+
+# Declared indexes for every collection, applied once at startup.
+# Unique indexes back the places where the services assume uniqueness.
+# List sort keys end with _id, the tiebreaker of keyset (cursor) pagination.
+INDEXES: Dict[str, List[IndexModel]] = {
+    "solutions": [
+        IndexModel([("slug", ASCENDING)], unique=True),
+        IndexModel([("name", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("category", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("group", ASCENDING)]),
+        IndexModel([("tags", ASCENDING)]),
+        IndexModel([("recommend_status", ASCENDING)]),
+        IndexModel([("review_status", ASCENDING), ("group", ASCENDING)]),
+        IndexModel([("created_by", ASCENDING)]),
+        IndexModel([("maintainer_id", ASCENDING)]),
+        IndexModel([(field, TEXT) for field in SOLUTION_TEXT_WEIGHTS], weights=SOLUTION_TEXT_WEIGHTS),
+    ],
+    "ratings": [
+        IndexModel([("solution_slug", ASCENDING), ("username", ASCENDING)], unique=True),
+        IndexModel([("username", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ],
+    "comments": [
+        IndexModel([("solution_slug", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("username", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ],
+    "history": [
+        IndexModel([("object_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ],
+    "users": [
+        IndexModel([("username", ASCENDING)], unique=True),
+    ],
+    "tags": [
+        IndexModel([("name", ASCENDING)], unique=True),
+    ],
+    "categories": [
+        IndexModel([("name", ASCENDING)], unique=True),
+        IndexModel([("radar_quadrant", ASCENDING), ("name", ASCENDING)]),
+    ],
+    "groups": [
+        IndexModel([("name", ASCENDING)], unique=True),
+        IndexModel([("order", ASCENDING)]),
+    ],
+    "assets": [
+        IndexModel([("name", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+    ],
+    # GridFS bucket of asset content, the indexes GridFS itself requires
+    "asset_files.files": [
+        IndexModel([("filename", ASCENDING), ("uploadDate", ASCENDING)]),
+    ],
+    "asset_files.chunks": [
+        IndexModel([("files_id", ASCENDING), ("n", ASCENDING)], unique=True),
+    ],
+    "site_config": [
+        IndexModel([("key", ASCENDING), ("active", ASCENDING)]),
+    ],
+}
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> List[str]:
+    """Create all declared indexes that do not exist yet.
+
+    Each index is created separately so that one failure (for example duplicate
+    values blocking a unique index) does not prevent the others from being built.
+
+    Args:
+        db: The database to create the indexes in
+
+    Returns:
+        List of "collection.index_name" entries that could not be created
+    """
+    failed = []
+    for collection_name, index_models in INDEXES.items():
+        for index_model in index_models:
+            index_name = index_model.document["name"]
+            try:
+                await db[collection_name].create_indexes([index_model])
+            except PyMongoError as e:
+                logger.error(f"Failed to create index {collection_name}.{index_name}: {str(e)}")
+                failed.append(f"{collection_name}.{index_name}")
+    return failed
+
+
+async def diff_indexes(db: AsyncIOMotorDatabase) -> Dict[str, Dict[str, List[str]]]:
+    """Compare the declared indexes with the indexes that exist in the database.
+
+    Args:
+        db: The database to inspect
+
+    Returns:
+        Dictionary mapping collection names to their differences:
+        - missing: declared indexes that do not exist
+        - extra: existing indexes that are not declared (the default _id index is ignored)
+        - mismatched: indexes that exist with a different unique option
+        Collections without differences are omitted.
+    """
+    differences = {}
+    for collection_name, index_models in INDEXES.items():
+        existing = await db[collection_name].index_information()
+        existing.pop("_id_", None)
+
+        declared = {index_model.document["name"]: index_model.document for index_model in index_models}
+        missing = [name for name in declared if name not in existing]
+        extra = [name for name in existing if name not in declared]
+        mismatched = [
+            name
+            for name, document in declared.items()
+            if name in existing and bool(document.get("unique")) != bool(existing[name].get("unique"))
+        ]
+
+        if missing or extra or mismatched:
+            differences[collection_name] = {"missing": missing, "extra": extra, "mismatched": mismatched}
+    return differences
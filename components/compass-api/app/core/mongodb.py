@@ -17,11 +17,16 @@ db = MongoDB()
 
 
 def get_mongodb_options() -> Dict[str, Any]:
-    """Get MongoDB connection options including TLS/SSL if certificates are provided."""
+    """Get MongoDB connection options including pool sizing and TLS/SSL if certificates are provided."""
     options = {
-        "serverSelectionTimeoutMS": 5000  # 5 second timeout
+        "serverSelectionTimeoutMS": 5000,  # 5 second timeout
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
     }
 
+    if settings.MONGODB_MAX_IDLE_TIME_MS is not None:
+        options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+
     # Add TLS/SSL options if certificates are provided
     if any(
         [
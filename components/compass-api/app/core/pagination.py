@@ -0,0 +1,78 @@
+import base64
+import binascii
+from typing import Any, List, Optional, Sequence, Tuple
+
+from bson import json_util
+from pymongo import ASCENDING, DESCENDING
+
+CURSOR_DESCRIPTION = "Cursor from next_cursor of the previous page; replaces skip and omits the total"
+
+
+def encode_cursor(sort_value: Any, last_id: Any) -> str:
+    """Encode the sort key and _id of the last item of a page as an opaque cursor token"""
+    payload = json_util.dumps([sort_value, last_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """Decode a cursor token into the (sort value, _id) it was created from
+
+    Raises:
+        ValueError: If the token is not a valid cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, last_id = json_util.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    return sort_value, last_id
+
+
+def keyset_sort(sort_field: str, sort_direction: int) -> List[Tuple[str, int]]:
+    """Get the sort specification with _id as tiebreaker, so every item has a unique position"""
+    return [(sort_field, sort_direction), ("_id", sort_direction)]
+
+
+def apply_cursor(query: dict, sort_field: str, sort_direction: int, cursor: Optional[str]) -> dict:
+    """Restrict a query to the items after the cursor position in keyset_sort order
+
+    Missing and null sort values sort before all others in ascending order and after
+    all others in descending order, matching MongoDB's sort order.
+
+    Args:
+        query: The filter query
+        sort_field: The field the items are sorted by
+        sort_direction: ASCENDING or DESCENDING
+        cursor: Cursor token from the previous page, None for the first page
+
+    Returns:
+        The filter query for the next page
+
+    Raises:
+        ValueError: If the cursor is not a valid cursor
+    """
+    if not cursor:
+        return query
+
+    sort_value, last_id = decode_cursor(cursor)
+    after = "$gt" if sort_direction == ASCENDING else "$lt"
+
+    same_value = {sort_field: sort_value, "_id": {after: last_id}}
+    if sort_value is None:
+        # Nulls come first in ascending order, so every non-null value follows them
+        conditions = [same_value, {sort_field: {"$ne": None}}] if sort_direction == ASCENDING else [same_value]
+    else:
+        conditions = [{sort_field: {after: sort_value}}, same_value]
+        if sort_direction == DESCENDING:
+            conditions.append({sort_field: None})
+
+    keyset = {"$or": conditions}
+    return {"$and": [query, keyset]} if query else keyset
+
+
+def next_cursor(documents: Sequence[dict], sort_field: str, limit: int) -> Optional[str]:
+    """Get the cursor for the page after the given documents, None when this was the last page"""
+    if not limit or len(documents) < limit:
+        return None
+    last = documents[-1]
+    return encode_cursor(last.get(sort_field), last["_id"])
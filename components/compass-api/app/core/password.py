@@ -1,7 +1,19 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash."""
@@ -11,3 +23,88 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
     return pwd_context.hash(password)
+
+
+class PasswordHasherPool:
+    """Runs bcrypt hashing and verification in a bounded thread pool.
+
+    A bcrypt check takes 100-300 ms of CPU; run on the event loop it stalls every other
+    request of the worker. bcrypt releases the GIL, so worker threads hash in parallel
+    while the loop keeps serving requests. At most PASSWORD_HASH_MAX_PENDING calls may
+    wait for a thread; further calls are rejected with 503 instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.running = 0
+        self.waiting = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+        return self._semaphore
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """Run a hashing function in the pool
+
+        Raises:
+            HTTPException: 503 if too many calls are already waiting for a thread
+        """
+        if self.waiting >= self.max_pending:
+            logger.warning(f"Password hashing queue full with {self.waiting} waiting calls, rejecting request")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many login requests, please try again shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self.waiting += 1
+        try:
+            await self._get_semaphore().acquire()
+        finally:
+            self.waiting -= 1
+
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.running -= 1
+            self._get_semaphore().release()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the pool size, the calls being hashed and the calls waiting for a thread"""
+        return {"workers": self.workers, "running": self.running, "waiting": self.waiting}
+
+    def shutdown(self) -> None:
+        """Stop the worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher_pool = PasswordHasherPool(
+    workers=settings.PASSWORD_HASH_WORKERS, max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash without blocking the event loop."""
+    return await password_hasher_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate password hash without blocking the event loop."""
+    return await password_hasher_pool.run(get_password_hash, password)
+
+
+def get_password_pool_stats() -> Dict[str, int]:
+    """Get the queue depth of the password hashing pool"""
+    return password_hasher_pool.stats()
@@ -1,20 +1,32 @@
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 
 import httpx
 import jwt
 
+from app.core.cache import LOGINS_CACHE, get_cache
 from app.core.config import settings
-from app.core.password import verify_password
+from app.core.http_client import shared_http_client
+from app.core.password import verify_password_async
 from app.models.user import UserCreate, UserInDB
 
+# Per-process key for login cache entries, so cached keys reveal nothing about passwords
+_LOGIN_CACHE_KEY = secrets.token_bytes(32)
+
 
 async def get_user_from_db(username: str) -> Optional[UserInDB]:
     """Get user from database without circular import."""
-    from app.services.user_service import UserService
+    from app.services.user_service import get_user_service
+
+    return await get_user_service().get_user_by_username(username)
 
-    user_service = UserService()
-    return await user_service.get_user_by_username(username)
+
+def _login_cache_key(username: str, password: str) -> str:
+    """Get the login cache key of a username and password, a keyed hash of both"""
+    return hmac.new(_LOGIN_CACHE_KEY, f"{username}\0{password}".encode(), hashlib.sha256).hexdigest()
 
 
 async def verify_credentials(username: str, password: str) -> bool:
@@ -30,75 +42,85 @@ async def verify_credentials(username: str, password: str) -> bool:
     if username == "admin":
         if not user:
             return False
-        return verify_password(password, user.hashed_password)
+        return await verify_password_async(password, user.hashed_password)
 
     if not settings.AUTH_SERVER_ENABLED:
         # Development mode - verify password against local database
         if not user:
             return False
-        return verify_password(password, user.hashed_password)
+        return await verify_password_async(password, user.hashed_password)
+
+    # Successful external verifications are cached briefly when enabled; user writes invalidate the cache
+    login_cache = None
+    if settings.AUTH_LOGIN_CACHE_TTL_SECONDS > 0:
+        login_cache = get_cache(
+            LOGINS_CACHE, maxsize=settings.AUTH_LOGIN_CACHE_SIZE, ttl=settings.AUTH_LOGIN_CACHE_TTL_SECONDS
+        )
+        # A user created by an earlier login must still exist for the cached result to apply
+        if user and _login_cache_key(username, password) in login_cache:
+            return True
+
+    data = {
+        settings.AUTH_SERVER_USERNAME_FIELD: username,
+        settings.AUTH_SERVER_PASSWORD_FIELD: password,
+    }
+    headers = {
+        "Content-Type": "application/json"
+        if settings.AUTH_SERVER_CONTENT_TYPE == "json"
+        else "application/x-www-form-urlencoded"
+    }
 
     try:
-        # Create a transport that skips SSL verification
-        transport = httpx.AsyncHTTPTransport(verify=False)
-        async with httpx.AsyncClient(transport=transport) as client:
-            data = {
-                settings.AUTH_SERVER_USERNAME_FIELD: username,
-                settings.AUTH_SERVER_PASSWORD_FIELD: password,
-            }
-            headers = {
-                "Content-Type": "application/json"
-                if settings.AUTH_SERVER_CONTENT_TYPE == "json"
-                else "application/x-www-form-urlencoded"
-            }
-
-            if settings.AUTH_SERVER_CONTENT_TYPE == "form":
-                response = await client.post(settings.AUTH_SERVER_URL, data=data, headers=headers, timeout=5.0)
+        # Reuse pooled connections to the auth server instead of a new handshake per login
+        if settings.AUTH_SERVER_CONTENT_TYPE == "form":
+            response = await shared_http_client.post(settings.AUTH_SERVER_URL, data=data, headers=headers)
+        else:
+            response = await shared_http_client.post(settings.AUTH_SERVER_URL, json=data, headers=headers)
+
+        if response.status_code != 200:
+            return False
+
+        # Parse response JSON
+        try:
+            auth_data = response.json()
+            # Get full_name from configured field or fallback to username
+            full_name = auth_data.get(settings.AUTH_SERVER_FULLNAME_FIELD, username)
+            # Get email from configured field or use fallback
+            email = auth_data.get(settings.AUTH_SERVER_EMAIL_FIELD, f"{username}@external.auth")
+
+            # Create or update local user
+            from app.services.user_service import get_user_service
+
+            user_service = get_user_service()
+            if not user:
+                # Create new user
+                user_create = UserCreate(
+                    username=username,
+                    password="",  # Empty password for external auth users
+                    email=email,
+                    full_name=full_name,
+                    is_active=True,
+                    is_superuser=False,
+                )
+                await user_service.create_user(user_create)
             else:
-                response = await client.post(settings.AUTH_SERVER_URL, json=data, headers=headers, timeout=5.0)
-
-            if response.status_code != 200:
-                return False
-
-            # Parse response JSON
-            try:
-                auth_data = response.json()
-                # Get full_name from configured field or fallback to username
-                full_name = auth_data.get(settings.AUTH_SERVER_FULLNAME_FIELD, username)
-                # Get email from configured field or use fallback
-                email = auth_data.get(settings.AUTH_SERVER_EMAIL_FIELD, f"{username}@external.auth")
-
-                # Create or update local user
-                from app.services.user_service import UserService
-
-                user_service = UserService()
-                if not user:
-                    # Create new user
-                    user_create = UserCreate(
-                        username=username,
-                        password="",  # Empty password for external auth users
-                        email=email,
-                        full_name=full_name,
-                        is_active=True,
-                        is_superuser=False,
-                    )
-                    await user_service.create_user(user_create)
-                else:
-                    # If user exists but is not active, deny login
-                    if not user.is_active:
-                        return False
-
-                    # Update existing user's info if changed
-                    if user.full_name != full_name or user.email != email:
-                        await user_service.update_external_user(username=username, full_name=full_name, email=email)
-
-                return True
-            except (ValueError, KeyError):
-                # If response is not valid JSON or missing required fields
-                return False
+                # If user exists but is not active, deny login
+                if not user.is_active:
+                    return False
+
+                # Update existing user's info if changed
+                if user.full_name != full_name or user.email != email:
+                    await user_service.update_external_user(username=username, full_name=full_name, email=email)
+
+            if login_cache is not None:
+                login_cache[_login_cache_key(username, password)] = True
+            return True
+        except (ValueError, KeyError):
+            # If response is not valid JSON or missing required fields
+            return False
 
     except httpx.RequestError:
-        # If auth server is unreachable, fail closed for security
+        # If auth server is unreachable or its circuit is open, fail closed for security
         return False
 
 
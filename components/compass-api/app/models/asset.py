@@ -27,6 +27,7 @@ class AssetInDB(AssetBase, AuditModel):
     """Asset model as stored in database"""
 
     data: Optional[bytes] = Field(None, description="Binary data of the asset")
+    size: Optional[int] = Field(None, description="Size of the asset content in bytes")
 
 
 class Asset(AssetInDB):
@@ -114,3 +114,4 @@ class HistoryQuery(BaseModel):
     )
     skip: int = Field(0, description="Number of records to skip (for pagination)")
     limit: int = Field(20, description="Maximum number of records to return (for pagination)")
+    cursor: Optional[str] = Field(None, description="Cursor from a previous page to continue after, replaces skip")
@@ -1,4 +1,4 @@
-from typing import Generic, Optional, TypeVar
+from typing import Dict, Generic, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -11,9 +11,17 @@ class StandardResponse(BaseModel, Generic[T]):
     success: bool = Field(..., description="Whether the request was successful")
     data: Optional[T] = Field(None, description="Response data")
     detail: Optional[str] = Field(None, description="Error message if success is false")
-    total: Optional[int] = Field(None, description="Total number of items (for list endpoints)")
+    total: Optional[int] = Field(
+        None, description="Total number of items (for list endpoints, omitted when paginating by cursor)"
+    )
     skip: Optional[int] = Field(None, description="Number of items skipped (for list endpoints)")
     limit: Optional[int] = Field(None, description="Maximum number of items (for list endpoints)")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page (for cursor-paginated endpoints)"
+    )
+    facets: Optional[Dict[str, Dict[str, int]]] = Field(
+        None, description="Counts of matching items per field value (for search endpoints)"
+    )
 
     @classmethod
     def of(cls, data: T) -> "StandardResponse[T]":
@@ -26,6 +34,23 @@ class StandardResponse(BaseModel, Generic[T]):
         return cls(success=False, detail=message)
 
     @classmethod
-    def paginated(cls, data: T, total: int, skip: int = 0, limit: int = 20) -> "StandardResponse[T]":
+    def paginated(
+        cls,
+        data: T,
+        total: Optional[int],
+        skip: int = 0,
+        limit: Optional[int] = 20,
+        facets: Optional[Dict[str, Dict[str, int]]] = None,
+        next_cursor: Optional[str] = None,
+    ) -> "StandardResponse[T]":
         """Create a paginated response with data"""
-        return cls(success=True, data=data, total=total, skip=skip, limit=limit, detail=None)
+        return cls(
+            success=True,
+            data=data,
+            total=total,
+            skip=skip,
+            limit=limit,
+            facets=facets,
+            next_cursor=next_cursor,
+            detail=None,
+        )
@@ -178,3 +178,7 @@ class Solution(SolutionInDB):
 
     rating: float = Field(default=0.0, description="Average rating score")
     rating_count: int = Field(default=0, description="Total number of ratings")
+    rating_distribution: Dict[str, int] = Field(
+        default_factory=lambda: {str(i): 0 for i in range(1, 6)},
+        description="Count of ratings for each score (1-5)",
+    )
@@ -0,0 +1,12 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SuggestionType = Literal["solution", "category", "tag", "department", "team"]
+
+
+class Suggestion(BaseModel):
+    """Autocomplete suggestion model"""
+
+    text: str = Field(..., description="Suggested value")
+    type: SuggestionType = Field(..., description="Kind of value (solution, category, tag, department or team)")
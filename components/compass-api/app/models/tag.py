@@ -1,5 +1,5 @@
 import re
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -38,6 +38,12 @@ class TagCreate(TagBase):
     pass
 
 
+class TagBulkCreate(BaseModel):
+    """Model for creating several tags at once"""
+
+    names: List[str] = Field(..., description="Tag names, existing tags are returned unchanged", max_length=100)
+
+
 class TagUpdate(TagBase):
     """Model for updating an existing tag"""
 
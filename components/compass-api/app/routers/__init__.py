@@ -9,6 +9,7 @@ from app.routers import (
     ratings,
     site_config,
     solutions,
+    suggest,
     tags,
     tech_radar,
     users,
@@ -30,3 +31,4 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(site_config.router, prefix="/site-config", tags=["site-config"])
 api_router.include_router(history.router, prefix="/history", tags=["history"])
 api_router.include_router(assets.router, prefix="/assets", tags=["assets"])
+api_router.include_router(suggest.router, prefix="/suggest", tags=["suggest"])
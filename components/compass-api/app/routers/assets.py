@@ -1,12 +1,13 @@
 from typing import List
 
 from app.core.auth import get_current_superuser
+from app.core.http_cache import is_not_modified, parse_range
 from app.models.asset import Asset
 from app.models.response import StandardResponse
 from app.models.user import User
-from app.services.asset_service import AssetService, get_asset_service
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from fastapi.responses import Response
+from app.services.asset_service import AssetContent, AssetService, get_asset_service
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -16,6 +17,41 @@ class DeleteMultipleRequest(BaseModel):
     asset_ids: List[str]
 
 
+def _stream_asset(request: Request, content: AssetContent, asset_service: AssetService) -> Response:
+    """Stream asset content chunk by chunk, answering conditional and range requests"""
+    headers = {"Cache-Control": "public, max-age=31536000", "ETag": content.etag, "Accept-Ranges": "bytes"}
+    if is_not_modified(request, content.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    # A Range with an If-Range for another version of the asset gets the full content
+    if range_header and request.headers.get("if-range", content.etag) == content.etag:
+        try:
+            byte_range = parse_range(range_header, content.size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{content.size}"},
+            )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(content.size)
+        return StreamingResponse(
+            asset_service.iter_content(content), media_type=content.asset.mime_type, headers=headers
+        )
+
+    start, end = byte_range
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{content.size}"
+    return StreamingResponse(
+        asset_service.iter_content(content, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=content.asset.mime_type,
+        headers=headers,
+    )
+
+
 @router.get("/", response_model=StandardResponse[List[Asset]])
 async def get_assets(
     skip: int = 0, limit: int = 100, asset_service: AssetService = Depends(get_asset_service)
@@ -29,22 +65,17 @@ async def get_assets(
 
 
 @router.get("/{asset_id}")
-async def get_image(asset_id: str, asset_service: AssetService = Depends(get_asset_service)):
+async def get_image(request: Request, asset_id: str, asset_service: AssetService = Depends(get_asset_service)):
     """
     Get image content by ID.
     """
     try:
-        asset = await asset_service.get_asset_by_id(asset_id)
-        if not asset:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
-
-        content = await asset_service.get_asset_data(asset_id)
+        content = await asset_service.open_asset(asset_id=asset_id)
         if not content:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset content not found")
-
-        return Response(
-            content=content, media_type=asset.mime_type, headers={"Cache-Control": "public, max-age=31536000"}
-        )
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
+        return _stream_asset(request, content, asset_service)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error retrieving image: {str(e)}"
@@ -70,22 +101,17 @@ async def get_asset_by_name(
 
 
 @router.get("/view/{name}")
-async def get_asset_data_by_name(name: str, asset_service: AssetService = Depends(get_asset_service)):
+async def get_asset_data_by_name(request: Request, name: str, asset_service: AssetService = Depends(get_asset_service)):
     """
     Get asset binary data by name.
     """
     try:
-        asset = await asset_service.get_asset_by_name(name)
-        if not asset:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
-
-        content = await asset_service.get_asset_data(str(asset.id))
+        content = await asset_service.open_asset(name=name)
         if not content:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset content not found")
-
-        return Response(
-            content=content, media_type=asset.mime_type, headers={"Cache-Control": "public, max-age=31536000"}
-        )
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
+        return _stream_asset(request, content, asset_service)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error retrieving asset data: {str(e)}"
@@ -1,11 +1,16 @@
 from datetime import timedelta
+from typing import Dict
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
+from app.core.auth import get_current_superuser
 from app.core.config import settings
+from app.core.password import get_password_pool_stats
 from app.core.security import create_access_token, verify_credentials, get_user_from_db
+from app.models.response import StandardResponse
 from app.models.token import Token
+from app.models.user import User
 
 router = APIRouter()
 
@@ -24,7 +29,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
             detail="User account is inactive. Please contact an administrator.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
     is_valid = await verify_credentials(form_data.username, form_data.password)
 
     if not is_valid:
@@ -38,3 +43,12 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     access_token = create_access_token(data={"sub": form_data.username}, expires_delta=access_token_expires)
 
     return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.get("/password-pool", response_model=StandardResponse[Dict[str, int]])
+async def get_password_pool(current_user: User = Depends(get_current_superuser)):
+    """
+    Get the queue depth of the password hashing pool.
+    Requires superuser privileges.
+    """
+    return StandardResponse.of(get_password_pool_stats())
@@ -7,7 +7,7 @@ from app.core.auth import get_current_superuser
 from app.models.category import Category, CategoryCreate, CategoryUpdate
 from app.models.response import StandardResponse
 from app.models.user import User
-from app.services.category_service import CategoryService
+from app.services.category_service import CategoryService, get_category_service
 
 router = APIRouter()
 
@@ -16,7 +16,7 @@ router = APIRouter()
 async def create_category(
     category: CategoryCreate,
     current_user: User = Depends(get_current_superuser),
-    category_service: CategoryService = Depends(),
+    category_service: CategoryService = Depends(get_category_service),
 ) -> StandardResponse[Category]:
     """Create a new category (superuser only)."""
     try:
@@ -32,7 +32,7 @@ async def get_categories(
     skip: int = 0,
     limit: int = 100,
     sort: str = Query("radar_quadrant", description="Sort field (prefix with - for descending order)"),
-    category_service: CategoryService = Depends(),
+    category_service: CategoryService = Depends(get_category_service),
 ) -> StandardResponse[List[Category]]:
     """Get all categories with pagination and sorting. Default sorting is by radar_quadrant ascending."""
     categories = await category_service.get_categories(skip=skip, limit=limit, sort=sort)
@@ -48,7 +48,9 @@ async def get_categories(
 
 
 @router.get("/{category_id}", response_model=StandardResponse[Category])
-async def get_category(category_id: str, category_service: CategoryService = Depends()) -> StandardResponse[Category]:
+async def get_category(
+    category_id: str, category_service: CategoryService = Depends(get_category_service)
+) -> StandardResponse[Category]:
     """Get a specific category by ID."""
     category = await category_service.get_category_by_id(category_id)
     if not category:
@@ -62,7 +64,7 @@ async def update_category(
     category_id: str,
     category_update: CategoryUpdate,
     current_user: User = Depends(get_current_superuser),
-    category_service: CategoryService = Depends(),
+    category_service: CategoryService = Depends(get_category_service),
 ) -> StandardResponse[Category]:
     """Update a category by ID (superuser only)."""
     try:
@@ -79,7 +81,7 @@ async def update_category(
 async def delete_category(
     category_id: str,
     current_user: User = Depends(get_current_superuser),
-    category_service: CategoryService = Depends(),
+    category_service: CategoryService = Depends(get_category_service),
 ) -> None:
     """Delete a category by ID (superuser only). Will return 400 error if category is being used by any solutions."""
     try:
@@ -3,6 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.auth import get_current_active_user
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.models.comment import (
     Comment,
     CommentCreate,
@@ -12,13 +13,15 @@ from app.models.comment import (
 )
 from app.models.response import StandardResponse
 from app.models.user import User
-from app.services.comment_service import CommentService
-from app.services.solution_service import SolutionService
+from app.services.comment_service import CommentService, get_comment_service
+from app.services.solution_service import SolutionService, get_solution_service
 
 router = APIRouter()
 
 
-async def verify_solution_exists(solution_slug: str, solution_service: SolutionService = Depends()) -> None:
+async def verify_solution_exists(
+    solution_slug: str, solution_service: SolutionService = Depends(get_solution_service)
+) -> None:
     """Verify that a solution exists or raise 404."""
     solution = await solution_service.get_solution_by_slug(solution_slug)
     if not solution:
@@ -34,7 +37,8 @@ async def get_all_comments(
     solution_slug: Optional[str] = Query(
         None, description="Filter comments by solution slug (supports partial matching)"
     ),
-    comment_service: CommentService = Depends(),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    comment_service: CommentService = Depends(get_comment_service),
 ) -> StandardResponse[list[Comment]]:
     """
     Get all comments with pagination, sorting and optional filtering.
@@ -46,12 +50,13 @@ async def get_all_comments(
     - sort: Sort field (created_at, updated_at). Prefix with - for descending order
     - type: Filter comments by type (OFFICIAL or USER)
     - solution_slug: Filter comments by solution slug (supports partial matching)
+    - cursor: next_cursor of the previous page, replaces skip (total is omitted in this mode)
     """
     try:
-        comments, total = await comment_service.get_comments(
-            skip=skip, limit=limit, sort=sort, type=type, solution_slug=solution_slug
+        comments, total, next_cursor = await comment_service.get_comments(
+            skip=skip, limit=limit, sort=sort, type=type, solution_slug=solution_slug, cursor=cursor
         )
-        return StandardResponse.paginated(comments, total, skip, limit)
+        return StandardResponse.paginated(comments, total, skip, limit, next_cursor=next_cursor)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -69,7 +74,7 @@ async def get_solution_comments(
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items to return"),
     sort_by: str = Query("created_at", regex="^(created_at)$", description="Field to sort by"),
     type: Optional[CommentType] = Query(None, description="Filter comments by type (OFFICIAL or USER)"),
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
     _: None = Depends(verify_solution_exists),
 ) -> StandardResponse[list[Comment]]:
     """
@@ -100,7 +105,7 @@ async def create_comment(
     solution_slug: str,
     comment: CommentCreate,
     current_user: User = Depends(get_current_active_user),
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
     _: None = Depends(verify_solution_exists),
 ) -> StandardResponse[CommentInDB]:
     """Create a new comment on a solution."""
@@ -118,7 +123,7 @@ async def update_comment(
     comment_id: str,
     comment_update: CommentUpdate,
     current_user: User = Depends(get_current_active_user),
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
 ) -> StandardResponse[CommentInDB]:
     """
     Update a comment.
@@ -153,7 +158,7 @@ async def update_comment(
 async def delete_comment(
     comment_id: str,
     current_user: User = Depends(get_current_active_user),
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
 ) -> None:
     """
     Delete a comment.
@@ -179,7 +184,7 @@ async def get_my_comments(
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items to return"),
     sort: str = Query("-created_at", description="Sort field (prefix with - for descending order)"),
     current_user: User = Depends(get_current_active_user),
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
 ) -> StandardResponse[list[Comment]]:
     """
     Get all comments created by the current user with pagination and sorting.
@@ -7,7 +7,7 @@ from app.core.auth import get_current_superuser
 from app.models.group import Group, GroupCreate, GroupUpdate
 from app.models.response import StandardResponse
 from app.models.user import User
-from app.services.group_service import GroupService
+from app.services.group_service import GroupService, get_group_service
 
 router = APIRouter()
 
@@ -16,7 +16,7 @@ router = APIRouter()
 async def create_group(
     group: GroupCreate,
     current_user: User = Depends(get_current_superuser),
-    group_service: GroupService = Depends(),
+    group_service: GroupService = Depends(get_group_service),
 ) -> StandardResponse[Group]:
     """Create a new group (superuser only)."""
     try:
@@ -31,7 +31,7 @@ async def get_groups(
     skip: int = 0,
     limit: int = 100,
     sort: str = Query("order", description="Sort field (prefix with - for descending order, e.g., name, order, created_at)"),
-    group_service: GroupService = Depends(),
+    group_service: GroupService = Depends(get_group_service),
 ) -> StandardResponse[List[Group]]:
     """Get all groups with pagination and sorting. Default sorting is by order ascending."""
     groups = await group_service.get_groups(skip=skip, limit=limit, sort=sort)
@@ -40,7 +40,7 @@ async def get_groups(
 
 
 @router.get("/{group_id}", response_model=StandardResponse[Group])
-async def get_group(group_id: str, group_service: GroupService = Depends()) -> StandardResponse[Group]:
+async def get_group(group_id: str, group_service: GroupService = Depends(get_group_service)) -> StandardResponse[Group]:
     """Get a specific group by ID."""
     group = await group_service.get_group_by_id(group_id)
     if not group:
@@ -53,7 +53,7 @@ async def update_group(
     group_id: str,
     group_update: GroupUpdate,
     current_user: User = Depends(get_current_superuser),
-    group_service: GroupService = Depends(),
+    group_service: GroupService = Depends(get_group_service),
 ) -> StandardResponse[Group]:
     """Update a group by ID (superuser only)."""
     try:
@@ -69,7 +69,7 @@ async def update_group(
 async def delete_group(
     group_id: str,
     current_user: User = Depends(get_current_superuser),
-    group_service: GroupService = Depends(),
+    group_service: GroupService = Depends(get_group_service),
 ) -> None:
     """Delete a group by ID (superuser only)."""
     try:
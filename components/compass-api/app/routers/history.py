@@ -2,9 +2,10 @@ import logging
 from datetime import datetime
 from typing import Any, List, Optional
 
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.models.history import ChangeType, HistoryQuery, HistoryRecord
 from app.models.response import StandardResponse
-from app.services.history_service import HistoryService
+from app.services.history_service import HistoryService, get_history_service
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 logger = logging.getLogger(__name__)
@@ -25,13 +26,15 @@ async def get_history(
     fields: Optional[str] = Query(None, description="Filter by fields (comma-separated list of field names)"),
     skip: int = Query(0, description="Number of records to skip (for pagination)"),
     limit: int = Query(20, description="Maximum number of records to return (for pagination)"),
-    history_service: HistoryService = Depends(),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    history_service: HistoryService = Depends(get_history_service),
 ) -> Any:
     """
     Get history records based on query parameters.
 
     Returns a list of history records matching the specified filters,
     sorted by change date in descending order (newest first).
+    Pass next_cursor as cursor to page through large histories without skipping.
     """
     # Process fields if provided
     field_list = None
@@ -49,11 +52,14 @@ async def get_history(
         fields=field_list,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
 
     try:
-        history_records, total = await history_service.get_history_records(query)
-        return StandardResponse.paginated(history_records, total, skip, limit)
+        history_records, total, next_cursor = await history_service.get_history_records(query)
+        return StandardResponse.paginated(history_records, total, skip, limit, next_cursor=next_cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting history records: {str(e)}")
         raise HTTPException(
@@ -2,11 +2,12 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.core.auth import get_current_active_user
+from app.core.auth import get_current_active_user, get_current_superuser
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.models.rating import Rating, RatingCreate
 from app.models.response import StandardResponse
 from app.models.user import User
-from app.services.rating_service import RatingService
+from app.services.rating_service import RatingService, get_rating_service
 
 router = APIRouter()
 
@@ -30,7 +31,7 @@ async def get_solution_ratings(
     - **page_size**: Number of ratings per page
     - **sort_by**: Field to sort by (created_at or score)
     """
-    rating_service = RatingService()
+    rating_service = get_rating_service()
     skip = (page - 1) * page_size
     ratings, total = await rating_service.get_solution_ratings(
         solution_slug=solution_slug, skip=skip, limit=page_size, sort_by=sort_by
@@ -49,7 +50,7 @@ async def get_user_rating(solution_slug: str, current_user: User = Depends(get_c
 
     - **solution_slug**: Unique identifier of the solution
     """
-    rating_service = RatingService()
+    rating_service = get_rating_service()
     rating = await rating_service.get_user_rating(solution_slug, current_user.username)
     if not rating:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Rating not found")
@@ -73,7 +74,7 @@ async def create_or_update_rating(
     - **solution_slug**: Unique identifier of the solution
     - **rating**: Rating details including score and optional comment
     """
-    rating_service = RatingService()
+    rating_service = get_rating_service()
     try:
         updated_rating = await rating_service.create_or_update_rating(
             solution_slug=solution_slug, rating=rating, username=current_user.username
@@ -104,7 +105,7 @@ async def get_solution_rating_summary(
     - count: Total number of ratings
     - distribution: Count of ratings for each score (1-5)
     """
-    rating_service = RatingService()
+    rating_service = get_rating_service()
     summary = await rating_service.get_rating_summary(solution_slug)
     return StandardResponse.of(summary)
 
@@ -118,7 +119,8 @@ async def get_all_ratings(
         None, description="Filter ratings by solution slug (supports partial matching)"
     ),
     score: Optional[int] = Query(None, ge=1, le=5, description="Filter ratings by exact score (1-5)"),
-    rating_service: RatingService = Depends(),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    rating_service: RatingService = Depends(get_rating_service),
 ):
     """
     Get all ratings with pagination and sorting.
@@ -129,17 +131,21 @@ async def get_all_ratings(
     - **sort**: Field to sort by (created_at, updated_at, score). Prefix with - for descending order
     - **solution_slug**: Filter ratings by solution slug (supports partial matching)
     - **score**: Filter ratings by exact score (1-5)
+    - **cursor**: next_cursor of the previous page, replaces page (total is omitted in this mode)
     """
     try:
         skip = (page - 1) * page_size
-        ratings, total = await rating_service.get_ratings(
+        ratings, total, next_cursor = await rating_service.get_ratings(
             skip=skip,
             limit=page_size,
             sort=sort,
             solution_slug=solution_slug,
             score=score,
+            cursor=cursor,
+        )
+        return StandardResponse.paginated(
+            data=ratings, total=total, skip=skip, limit=page_size, next_cursor=next_cursor
         )
-        return StandardResponse.paginated(data=ratings, total=total, skip=skip, limit=page_size)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -152,7 +158,7 @@ async def get_my_ratings(
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items to return"),
     sort: str = Query("-created_at", description="Sort field (prefix with - for descending order)"),
     current_user: User = Depends(get_current_active_user),
-    rating_service: RatingService = Depends(),
+    rating_service: RatingService = Depends(get_rating_service),
 ) -> StandardResponse[list[Rating]]:
     """
     Get all ratings created by the current user with pagination and sorting.
@@ -179,7 +185,7 @@ async def update_rating(
     rating_id: str,
     rating_update: RatingCreate,
     current_user: User = Depends(get_current_active_user),
-    rating_service: RatingService = Depends(),
+    rating_service: RatingService = Depends(get_rating_service),
 ) -> StandardResponse[Rating]:
     """
     Update a rating by ID.
@@ -216,7 +222,7 @@ async def update_rating(
 async def delete_rating(
     rating_id: str,
     current_user: User = Depends(get_current_active_user),
-    rating_service: RatingService = Depends(),
+    rating_service: RatingService = Depends(get_rating_service),
 ) -> StandardResponse[bool]:
     """
     Delete a rating by ID.
@@ -239,3 +245,31 @@ async def delete_rating(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error deleting rating: {str(e)}",
         )
+
+
+@router.post("/rebuild-aggregates", response_model=StandardResponse[dict], tags=["ratings"])
+async def rebuild_rating_aggregates(
+    verify_only: bool = Query(False, description="Only report out-of-date solutions without updating them"),
+    current_user: User = Depends(get_current_superuser),
+    rating_service: RatingService = Depends(get_rating_service),
+) -> StandardResponse[dict]:
+    """
+    Recompute the rating fields stored on solution documents (superuser only).
+
+    Query Parameters:
+    - verify_only: If true, only report solutions whose stored rating fields are out of date
+
+    Returns:
+    - checked: Number of solutions checked
+    - mismatched: Number of solutions whose stored rating fields were out of date
+    - updated: Number of solutions updated
+    - mismatched_slugs: Slugs of the out-of-date solutions
+    """
+    try:
+        result = await rating_service.rebuild_rating_aggregates(verify_only=verify_only)
+        return StandardResponse.of(result)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error rebuilding rating aggregates: {str(e)}",
+        )
@@ -6,7 +6,7 @@ from app.core.auth import get_current_active_user, get_current_superuser
 from app.models.response import StandardResponse
 from app.models.site_config import SiteConfigCreate, SiteConfigInDB, SiteConfigUpdate
 from app.models.user import User
-from app.services.site_config_service import SiteConfigService
+from app.services.site_config_service import get_site_config_service
 
 router = APIRouter()
 
@@ -21,7 +21,7 @@ async def get_all_site_configs(
     Get all site configurations with pagination.
     Requires authentication.
     """
-    config_service = SiteConfigService()
+    config_service = get_site_config_service()
     configs = await config_service.get_all_site_configs(skip=skip, limit=limit)
     total = await config_service.count_site_configs()
 
@@ -39,7 +39,7 @@ async def get_site_configs_by_key(
     Get site configurations by key.
     This endpoint is public and does not require authentication.
     """
-    config_service = SiteConfigService()
+    config_service = get_site_config_service()
     configs = await config_service.get_site_configs_by_key(key=key, active=active, skip=skip, limit=limit)
     total = await config_service.count_site_configs_by_key(key=key, active=active)
 
@@ -54,7 +54,7 @@ async def create_site_config(config: SiteConfigCreate, current_user: User = Depe
     Create a new site configuration.
     Requires authentication. The key is specified in the request body.
     """
-    config_service = SiteConfigService()
+    config_service = get_site_config_service()
     try:
         new_config = await config_service.create_site_config(config=config, username=current_user.username)
         return StandardResponse.of(new_config)
@@ -77,7 +77,7 @@ async def update_site_config(
     Update a site configuration.
     Requires authentication. Only updates the fields that are provided.
     """
-    config_service = SiteConfigService()
+    config_service = get_site_config_service()
     updated_config = await config_service.update_site_config(
         config_id=id, config_update=config_update, username=current_user.username
     )
@@ -96,7 +96,7 @@ async def delete_site_config(
     Delete a site configuration.
     Requires superuser authentication.
     """
-    config_service = SiteConfigService()
+    config_service = get_site_config_service()
     deleted = await config_service.delete_site_config(config_id=id)
 
     if not deleted:
@@ -111,7 +111,7 @@ async def reset_site_configs(current_user: User = Depends(get_current_superuser)
     Reset all site configurations.
     Requires superuser authentication. This will delete all existing configurations and create new ones with defaults.
     """
-    config_service = SiteConfigService()
+    config_service = get_site_config_service()
     try:
         await config_service.reset_site_configs(username=current_user.username)
         return StandardResponse.of({"message": "Site configurations reset successfully"})
@@ -1,16 +1,19 @@
+import asyncio
 import logging
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Literal, Optional, Tuple
 
 from app.core.auth import get_current_active_user, get_current_superuser
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.models.history import HistoryRecord
 from app.models.response import StandardResponse
 from app.models.solution import Solution, SolutionCreate, SolutionInDB, SolutionUpdate
 from app.models.user import User
-from app.services.comment_service import CommentService
-from app.services.history_service import HistoryService
-from app.services.rating_service import RatingService
-from app.services.solution_service import SolutionService
-from app.services.user_service import UserService
+from app.services.comment_service import CommentService, get_comment_service
+from app.services.history_service import HistoryService, get_history_service
+from app.services.rating_service import RatingService, get_rating_service
+from app.services.search_index import SolutionSearchIndex, get_search_index
+from app.services.solution_service import SolutionService, get_solution_service
+from app.services.user_service import UserService, get_user_service
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from fastapi.responses import Response
 
@@ -27,7 +30,7 @@ router = APIRouter()
 async def create_solution(
     solution: SolutionCreate,
     current_user: User = Depends(get_current_active_user),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Create a new solution."""
     try:
@@ -56,7 +59,8 @@ async def get_solutions(
     review_status: Optional[str] = Query(None, description="Filter by review status (PENDING/APPROVED/REJECTED)"),
     tags: Optional[str] = Query(None, description="Filter by tags (comma-separated list of tag names)"),
     sort: str = Query("name", description="Sort field (prefix with - for descending order)"),
-    solution_service: SolutionService = Depends(),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Get all solutions with pagination, filtering and sorting.
 
@@ -70,6 +74,7 @@ async def get_solutions(
     - review_status: Filter by review status (PENDING/APPROVED/REJECTED)
     - tags: Filter by tags (comma-separated list of tag names)
     - sort: Sort field (name, category, created_at, updated_at). Prefix with - for descending order
+    - cursor: next_cursor of the previous page, replaces skip (total is omitted in this mode)
     """
     try:
         # If exact name is provided, try to get that specific solution
@@ -113,7 +118,7 @@ async def get_solutions(
         if tags:
             tag_list = [tag.strip() for tag in tags.split(",")]
 
-        solutions = await solution_service.get_solutions_with_ratings(
+        solutions, total, next_cursor = await solution_service.get_solutions_with_ratings(
             skip=skip,
             limit=limit,
             category=category,
@@ -124,9 +129,9 @@ async def get_solutions(
             review_status=review_status,
             tags=tag_list,
             sort=sort,
+            cursor=cursor,
         )
-        total = await solution_service.count_solutions()
-        return StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit)
+        return StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit, next_cursor=next_cursor)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -135,7 +140,7 @@ async def get_solutions(
 
 
 @router.get("/departments", response_model=StandardResponse[List[str]], tags=["solutions"])
-async def get_departments(solution_service: SolutionService = Depends()):
+async def get_departments(solution_service: SolutionService = Depends(get_solution_service)):
     """
     Get all unique department names from solutions.
 
@@ -154,15 +159,30 @@ async def get_departments(solution_service: SolutionService = Depends()):
 @router.get("/search/", response_model=StandardResponse[List[Solution]])
 async def search_solutions(
     keyword: str = Query(..., description="Search keyword to match against solution fields"),
-    solution_service: SolutionService = Depends(),
+    skip: int = Query(0, ge=0, description="Number of matches to skip"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of matches to return, all if omitted"),
+    mode: Literal["text", "index"] = Query(
+        "text", description="text: MongoDB text search with facets; index: in-memory prefix and typo-tolerant search"
+    ),
+    solution_service: SolutionService = Depends(get_solution_service),
+    search_index: SolutionSearchIndex = Depends(get_search_index),
 ) -> Any:
     """Search solutions by keyword using text similarity.
     Searches across name, category, description, team, maintainer name, pros and cons.
-    Returns all matches sorted by relevance score.
+
+    In text mode, returns matches sorted by recommend status, rating and relevance score, with facet
+    counts for category, department, tags and recommend_status across all matches.
+
+    In index mode, keywords also match word prefixes and misspellings and results are ranked by
+    relevance only. Falls back to text mode when the in-memory search index is not enabled.
     """
     try:
-        solutions = await solution_service.search_solutions(keyword)
-        return StandardResponse.of(solutions)
+        if mode == "index" and search_index.ready:
+            solutions, total = search_index.search(keyword, skip=skip, limit=limit)
+            return StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit)
+
+        solutions, total, facets = await solution_service.search_solutions(keyword, skip=skip, limit=limit)
+        return StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit, facets=facets)
     except Exception as e:
         logger.error(f"Error searching solutions: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error searching solutions: {str(e)}")
@@ -177,7 +197,7 @@ async def get_my_solutions(
         description="Sort field (name, category, created_at, updated_at). Prefix with - for descending order",
     ),
     current_user: User = Depends(get_current_active_user),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Get all solutions created by or maintained by the current user with pagination and sorting.
 
@@ -198,7 +218,7 @@ async def get_my_solutions(
 
 
 @router.get("/{slug}", response_model=StandardResponse[Solution])
-async def get_solution(slug: str, solution_service: SolutionService = Depends()) -> Any:
+async def get_solution(slug: str, solution_service: SolutionService = Depends(get_solution_service)) -> Any:
     """Get a specific solution by slug."""
     solution = await solution_service.get_solution_by_slug_with_rating(slug)
     if not solution:
@@ -211,7 +231,7 @@ async def update_solution(
     slug: str,
     solution_update: SolutionUpdate,
     current_user: User = Depends(get_current_active_user),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Update a solution by slug.
 
@@ -260,7 +280,7 @@ async def update_solution(
 async def delete_solution(
     slug: str,
     current_user: User = Depends(get_current_active_user),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> None:
     """Delete a solution by slug.
 
@@ -289,7 +309,7 @@ async def delete_solution(
 
 
 @router.get("/check-name/{name}", response_model=StandardResponse[Tuple[bool, int]])
-async def check_solution_name(name: str, solution_service: SolutionService = Depends()) -> Any:
+async def check_solution_name(name: str, solution_service: SolutionService = Depends(get_solution_service)) -> Any:
     """Check if a solution name exists and get count of similar names.
 
     Returns:
@@ -308,7 +328,7 @@ async def check_solution_name(name: str, solution_service: SolutionService = Dep
 async def delete_solutions_by_name(
     name: str,
     current_user: User = Depends(get_current_superuser),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Delete all solutions with the exact name (case-sensitive).
 
@@ -327,7 +347,7 @@ async def update_solutions_by_name(
     name: str,
     solution_update: SolutionUpdate,
     current_user: User = Depends(get_current_superuser),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Update all solutions with the exact name (case-sensitive).
 
@@ -356,10 +376,10 @@ async def update_solutions_by_name(
 @router.get("/{slug}/adopted-users", response_model=StandardResponse[List[User]])
 async def get_solution_adopted_users(
     slug: str,
-    solution_service: SolutionService = Depends(),
-    comment_service: CommentService = Depends(),
-    rating_service: RatingService = Depends(),
-    user_service: UserService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
+    comment_service: CommentService = Depends(get_comment_service),
+    rating_service: RatingService = Depends(get_rating_service),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Get all adopted users for a solution.
 
@@ -382,8 +402,10 @@ async def get_solution_adopted_users(
             )
 
         # Get adopted usernames from both comments and ratings
-        comment_usernames = await comment_service.get_solution_adopted_usernames(slug)
-        rating_usernames = await rating_service.get_solution_adopted_usernames(slug)
+        comment_usernames, rating_usernames = await asyncio.gather(
+            comment_service.get_solution_adopted_usernames(slug),
+            rating_service.get_solution_adopted_usernames(slug),
+        )
 
         # Combine unique usernames
         all_usernames = comment_usernames.union(rating_usernames)
@@ -409,8 +431,8 @@ async def get_solution_history(
     skip: int = 0,
     limit: int = 20,
     fields: Optional[str] = Query(None, description="Filter by fields (comma-separated list of field names)"),
-    solution_service: SolutionService = Depends(),
-    history_service: HistoryService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
+    history_service: HistoryService = Depends(get_history_service),
 ) -> Any:
     """
     Get change history for a specific solution.
@@ -443,7 +465,7 @@ async def get_solution_history(
 @router.get("/by-name/{name}", response_model=StandardResponse[Solution])
 async def get_solution_by_name(
     name: str,
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Get a solution by its exact name."""
     try:
@@ -462,8 +484,8 @@ async def update_history_justification(
     history_id: str,
     field_name: str = Body(..., embed=True),
     justification: str = Body(..., embed=True),
-    history_service: HistoryService = Depends(),
-    solution_service: SolutionService = Depends(),
+    history_service: HistoryService = Depends(get_history_service),
+    solution_service: SolutionService = Depends(get_solution_service),
 ):
     """
     Update justification for a specific field in a history record.
@@ -0,0 +1,31 @@
+import logging
+from typing import Any, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.models.response import StandardResponse
+from app.models.suggest import Suggestion
+from app.services.suggest_service import SuggestService, get_suggest_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("", response_model=StandardResponse[List[Suggestion]])
+async def suggest(
+    q: str = Query(..., min_length=1, description="Typed text to complete"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+    suggest_service: SuggestService = Depends(get_suggest_service),
+) -> Any:
+    """Get autocomplete suggestions across solution names, categories, tags, departments and teams.
+
+    Any word of a value can match, e.g. "kube" suggests "Azure Kubernetes Service".
+    Values starting with the typed text rank first.
+    """
+    try:
+        suggestions = await suggest_service.suggest(q, limit=limit)
+        return StandardResponse.of(suggestions)
+    except Exception as e:
+        logger.error(f"Error getting suggestions: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting suggestions: {str(e)}")
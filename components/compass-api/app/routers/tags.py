@@ -6,10 +6,10 @@ from fastapi.responses import Response
 from app.core.auth import get_current_active_user, get_current_superuser
 from app.models.response import StandardResponse
 from app.models.solution import SolutionUpdate
-from app.models.tag import Tag, TagCreate, TagUpdate, format_tag_name
+from app.models.tag import Tag, TagBulkCreate, TagCreate, TagUpdate, format_tag_name
 from app.models.user import User
-from app.services.solution_service import SolutionService
-from app.services.tag_service import TagService
+from app.services.solution_service import SolutionService, get_solution_service
+from app.services.tag_service import TagService, get_tag_service
 
 router = APIRouter()
 
@@ -18,7 +18,7 @@ router = APIRouter()
 async def create_tag(
     tag: TagCreate,
     current_user: User = Depends(get_current_superuser),
-    tag_service: TagService = Depends(),
+    tag_service: TagService = Depends(get_tag_service),
 ) -> Any:
     """Create a new tag (superuser only)."""
     try:
@@ -30,12 +30,28 @@ async def create_tag(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk", response_model=StandardResponse[List[Tag]])
+async def create_tags_bulk(
+    tags: TagBulkCreate,
+    current_user: User = Depends(get_current_superuser),
+    tag_service: TagService = Depends(get_tag_service),
+) -> Any:
+    """Get or create several tags at once (superuser only)."""
+    try:
+        result = await tag_service.ensure_tags(tags.names, current_user.username)
+        usage_counts = await tag_service.get_tag_usage_counts([tag.name for tag in result])
+        tags_with_usage = [Tag(**tag.model_dump(), usage_count=usage_counts.get(tag.name, 0)) for tag in result]
+        return StandardResponse.of(tags_with_usage)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/", response_model=StandardResponse[List[Tag]])
 async def get_tags(
     skip: int = 0,
     limit: int = 100,  # Default to 100 items
     show_all: bool = False,  # Default to only show tags with usage_count > 0
-    tag_service: TagService = Depends(),
+    tag_service: TagService = Depends(get_tag_service),
 ) -> Any:
     """Get all tags with pagination.
 
@@ -50,7 +66,7 @@ async def get_tags(
 
 
 @router.get("/{tag_id}", response_model=StandardResponse[Tag])
-async def get_tag(tag_id: str, tag_service: TagService = Depends()) -> Any:
+async def get_tag(tag_id: str, tag_service: TagService = Depends(get_tag_service)) -> Any:
     """Get a specific tag by ID."""
     tag = await tag_service.get_tag_by_id(tag_id)
     if not tag:
@@ -64,7 +80,7 @@ async def update_tag(
     tag_id: str,
     tag_update: TagUpdate,
     current_user: User = Depends(get_current_superuser),
-    tag_service: TagService = Depends(),
+    tag_service: TagService = Depends(get_tag_service),
 ) -> Any:
     """Update a tag by ID (superuser only).
     If tag name is changed to an existing tag name, the tags will be merged."""
@@ -88,7 +104,7 @@ async def update_tag(
 async def delete_tag(
     tag_id: str,
     current_user: User = Depends(get_current_superuser),
-    tag_service: TagService = Depends(),
+    tag_service: TagService = Depends(get_tag_service),
 ) -> None:
     """Delete a tag by ID (superuser only). Will also remove the tag from all solutions using it."""
     try:
@@ -100,7 +116,7 @@ async def delete_tag(
 
 
 @router.get("/solution/{solution_slug}", response_model=StandardResponse[List[Tag]])
-async def get_solution_tags(solution_slug: str, tag_service: TagService = Depends()) -> Any:
+async def get_solution_tags(solution_slug: str, tag_service: TagService = Depends(get_tag_service)) -> Any:
     """Get all tags for a specific solution."""
     tags = await tag_service.get_solution_tags(solution_slug)
     return StandardResponse.of(tags)
@@ -115,7 +131,7 @@ async def add_solution_tag(
     solution_slug: str,
     tag_name: str,
     current_user: User = Depends(get_current_active_user),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Add a tag to a solution. Creates the tag if it doesn't exist."""
     try:
@@ -172,7 +188,7 @@ async def delete_solution_tag(
     solution_slug: str,
     tag_name: str,
     current_user: User = Depends(get_current_active_user),
-    solution_service: SolutionService = Depends(),
+    solution_service: SolutionService = Depends(get_solution_service),
 ) -> Any:
     """Remove a tag from a solution."""
     try:
@@ -1,17 +1,20 @@
 from typing import Dict, List
 
+from app.core.http_cache import format_http_date, is_not_modified
 from app.models.tech_radar import TechRadarData
-from app.services.tech_radar_service import TechRadarService
-from fastapi import APIRouter, Depends
+from app.services.tech_radar_service import TechRadarService, get_tech_radar_service
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import Response
 
 router = APIRouter()
 
 
 @router.get("/data", response_model=TechRadarData)
 async def get_tech_radar_data(
+    request: Request,
     group: str = None,
-    tech_radar_service: TechRadarService = Depends(),
-) -> TechRadarData:
+    tech_radar_service: TechRadarService = Depends(get_tech_radar_service),
+) -> Response:
     """Get tech radar data in Zalando Tech Radar format.
 
     Args:
@@ -23,13 +26,24 @@ async def get_tech_radar_data(
     - label (solution name)
     - active (always true for approved solutions)
     - moved (always 0)
+
+    The payload is cached and served with ETag/Last-Modified headers;
+    conditional requests get 304 Not Modified while nothing has changed.
     """
-    return await tech_radar_service.get_tech_radar_data(group=group)
+    snapshot = await tech_radar_service.get_tech_radar_snapshot(group=group)
+    headers = {
+        "ETag": snapshot.etag,
+        "Last-Modified": format_http_date(snapshot.last_modified),
+        "Cache-Control": "no-cache",
+    }
+    if is_not_modified(request, snapshot.etag, snapshot.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @router.get("/quadrants", response_model=List[Dict[str, str]])
 async def get_radar_quadrants(
-    tech_radar_service: TechRadarService = Depends(),
+    tech_radar_service: TechRadarService = Depends(get_tech_radar_service),
 ) -> List[Dict[str, str]]:
     """Get radar quadrants ordered by their radar_quadrant value.
 
@@ -42,7 +56,7 @@ async def get_radar_quadrants(
 
 @router.get("/rings", response_model=List[Dict[str, str]])
 def get_radar_rings(
-    tech_radar_service: TechRadarService = Depends(),
+    tech_radar_service: TechRadarService = Depends(get_tech_radar_service),
 ) -> List[Dict[str, str]]:
     """Get radar rings in order.
 
@@ -1,10 +1,12 @@
 from typing import Any, List, Optional
 
-from cachetools import TTLCache
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 
 from app.core.auth import get_current_active_user, get_current_superuser
+from app.core.config import settings
+from app.core.http_cache import is_not_modified
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.models.response import StandardResponse
 from app.models.user import (
     AdminUserUpdate,
@@ -13,19 +15,16 @@ from app.models.user import (
     UserPasswordUpdate,
     UserUpdate,
 )
-from app.services.user_service import UserService
+from app.services.user_service import UserService, get_user_service
 
 router = APIRouter()
 
-# Create a cache with 1-day TTL (86400 seconds)
-avatar_cache = TTLCache(maxsize=1000, ttl=86400)
-
 
 @router.post("/", response_model=StandardResponse[User], status_code=status.HTTP_201_CREATED)
 async def create_user(
     user: UserCreate,
     current_user: User = Depends(get_current_superuser),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Create a new user (admin only)."""
     try:
@@ -42,7 +41,8 @@ async def get_users(
     username: Optional[str] = Query(None, description="Filter by username (case-insensitive partial match)"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     is_superuser: Optional[bool] = Query(None, description="Filter by superuser status"),
-    user_service: UserService = Depends(),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Get all users with pagination and filtering.
 
@@ -52,16 +52,23 @@ async def get_users(
     - username: Filter by username (case-insensitive partial match)
     - is_active: Filter by active status (true/false)
     - is_superuser: Filter by superuser status (true/false)
+    - cursor: next_cursor of the previous page, replaces skip (total is omitted in this mode)
     """
-    users = await user_service.get_users(
-        skip=skip,
-        limit=limit,
-        username=username,
-        is_active=is_active,
-        is_superuser=is_superuser,
-    )
-    total = await user_service.count_users(username=username, is_active=is_active, is_superuser=is_superuser)
-    return StandardResponse.paginated(data=users, total=total, skip=skip, limit=limit)
+    try:
+        users, next_cursor = await user_service.get_users(
+            skip=skip,
+            limit=limit,
+            username=username,
+            is_active=is_active,
+            is_superuser=is_superuser,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    total = None
+    if not cursor:
+        total = await user_service.count_users(username=username, is_active=is_active, is_superuser=is_superuser)
+    return StandardResponse.paginated(data=users, total=total, skip=skip, limit=limit, next_cursor=next_cursor)
 
 
 @router.get("/me", response_model=StandardResponse[User])
@@ -74,7 +81,7 @@ async def read_user_me(current_user: User = Depends(get_current_active_user)) ->
 async def get_user(
     username: str,
     current_user: User = Depends(get_current_active_user),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Get a specific user by username."""
     user = await user_service.get_user_for_api(username)
@@ -88,7 +95,7 @@ async def update_user_password(
     username: str,
     password_update: UserPasswordUpdate,
     current_user: User = Depends(get_current_active_user),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Update a user's password."""
     try:
@@ -109,7 +116,7 @@ async def update_user(
     username: str,
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Update a user by username. Users can only update their own information."""
     try:
@@ -129,7 +136,7 @@ async def update_user(
 async def delete_user(
     username: str,
     current_user: User = Depends(get_current_superuser),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Delete a user by username (superuser only)."""
     try:
@@ -148,7 +155,7 @@ async def admin_update_user(
     username: str,
     user_update: AdminUserUpdate,
     current_user: User = Depends(get_current_superuser),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Update any user's information (admin only).
 
@@ -175,7 +182,7 @@ async def admin_update_user(
 async def admin_delete_user(
     username: str,
     current_user: User = Depends(get_current_superuser),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Delete any user (admin only)."""
     try:
@@ -192,12 +199,16 @@ async def admin_delete_user(
 @router.get("/{username}/avatar", response_class=Response)
 async def get_user_avatar(
     username: str,
-    user_service: UserService = Depends(),
+    request: Request,
+    user_service: UserService = Depends(get_user_service),
 ) -> Any:
     """Get an avatar for a user.
     If AVATAR_SERVER_ENABLED is true and URL is configured, fetches from the configured avatar server.
     Otherwise, returns a generated SVG avatar.
-    Response is cached for 1 day."""
+    Responses carry an ETag; a request with a matching If-None-Match gets 304 Not Modified."""
 
-    content, media_type = await user_service.get_user_avatar(username)
-    return Response(content=content, media_type=media_type)
+    avatar = await user_service.get_user_avatar(username)
+    headers = {"ETag": avatar.etag, "Cache-Control": f"public, max-age={settings.AVATAR_HTTP_MAX_AGE_SECONDS}"}
+    if is_not_modified(request, avatar.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=avatar.content, media_type=avatar.media_type, headers=headers)
@@ -1,14 +1,21 @@
+import hashlib
 import re
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, NamedTuple, Optional
 
 from bson import ObjectId
-from fastapi import Depends, HTTPException, UploadFile
-from pymongo import ASCENDING, DESCENDING
+from fastapi import HTTPException, UploadFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket, AsyncIOMotorGridOut
 
 from ..core.mongodb import get_database
 from ..models.asset import Asset, AssetInDB
 
+# GridFS bucket holding asset content, stored in the asset_files.files and asset_files.chunks collections
+ASSET_BUCKET = "asset_files"
+# Size of the GridFS chunks and of the reads while streaming an upload
+ASSET_CHUNK_SIZE = 255 * 1024
+
 
 def format_name(name: str) -> str:
     """Format asset name to be URL-friendly
@@ -27,15 +34,27 @@ def format_name(name: str) -> str:
     return f"{formatted_name}.{ext}" if ext else formatted_name
 
 
+def content_etag(digest: str) -> str:
+    """Format a sha256 hex digest of asset content as an ETag"""
+    return f'"{digest[:32]}"'
+
+
+class AssetContent(NamedTuple):
+    """Asset metadata with what is needed to stream its content"""
+
+    asset: Asset
+    size: int
+    etag: str
+    file_document: Optional[dict]  # GridFS file document, None for inline assets
+    data: Optional[bytes]  # Inline content of assets stored before GridFS
+
+
 class AssetService:
-    def __init__(self, db=Depends(get_database)):
-        self.db = db
+    def __init__(self):
+        self.db = get_database()
         self.collection = self.db.assets
-
-    async def create_indexes(self):
-        """Create indexes for the assets collection"""
-        await self.collection.create_index([("name", ASCENDING)])
-        await self.collection.create_index([("created_at", DESCENDING)])
+        # Asset content lives in GridFS; older assets keep it inline in the data field
+        self.bucket = AsyncIOMotorGridFSBucket(self.db, bucket_name=ASSET_BUCKET, chunk_size_bytes=ASSET_CHUNK_SIZE)
 
     async def save_file(self, file: UploadFile, username: Optional[str] = None) -> AssetInDB:
         """Save a file and create asset record"""
@@ -43,15 +62,17 @@ class AssetService:
             # Format name first
             formatted_name = format_name(file.filename)
 
-
-            # Read file content
-            contents = await file.read()
+            # Stream the upload into GridFS chunk by chunk instead of reading it into memory
+            file_id, size, digest = await self._upload_content(file, formatted_name)
 
             # Prepare asset data with formatted name
             asset_data = {
                 "name": formatted_name,
                 "mime_type": file.content_type,
-                "data": contents,
+                "file_id": file_id,
+                "size": size,
+                "chunk_size": ASSET_CHUNK_SIZE,
+                "etag": content_etag(digest),
                 "created_at": datetime.utcnow(),
                 "created_by": username,
             }
@@ -69,6 +90,7 @@ class AssetService:
                 return asset
 
             except Exception as db_error:
+                await self._delete_content([file_id])
                 raise HTTPException(status_code=500, detail=f"Error saving to database: {str(db_error)}")
 
         except HTTPException:
@@ -76,6 +98,33 @@ class AssetService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Unexpected error saving file {file.filename}: {str(e)}")
 
+    async def _upload_content(self, file: UploadFile, filename: str) -> tuple[ObjectId, int, str]:
+        """Stream an uploaded file into GridFS, hashing it on the way for its ETag
+
+        Returns:
+            Tuple of (GridFS file id, size in bytes, sha256 hex digest)
+        """
+        grid_in = self.bucket.open_upload_stream(filename, metadata={"content_type": file.content_type})
+        size = 0
+        sha256 = hashlib.sha256()
+        try:
+            while chunk := await file.read(ASSET_CHUNK_SIZE):
+                await grid_in.write(chunk)
+                sha256.update(chunk)
+                size += len(chunk)
+            await grid_in.close()
+        except Exception:
+            await grid_in.abort()
+            raise
+        return grid_in._id, size, sha256.hexdigest()
+
+    async def _delete_content(self, file_ids: List[ObjectId]) -> None:
+        """Delete the GridFS files of assets"""
+        if not file_ids:
+            return
+        await self.db[f"{ASSET_BUCKET}.files"].delete_many({"_id": {"$in": file_ids}})
+        await self.db[f"{ASSET_BUCKET}.chunks"].delete_many({"files_id": {"$in": file_ids}})
+
     async def save_multiple_files(self, files: List[UploadFile], username: Optional[str] = None) -> List[Asset]:
         """Save multiple files and return their asset records"""
         assets = []
@@ -91,6 +140,7 @@ class AssetService:
                         id=asset_in_db.id,
                         name=asset_in_db.name,
                         mime_type=asset_in_db.mime_type,
+                        size=asset_in_db.size,
                         created_at=asset_in_db.created_at,
                         updated_at=asset_in_db.updated_at,
                         created_by=asset_in_db.created_by if hasattr(asset_in_db, "created_by") else None,
@@ -139,43 +189,137 @@ class AssetService:
 
     async def get_asset_by_name(self, name: str) -> Optional[Asset]:
         """Get a single asset by name"""
-        asset = await self.collection.find_one({"name": name})
+        asset = await self.collection.find_one({"name": name}, {"data": 0})
         if asset:
             asset["_id"] = str(asset["_id"])
             return Asset(**asset)
         return None
 
-    async def get_asset_data(self, asset_id: str) -> bytes:
-        """Get the binary data of an asset"""
-        try:
+    async def open_asset(self, asset_id: Optional[str] = None, name: Optional[str] = None) -> Optional[AssetContent]:
+        """Get an asset by ID or name with everything needed to serve its content.
+
+        The asset document carries the size, chunk size and ETag of its GridFS file, so
+        this is the only query before the content chunks are read.
+
+        Args:
+            asset_id: ID of the asset
+            name: Name of the asset, used when no ID is given
+
+        Returns:
+            The asset content descriptor, None if not found
+        """
+        if asset_id is not None:
             if not ObjectId.is_valid(asset_id):
                 raise HTTPException(status_code=400, detail="Invalid asset ID format")
-
-            asset = await self.collection.find_one({"_id": ObjectId(asset_id)})
+            query = {"_id": ObjectId(asset_id)}
+        else:
+            query = {"name": name}
+
+        doc = await self.collection.find_one(query)
+        if not doc:
+            return None
+
+        data = doc.pop("data", None)
+        if doc.get("file_id") is not None:
+            file_document = {
+                "_id": doc["file_id"],
+                "length": doc["size"],
+                "chunkSize": doc.get("chunk_size", ASSET_CHUNK_SIZE),
+            }
+            size = doc["size"]
+            etag = doc.get("etag") or f'"{doc["file_id"]}"'
+        elif data is not None:
+            # Inline asset stored before GridFS, see scripts/migrate_assets_to_gridfs.py
+            file_document = None
+            size = len(data)
+            etag = content_etag(hashlib.sha256(data).hexdigest())
+        else:
+            raise HTTPException(status_code=404, detail="Asset content not found")
+
+        doc["_id"] = str(doc["_id"])
+        return AssetContent(asset=Asset(**doc), size=size, etag=etag, file_document=file_document, data=data)
+
+    async def iter_content(
+        self, content: AssetContent, start: int = 0, end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the content of an asset chunk by chunk
+
+        Args:
+            content: The asset content descriptor from open_asset
+            start: Offset of the first byte
+            end: Offset of the last byte (inclusive), None for the end of the content
+        """
+        end = content.size - 1 if end is None else end
+        if content.file_document is None:
+            yield content.data[start : end + 1]
+            return
+
+        grid_out = AsyncIOMotorGridOut(self.db[ASSET_BUCKET], file_document=content.file_document)
+        grid_out.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await grid_out.readchunk()
+            if not chunk:
+                break
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+
+    async def migrate_inline_assets(self, dry_run: bool = False) -> dict:
+        """Move the content of assets stored inline in the data field into GridFS
+
+        Assets are migrated one at a time, so memory use stays bounded by the largest asset.
+
+        Args:
+            dry_run: Only count the inline assets without changing anything
+
+        Returns:
+            Dictionary with the number of inline assets found and migrated
+        """
+        found = 0
+        migrated = 0
+        async for doc in self.collection.find({"data": {"$exists": True}}, {"_id": 1}):
+            found += 1
+            if dry_run:
+                continue
+
+            asset = await self.collection.find_one({"_id": doc["_id"], "data": {"$exists": True}})
             if not asset:
-                raise HTTPException(status_code=404, detail="Asset not found")
-
-            if "data" in asset:
-                return asset["data"]
+                continue
+            data = asset["data"] or b""
+            file_id = await self.bucket.upload_from_stream(
+                asset["name"], data, metadata={"content_type": asset.get("mime_type")}
+            )
+            content_fields = {
+                "file_id": file_id,
+                "size": len(data),
+                "chunk_size": ASSET_CHUNK_SIZE,
+                "etag": content_etag(hashlib.sha256(data).hexdigest()),
+            }
+            result = await self.collection.update_one(
+                {"_id": asset["_id"], "data": {"$exists": True}},
+                {"$set": content_fields, "$unset": {"data": ""}},
+            )
+            if result.modified_count:
+                migrated += 1
             else:
-                raise HTTPException(status_code=500, detail="Asset data not found")
+                await self._delete_content([file_id])
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error retrieving asset data: {str(e)}")
+        return {"found": found, "migrated": migrated}
 
     async def delete_asset(self, asset_id: str, username: Optional[str] = None) -> bool:
         """Delete a single asset"""
         if not ObjectId.is_valid(asset_id):
             raise HTTPException(status_code=400, detail="Invalid asset ID")
 
-        asset = await self.collection.find_one({"_id": ObjectId(asset_id)})
+        asset = await self.collection.find_one({"_id": ObjectId(asset_id)}, {"file_id": 1})
         if not asset:
             return False
 
         # Delete from assets collection
         result = await self.collection.delete_one({"_id": ObjectId(asset_id)})
+        if asset.get("file_id") is not None:
+            await self._delete_content([asset["file_id"]])
         return result.deleted_count > 0
 
     async def delete_multiple_assets(self, asset_ids: List[str], username: Optional[str] = None) -> int:
@@ -184,8 +328,15 @@ class AssetService:
         if not valid_ids:
             return 0
 
+        file_ids = [
+            asset["file_id"]
+            async for asset in self.collection.find({"_id": {"$in": valid_ids}}, {"file_id": 1})
+            if asset.get("file_id") is not None
+        ]
+
         # Delete from assets collection
         result = await self.collection.delete_many({"_id": {"$in": valid_ids}})
+        await self._delete_content(file_ids)
         return result.deleted_count
 
     async def count_assets(self) -> int:
@@ -193,6 +344,7 @@ class AssetService:
         return await self.collection.count_documents({})
 
 
-# Get AssetService instance
-def get_asset_service(db=Depends(get_database)) -> AssetService:
-    return AssetService(db)
+@lru_cache
+def get_asset_service() -> AssetService:
+    """Get the application-scoped AssetService instance"""
+    return AssetService()
@@ -1,19 +1,23 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from bson import ObjectId
-from cachetools import TTLCache, keys
+from cachetools import keys
+from pymongo import ReturnDocument
 
+from app.core.cache import CATEGORIES_CACHE, SUGGEST_CACHE, TECH_RADAR_CACHE, get_cache, invalidate
 from app.core.database import get_database
 from app.models.category import Category, CategoryCreate, CategoryInDB, CategoryUpdate
+from app.services.search_index import get_search_index
 
 
 class CategoryService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.categories
-        # Create a cache with 1-hour TTL
-        self.categories_cache = TTLCache(maxsize=1, ttl=3600)
+        # Process-wide cache with 1-hour TTL, shared by all instances and invalidated on writes
+        self.categories_cache = get_cache(CATEGORIES_CACHE, maxsize=100, ttl=3600)
 
     async def create_category(self, category: CategoryCreate, username: Optional[str] = None) -> CategoryInDB:
         """Create a new category"""
@@ -32,10 +36,11 @@ class CategoryService:
             category_dict["created_by"] = username
             category_dict["updated_by"] = username
 
-        result = await self.collection.insert_one(category_dict)
+        # insert_one adds the generated _id to category_dict
+        await self.collection.insert_one(category_dict)
         # Clear cache since data has been updated
-        self.categories_cache.clear()
-        return await self.get_category_by_id(str(result.inserted_id))
+        await invalidate(CATEGORIES_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+        return CategoryInDB(**category_dict)
 
     async def get_category_by_id(self, category_id: str) -> Optional[CategoryInDB]:
         """Get a category by ID - internal use only"""
@@ -128,17 +133,18 @@ class CategoryService:
                     }
                 },
             )
+            await get_search_index().refresh_solutions({"category": update_dict["name"]})
 
         update_dict["updated_at"] = datetime.utcnow()
         if username:
             update_dict["updated_by"] = username
 
-        result = await self.collection.update_one({"_id": ObjectId(category_id)}, {"$set": update_dict})
+        updated_category = await self.collection.find_one_and_update(
+            {"_id": ObjectId(category_id)}, {"$set": update_dict}, return_document=ReturnDocument.AFTER
+        )
         # Clear cache since data has been updated
-        self.categories_cache.clear()
-        if result.modified_count:
-            return await self.get_category_by_id(category_id)
-        return existing_category
+        await invalidate(CATEGORIES_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+        return CategoryInDB(**updated_category) if updated_category else None
 
     async def delete_category_by_id(self, category_id: str) -> bool:
         """Delete a category by ID"""
@@ -154,7 +160,7 @@ class CategoryService:
 
         result = await self.collection.delete_one({"_id": ObjectId(category_id)})
         # Clear cache since data has been updated
-        self.categories_cache.clear()
+        await invalidate(CATEGORIES_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
         return result.deleted_count > 0
 
     async def count_categories(self) -> int:
@@ -170,3 +176,9 @@ class CategoryService:
         category_dict = category.model_dump()
         usage_count = await self.get_category_usage_count(category.name)
         return Category(**category_dict, usage_count=usage_count)
+
+
+@lru_cache
+def get_category_service() -> CategoryService:
+    """Get the application-scoped CategoryService instance"""
+    return CategoryService()
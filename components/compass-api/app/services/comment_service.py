@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from bson import ObjectId
@@ -6,6 +7,7 @@ from fastapi import HTTPException, status
 from pymongo import ASCENDING, DESCENDING
 
 from app.core.database import get_database
+from app.core.pagination import apply_cursor, keyset_sort, next_cursor
 from app.models.comment import (
     Comment,
     CommentCreate,
@@ -13,7 +15,7 @@ from app.models.comment import (
     CommentType,
     CommentUpdate,
 )
-from app.services.user_service import UserService
+from app.services.user_service import get_user_service
 
 VALID_SORT_FIELDS = {"created_at", "updated_at"}
 
@@ -22,15 +24,26 @@ class CommentService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.comments
-        self.user_service = UserService()
+        self.user_service = get_user_service()
+
+    async def _convert_to_comments(self, comments_data: List[dict]) -> List[Comment]:
+        """Private helper method to convert comment data to Comment models with full names.
+        The authors of all comments are resolved with a single lookup."""
+        for comment_data in comments_data:
+            # If username is missing, use created_by as fallback
+            if "username" not in comment_data:
+                comment_data["username"] = comment_data["created_by"]
+
+        full_names = await self.user_service.get_full_names(comment["username"] for comment in comments_data)
+        for comment_data in comments_data:
+            if comment_data["username"] in full_names:
+                comment_data["full_name"] = full_names[comment_data["username"]]
+        return [Comment(**comment_data) for comment_data in comments_data]
 
     async def _convert_to_comment(self, comment_data: dict) -> Comment:
         """Private helper method to convert comment data to Comment model with full name"""
-        # Get user's full name from user service
-        user_info = await self.user_service.get_user_info(comment_data["username"])
-        if user_info:
-            comment_data["full_name"] = user_info["full_name"]
-        return Comment(**comment_data)
+        comments = await self._convert_to_comments([comment_data])
+        return comments[0]
 
     async def get_comments(
         self,
@@ -39,8 +52,13 @@ class CommentService:
         sort: str = "-created_at",  # Default sort by created_at desc
         type: Optional[CommentType] = None,
         solution_slug: Optional[str] = None,
-    ) -> Tuple[List[Comment], int]:
-        """Get all comments with pagination, sorting and optional type filtering."""
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Comment], Optional[int], Optional[str]]:
+        """Get all comments with pagination, sorting and optional type filtering.
+
+        When a cursor is given, skip is ignored and the total is not counted.
+        Returns a tuple of (comments, total, cursor for the next page or None on the last page).
+        """
         query = {}
         if type:
             query["type"] = type
@@ -59,20 +77,20 @@ class CommentService:
         if sort_field not in VALID_SORT_FIELDS:
             raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
 
-        # Execute query with sort
-        cursor = self.collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
+        # Execute query with sort, continuing after the cursor position if given
+        page_query = apply_cursor(query, sort_field, sort_direction, cursor)
+        find_cursor = self.collection.find(page_query).sort(keyset_sort(sort_field, sort_direction)).limit(limit)
+        if not cursor:
+            find_cursor = find_cursor.skip(skip)
+        documents = await find_cursor.to_list(length=limit)
+        next_page_cursor = next_cursor(documents, sort_field, limit)
 
         # Convert to Comment objects with user full names
-        comments = []
-        async for comment in cursor:
-            # If username is missing, use created_by as fallback
-            if "username" not in comment:
-                comment["username"] = comment["created_by"]
-            comments.append(await self._convert_to_comment(comment))
+        comments = await self._convert_to_comments(documents)
 
-        total = await self.collection.count_documents(query)
+        total = None if cursor else await self.collection.count_documents(query)
 
-        return comments, total
+        return comments, total, next_page_cursor
 
     async def get_solution_comments(
         self,
@@ -91,12 +109,7 @@ class CommentService:
         cursor = self.collection.find(query).sort(sort_field, DESCENDING).skip(skip).limit(limit)
 
         # Convert to Comment objects with user full names
-        comments = []
-        async for comment in cursor:
-            # If username is missing, use created_by as fallback
-            if "username" not in comment:
-                comment["username"] = comment["created_by"]
-            comments.append(await self._convert_to_comment(comment))
+        comments = await self._convert_to_comments(await cursor.to_list(length=None))
 
         total = await self.collection.count_documents(query)
         return comments, total
@@ -233,9 +246,7 @@ class CommentService:
         cursor = self.collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
 
         # Convert to Comment objects with user full names
-        comments = []
-        async for comment in cursor:
-            comments.append(await self._convert_to_comment(comment))
+        comments = await self._convert_to_comments(await cursor.to_list(length=None))
 
         total = await self.collection.count_documents(query)
         return comments, total
@@ -259,3 +270,9 @@ class CommentService:
             return set()
 
         return set(result[0]["usernames"])
+
+
+@lru_cache
+def get_comment_service() -> CommentService:
+    """Get the application-scoped CommentService instance"""
+    return CommentService()
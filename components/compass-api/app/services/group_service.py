@@ -1,19 +1,23 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from bson import ObjectId
-from cachetools import TTLCache, keys
+from cachetools import keys
+from pymongo import ReturnDocument
 
+from app.core.cache import GROUPS_CACHE, TECH_RADAR_CACHE, get_cache, invalidate
 from app.core.database import get_database
 from app.models.group import Group, GroupCreate, GroupInDB, GroupUpdate
+from app.services.search_index import get_search_index
 
 
 class GroupService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.groups
-        # Create a cache with 1-hour TTL
-        self.groups_cache = TTLCache(maxsize=1, ttl=3600)
+        # Process-wide cache with 1-hour TTL, shared by all instances and invalidated on writes
+        self.groups_cache = get_cache(GROUPS_CACHE, maxsize=100, ttl=3600)
 
     async def create_group(self, group: GroupCreate, username: Optional[str] = None) -> GroupInDB:
         """Create a new group"""
@@ -32,10 +36,11 @@ class GroupService:
             group_dict["created_by"] = username
             group_dict["updated_by"] = username
 
-        result = await self.collection.insert_one(group_dict)
+        # insert_one adds the generated _id to group_dict
+        await self.collection.insert_one(group_dict)
         # Clear cache since data has been updated
-        self.groups_cache.clear()
-        return await self.get_group_by_id(str(result.inserted_id))
+        await invalidate(GROUPS_CACHE)
+        return await self.get_group_with_usage(GroupInDB(**group_dict))
 
     async def get_group_by_id(self, group_id: str) -> Optional[Group]:
         """Get a group by ID with usage count"""
@@ -117,17 +122,20 @@ class GroupService:
                     }
                 },
             )
+            await get_search_index().refresh_solutions({"group": update_dict["name"]})
 
         update_dict["updated_at"] = datetime.utcnow()
         if username:
             update_dict["updated_by"] = username
 
-        result = await self.collection.update_one({"_id": ObjectId(group_id)}, {"$set": update_dict})
+        updated_group = await self.collection.find_one_and_update(
+            {"_id": ObjectId(group_id)}, {"$set": update_dict}, return_document=ReturnDocument.AFTER
+        )
         # Clear cache since data has been updated
-        self.groups_cache.clear()
-        if result.modified_count:
-            return await self.get_group_by_id(group_id)
-        return existing_group
+        await invalidate(GROUPS_CACHE, TECH_RADAR_CACHE)
+        if updated_group:
+            return await self.get_group_with_usage(GroupInDB(**updated_group))
+        return None
 
     async def delete_group_by_id(self, group_id: str) -> bool:
         """Delete a group by ID"""
@@ -143,7 +151,7 @@ class GroupService:
 
         result = await self.collection.delete_one({"_id": ObjectId(group_id)})
         # Clear cache since data has been updated
-        self.groups_cache.clear()
+        await invalidate(GROUPS_CACHE)
         return result.deleted_count > 0
 
     async def count_groups(self) -> int:
@@ -182,4 +190,10 @@ class GroupService:
         from app.models.group import GroupCreate
         
         group_create = GroupCreate(name=name, description=f"Group for {name}")
-        return await self.create_group(group_create, username)
\ No newline at end of file
+        return await self.create_group(group_create, username)
+
+
+@lru_cache
+def get_group_service() -> GroupService:
+    """Get the application-scoped GroupService instance"""
+    return GroupService()
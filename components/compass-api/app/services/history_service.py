@@ -1,11 +1,17 @@
+import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from app.core.database import get_database
+from app.core.pagination import apply_cursor, keyset_sort, next_cursor
 from app.models.history import ChangedField, ChangeType, HistoryQuery, HistoryRecord
+from app.services.history_writer import get_history_writer
 from bson.objectid import ObjectId
 from pymongo import DESCENDING
 
+logger = logging.getLogger(__name__)
+
 
 class HistoryService:
     """Service for managing history records"""
@@ -13,6 +19,7 @@ class HistoryService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.history
+        self.writer = get_history_writer()
 
     async def create_history_record(self, record: HistoryRecord) -> str:
         """
@@ -27,15 +34,21 @@ class HistoryService:
         result = await self.collection.insert_one(record.model_dump(by_alias=True))
         return str(result.inserted_id)
 
-    async def get_history_records(self, query: HistoryQuery) -> tuple[List[HistoryRecord], int]:
+    async def get_history_records(
+        self, query: HistoryQuery
+    ) -> tuple[List[HistoryRecord], Optional[int], Optional[str]]:
         """
         Get history records based on query parameters
 
+        When query.cursor is set, query.skip is ignored and the total is not counted,
+        so deep pages cost the same as the first one.
+
         Args:
             query: Query parameters
 
         Returns:
-            A tuple of (records, total_count)
+            A tuple of (records, total_count or None when paginating by cursor,
+            cursor for the next page or None on the last page)
         """
         # Build filter criteria
         filter_criteria = {}
@@ -73,20 +86,23 @@ class HistoryService:
             filter_criteria["created_at"] = date_criteria
 
         # Get total count
-        total = await self.collection.count_documents(filter_criteria)
+        total = None if query.cursor else await self.collection.count_documents(filter_criteria)
 
-        # Get paginated records
-        cursor = self.collection.find(filter_criteria)
+        # Get paginated records, continuing after the cursor position if given
+        cursor = self.collection.find(apply_cursor(filter_criteria, "created_at", DESCENDING, query.cursor))
 
         # Sort by created_at in descending order (newest first)
-        cursor = cursor.sort("created_at", DESCENDING)
+        cursor = cursor.sort(keyset_sort("created_at", DESCENDING))
 
         # Apply pagination
-        cursor = cursor.skip(query.skip).limit(query.limit)
+        if not query.cursor:
+            cursor = cursor.skip(query.skip)
+        documents = await cursor.limit(query.limit).to_list(length=query.limit)
+        next_page_cursor = next_cursor(documents, "created_at", query.limit)
 
         # Convert to HistoryRecord objects
         records = []
-        async for record in cursor:
+        for record in documents:
             try:
                 # Convert _id from ObjectId to string
                 if "_id" in record and isinstance(record["_id"], ObjectId):
@@ -125,7 +141,7 @@ class HistoryService:
                 logger.error(f"Error processing history record: {str(e)}, Record: {record}")
                 continue
 
-        return records, total
+        return records, total, next_page_cursor
 
     def _convert_objectids(self, data):
         """
@@ -164,19 +180,20 @@ class HistoryService:
             A tuple of (records, total_count)
         """
         query = HistoryQuery(object_type=object_type, object_id=object_id, skip=skip, limit=limit, fields=fields)
-        return await self.get_history_records(query)
+        records, total, _ = await self.get_history_records(query)
+        return records, total
 
-    async def record_object_change(
+    def build_change_record(
         self,
         object_type: str,
         object_id: str,
         object_name: str,
         change_type: ChangeType,
         username: str,
-        changed_fields: List[Dict[str, Any]],
+        changed_fields: Optional[List[Dict[str, Any]]] = None,
         change_summary: Optional[str] = None,
-    ) -> HistoryRecord:
-        """Record a change to an object in the history collection.
+    ) -> dict:
+        """Build the history document of a change to an object, to be stored with record_changes.
 
         Args:
             object_type: Type of object being changed (e.g., "solution", "category")
@@ -184,21 +201,20 @@ class HistoryService:
             object_name: Name of the object for easy reference
             change_type: Type of change (create, update, delete)
             username: Username of the user making the change
-            changed_fields: List of changed fields with their old and new values
+            changed_fields: List of changed fields with their old and new values, empty for deletions
             change_summary: Optional summary of the changes
 
         Returns:
-            The created history record
+            The history document, with its ID assigned here so it is known before the record is stored
         """
         now = datetime.utcnow()
-
-        # Create history record
-        history_record = {
+        return {
+            "_id": ObjectId(),
             "object_type": object_type,
             "object_id": object_id,
             "object_name": object_name,
             "change_type": change_type,
-            "changed_fields": [ChangedField(**field).model_dump() for field in changed_fields],
+            "changed_fields": [ChangedField(**field).model_dump() for field in changed_fields or []],
             "change_summary": change_summary,
             "created_at": now,
             "created_by": username,
@@ -206,11 +222,44 @@ class HistoryService:
             "updated_by": username,
         }
 
-        # Insert into database
-        result = await self.collection.insert_one(history_record)
-        history_record["_id"] = str(result.inserted_id)
+    async def record_changes(self, history_records: List[dict]) -> None:
+        """Store history documents built by build_change_record with one write.
 
-        return HistoryRecord(**history_record)
+        Args:
+            history_records: The history documents to store
+        """
+        await self.writer.write(history_records)
+
+    async def record_object_change(
+        self,
+        object_type: str,
+        object_id: str,
+        object_name: str,
+        change_type: ChangeType,
+        username: str,
+        changed_fields: Optional[List[Dict[str, Any]]] = None,
+        change_summary: Optional[str] = None,
+    ) -> HistoryRecord:
+        """Record a change to an object in the history collection.
+
+        Args:
+            object_type: Type of object being changed (e.g., "solution", "category")
+            object_id: ID of the object being changed
+            object_name: Name of the object for easy reference
+            change_type: Type of change (create, update, delete)
+            username: Username of the user making the change
+            changed_fields: List of changed fields with their old and new values, empty for deletions
+            change_summary: Optional summary of the changes
+
+        Returns:
+            The history record; it is stored in the background when the history writer is running
+        """
+        history_record = self.build_change_record(
+            object_type, object_id, object_name, change_type, username, changed_fields, change_summary
+        )
+        await self.record_changes([history_record])
+
+        return HistoryRecord(**{**history_record, "_id": str(history_record["_id"])})
 
     async def update_justification(self, history_id: str, field_name: str, justification: str) -> bool:
         """
@@ -231,3 +280,9 @@ class HistoryService:
             {"$set": {"changed_fields.$.status_change_justification": justification, "updated_at": datetime.utcnow()}},
         )
         return result.modified_count > 0
+
+
+@lru_cache
+def get_history_service() -> HistoryService:
+    """Get the application-scoped HistoryService instance"""
+    return HistoryService()
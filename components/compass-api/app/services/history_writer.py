@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from functools import lru_cache
+from typing import List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.config import settings
+from app.core.database import get_database
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryWriter:
+    """Writes history records behind the request that produced them.
+
+    When started, records are put on a bounded queue and a background task inserts
+    them in batches with insert_many, so a write request returns as soon as its
+    primary document is stored. When the queue is full, HISTORY_QUEUE_OVERFLOW decides
+    whether the request waits for room ("block"), writes the records itself ("sync")
+    or drops them ("drop"). Until started, and in HISTORY_WRITE_MODE "sync", records
+    are inserted directly.
+    """
+
+    def __init__(self):
+        self.collection = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Start writing history records in the background"""
+        self.collection = db.history
+        self._queue = asyncio.Queue(maxsize=settings.HISTORY_QUEUE_SIZE)
+        self._task = asyncio.create_task(self._drain())
+        logger.info("History writer started")
+
+    async def stop(self) -> None:
+        """Write the queued records, then stop the background task"""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=settings.HISTORY_FLUSH_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(f"History writer stopped with {self._queue.qsize()} records not written")
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._queue = None
+
+    def queue_size(self) -> int:
+        """Get the number of records waiting to be written"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def write(self, documents: List[dict]) -> None:
+        """Store history records, in the background when the writer is running
+
+        Args:
+            documents: History documents, each with its _id already set
+        """
+        if not documents:
+            return
+        # Insert directly until started, or if the background task has stopped unexpectedly
+        if self._task is None or self._task.done():
+            await self._insert(documents)
+            return
+
+        for index, document in enumerate(documents):
+            try:
+                self._queue.put_nowait(document)
+            except asyncio.QueueFull:
+                overflow = documents[index:]
+                if settings.HISTORY_QUEUE_OVERFLOW == "block":
+                    for pending in overflow:
+                        await self._queue.put(pending)
+                elif settings.HISTORY_QUEUE_OVERFLOW == "sync":
+                    await self._insert(overflow)
+                else:
+                    logger.warning(f"History queue full, dropped {len(overflow)} records")
+                return
+
+    async def _insert(self, documents: List[dict]) -> None:
+        collection = self.collection if self.collection is not None else get_database().history
+        await collection.insert_many(documents, ordered=False)
+
+    async def _drain(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < settings.HISTORY_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._insert(batch)
+            except Exception as e:
+                # Any failure only loses this batch; the task keeps draining the queue
+                logger.error(f"Failed to write {len(batch)} history records: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+@lru_cache
+def get_history_writer() -> HistoryWriter:
+    """Get the process-wide HistoryWriter instance"""
+    return HistoryWriter()
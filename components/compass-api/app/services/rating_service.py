@@ -1,29 +1,41 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from bson import ObjectId
 from fastapi import HTTPException, status
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 
 from app.core.database import get_database
+from app.core.pagination import apply_cursor, keyset_sort, next_cursor
 from app.models.rating import Rating, RatingCreate, RatingInDB
-from app.services.user_service import UserService
+from app.services.search_index import get_search_index
+from app.services.user_service import get_user_service
 
 VALID_SORT_FIELDS = {"created_at", "updated_at", "score"}
+RATING_SCORES = range(1, 6)
+REBUILD_BATCH_SIZE = 500
 
 
 class RatingService:
     def __init__(self):
         self.db = get_database()
-        self.user_service = UserService()
+        self.user_service = get_user_service()
+        self.search_index = get_search_index()
+
+    async def _convert_to_ratings(self, ratings_data: List[dict]) -> List[Rating]:
+        """Private helper method to convert rating data to Rating models with full names.
+        The authors of all ratings are resolved with a single lookup."""
+        full_names = await self.user_service.get_full_names(rating["username"] for rating in ratings_data)
+        for rating_data in ratings_data:
+            if rating_data["username"] in full_names:
+                rating_data["full_name"] = full_names[rating_data["username"]]
+        return [Rating(**rating_data) for rating_data in ratings_data]
 
     async def _convert_to_rating(self, rating_data: dict) -> Rating:
         """Private helper method to convert rating data to Rating model with full name"""
-        # Get user's full name from user service
-        user_info = await self.user_service.get_user_info(rating_data["username"])
-        if user_info:
-            rating_data["full_name"] = user_info["full_name"]
-        return Rating(**rating_data)
+        ratings = await self._convert_to_ratings([rating_data])
+        return ratings[0]
 
     async def get_ratings(
         self,
@@ -32,9 +44,14 @@ class RatingService:
         sort: str = "-created_at",  # Default sort by created_at desc
         solution_slug: Optional[str] = None,
         score: Optional[int] = None,
-    ) -> Tuple[List[Rating], int]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Rating], Optional[int], Optional[str]]:
         """Get all ratings with pagination and sorting.
-        Default sort is by created_at in descending order (newest first)."""
+        Default sort is by created_at in descending order (newest first).
+
+        When a cursor is given, skip is ignored and the total is not counted.
+        Returns a tuple of (ratings, total, cursor for the next page or None on the last page).
+        """
 
         # Build query
         query = {}
@@ -59,12 +76,18 @@ class RatingService:
         if sort_field not in VALID_SORT_FIELDS:
             raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
 
-        # Execute query with sort
-        cursor = self.db.ratings.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-        ratings = [await self._convert_to_rating(rating) async for rating in cursor]
-        total = await self.db.ratings.count_documents(query)
+        # Execute query with sort, continuing after the cursor position if given
+        page_query = apply_cursor(query, sort_field, sort_direction, cursor)
+        find_cursor = self.db.ratings.find(page_query).sort(keyset_sort(sort_field, sort_direction)).limit(limit)
+        if not cursor:
+            find_cursor = find_cursor.skip(skip)
+        documents = await find_cursor.to_list(length=limit)
+        next_page_cursor = next_cursor(documents, sort_field, limit)
 
-        return ratings, total
+        ratings = await self._convert_to_ratings(documents)
+        total = None if cursor else await self.db.ratings.count_documents(query)
+
+        return ratings, total, next_page_cursor
 
     async def get_solution_ratings(
         self, solution_slug: str, skip: int, limit: int, sort_by: str
@@ -72,7 +95,7 @@ class RatingService:
         query = {"solution_slug": solution_slug}
         sort_field = "created_at" if sort_by == "created_at" else "score"
         cursor = self.db.ratings.find(query).sort(sort_field, DESCENDING).skip(skip).limit(limit)
-        ratings = [await self._convert_to_rating(rating) async for rating in cursor]
+        ratings = await self._convert_to_ratings(await cursor.to_list(length=None))
         total = await self.db.ratings.count_documents(query)
         return ratings, total
 
@@ -82,13 +105,53 @@ class RatingService:
             return await self._convert_to_rating(rating)
         return None
 
+    @staticmethod
+    def _empty_rating_summary() -> Dict:
+        """Build the rating summary returned for a solution without ratings"""
+        return {
+            "average": 0,
+            "count": 0,
+            "distribution": {str(i): 0 for i in RATING_SCORES},
+        }
+
+    @staticmethod
+    def _build_rating_summary(group: dict) -> Dict:
+        """Convert a grouped aggregation result into a rating summary"""
+        # Calculate distribution
+        distribution = {str(i): 0 for i in RATING_SCORES}
+        for score in group["scores"]:
+            distribution[str(score)] += 1
+
+        return {
+            "average": round(group["average"], 2),
+            "count": group["count"],
+            "distribution": distribution,
+        }
+
     async def get_rating_summary(self, solution_slug: str) -> Dict:
         """Get rating summary statistics for a solution"""
+        summaries = await self.get_rating_summaries([solution_slug])
+        return summaries[solution_slug]
+
+    async def get_rating_summaries(self, solution_slugs: List[str]) -> Dict[str, Dict]:
+        """Get rating summary statistics for multiple solutions in a single aggregation
+
+        Args:
+            solution_slugs: Slugs of the solutions to summarize
+
+        Returns:
+            Dictionary mapping every requested slug to its rating summary.
+            Solutions without ratings get an empty summary.
+        """
+        unique_slugs = list(dict.fromkeys(solution_slugs))
+        if not unique_slugs:
+            return {}
+
         pipeline = [
-            {"$match": {"solution_slug": solution_slug}},
+            {"$match": {"solution_slug": {"$in": unique_slugs}}},
             {
                 "$group": {
-                    "_id": None,
+                    "_id": "$solution_slug",
                     "average": {"$avg": "$score"},
                     "count": {"$sum": 1},
                     "scores": {"$push": "$score"},
@@ -96,29 +159,131 @@ class RatingService:
             },
         ]
 
-        result = await self.db.ratings.aggregate(pipeline).to_list(1)
-        if not result:
-            return {
-                "average": 0,
-                "count": 0,
-                "distribution": {str(i): 0 for i in range(1, 6)},
-            }
+        results = await self.db.ratings.aggregate(pipeline).to_list(length=None)
+        summaries = {slug: self._empty_rating_summary() for slug in unique_slugs}
+        for group in results:
+            summaries[group["_id"]] = self._build_rating_summary(group)
+        return summaries
 
-        summary = result[0]
-        # Calculate distribution
-        distribution = {str(i): 0 for i in range(1, 6)}
-        for score in summary["scores"]:
-            distribution[str(score)] += 1
+    @staticmethod
+    def _materialized_rating_fields(summary: Dict) -> Dict:
+        """Convert a rating summary into the rating fields stored on a solution document"""
+        distribution = summary["distribution"]
+        return {
+            "rating": summary["average"],
+            "rating_count": summary["count"],
+            "rating_sum": sum(int(score) * count for score, count in distribution.items()),
+            "rating_distribution": distribution,
+        }
+
+    @classmethod
+    def initial_rating_fields(cls) -> Dict:
+        """Get the materialized rating fields for a solution without ratings"""
+        return cls._materialized_rating_fields(cls._empty_rating_summary())
+
+    async def refresh_solution_rating(self, solution_slug: str) -> None:
+        """Recompute the materialized rating fields of a solution from the ratings collection"""
+        summary = await self.get_rating_summary(solution_slug)
+        await self.db.solutions.update_one({"slug": solution_slug}, {"$set": self._materialized_rating_fields(summary)})
+
+    async def _apply_rating_change(
+        self, solution_slug: str, added_score: Optional[int] = None, removed_score: Optional[int] = None
+    ) -> None:
+        """Incrementally update the materialized rating fields of a solution.
+
+        Counters are incremented and the average is recomputed in the same atomic
+        update pipeline. Solutions created before the fields existed are recomputed
+        from the ratings collection instead.
+
+        Args:
+            solution_slug: The slug of the rated solution
+            added_score: Score that was added to the solution, if any
+            removed_score: Score that was removed from the solution, if any
+        """
+        if added_score == removed_score:
+            return
+
+        def increment(field: str, delta: int) -> dict:
+            return {"$add": [{"$ifNull": [f"${field}", 0]}, delta]}
+
+        count_delta = (added_score is not None) - (removed_score is not None)
+        sum_delta = (added_score or 0) - (removed_score or 0)
+        counters = {
+            "rating_count": increment("rating_count", count_delta),
+            "rating_sum": increment("rating_sum", sum_delta),
+        }
+        for score in RATING_SCORES:
+            score_delta = (score == added_score) - (score == removed_score)
+            counters[f"rating_distribution.{score}"] = increment(f"rating_distribution.{score}", score_delta)
+
+        pipeline = [
+            {"$set": counters},
+            {
+                "$set": {
+                    "rating": {
+                        "$cond": [
+                            {"$gt": ["$rating_count", 0]},
+                            {"$round": [{"$divide": ["$rating_sum", "$rating_count"]}, 2]},
+                            0,
+                        ]
+                    }
+                }
+            },
+        ]
+        result = await self.db.solutions.update_one({"slug": solution_slug, "rating_sum": {"$exists": True}}, pipeline)
+        if result.matched_count == 0:
+            await self.refresh_solution_rating(solution_slug)
+        # Search results carry the rating
+        await self.search_index.refresh_solution(solution_slug)
+
+    async def rebuild_rating_aggregates(self, verify_only: bool = False) -> Dict:
+        """Recompute the materialized rating fields of every solution.
+
+        Args:
+            verify_only: If True, only report solutions whose stored fields are out of date
+
+        Returns:
+            Dictionary with the number of checked, mismatched and updated solutions
+            and the slugs of the mismatched solutions
+        """
+        projection = {"slug": 1, "rating": 1, "rating_count": 1, "rating_sum": 1, "rating_distribution": 1}
+        checked = 0
+        mismatched_slugs = []
+        updated = 0
+
+        async def process(batch: List[dict]) -> int:
+            summaries = await self.get_rating_summaries([solution["slug"] for solution in batch])
+            operations = []
+            for solution in batch:
+                expected = self._materialized_rating_fields(summaries[solution["slug"]])
+                if any(solution.get(field) != value for field, value in expected.items()):
+                    mismatched_slugs.append(solution["slug"])
+                    operations.append(UpdateOne({"_id": solution["_id"]}, {"$set": expected}))
+            if operations and not verify_only:
+                result = await self.db.solutions.bulk_write(operations, ordered=False)
+                return result.modified_count
+            return 0
+
+        batch = []
+        async for solution in self.db.solutions.find({}, projection):
+            batch.append(solution)
+            checked += 1
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                updated += await process(batch)
+                batch = []
+        if batch:
+            updated += await process(batch)
 
         return {
-            "average": round(summary["average"], 2),
-            "count": summary["count"],
-            "distribution": distribution,
+            "checked": checked,
+            "mismatched": len(mismatched_slugs),
+            "updated": updated,
+            "mismatched_slugs": mismatched_slugs,
         }
 
     async def create_or_update_rating(self, solution_slug: str, rating: RatingCreate, username: str) -> RatingInDB:
         # First check if solution exists
-        solution = await self.db.solutions.find_one({"slug": solution_slug})
+        solution = await self.db.solutions.find_one({"slug": solution_slug}, {"_id": 1})
         if not solution:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -128,21 +293,20 @@ class RatingService:
         now = datetime.utcnow()
         rating_data = rating.model_dump()
 
-        # Try to update existing rating first
-        result = await self.db.ratings.update_one(
-            {"solution_slug": solution_slug, "username": username},
-            {
-                "$set": {
-                    "score": rating_data["score"],
-                    "comment": rating_data.get("comment"),
-                    "is_adopted_user": rating_data.get("is_adopted_user", False),
-                    "updated_at": now,
-                }
-            },
+        rating_fields = {
+            "score": rating_data["score"],
+            "comment": rating_data.get("comment"),
+            "is_adopted_user": rating_data.get("is_adopted_user", False),
+            "updated_at": now,
+        }
+
+        # Try to update existing rating first, keeping the previous score for the solution aggregates
+        previous_rating = await self.db.ratings.find_one_and_update(
+            {"solution_slug": solution_slug, "username": username}, {"$set": rating_fields}
         )
 
         # If no existing rating was updated, create a new one
-        if result.modified_count == 0:
+        if previous_rating is None:
             new_rating = {
                 "solution_slug": solution_slug,
                 "username": username,
@@ -153,10 +317,15 @@ class RatingService:
                 "updated_at": now,
             }
             await self.db.ratings.insert_one(new_rating)
+            await self._apply_rating_change(solution_slug, added_score=new_rating["score"])
             return RatingInDB(**new_rating)
 
-        # Return the updated rating
-        return await self.get_user_rating(solution_slug, username)
+        await self._apply_rating_change(
+            solution_slug, added_score=rating_data["score"], removed_score=previous_rating.get("score")
+        )
+
+        # The update only set rating_fields, so the updated rating is the previous one with them applied
+        return RatingInDB(**{**previous_rating, **rating_fields})
 
     async def get_user_ratings(
         self, username: str, skip: int = 0, limit: int = 20, sort: str = "-created_at"
@@ -181,7 +350,7 @@ class RatingService:
         cursor = self.db.ratings.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
 
         # Convert to Rating objects with user full names
-        ratings = [await self._convert_to_rating(rating) async for rating in cursor]
+        ratings = await self._convert_to_ratings(await cursor.to_list(length=None))
         total = await self.db.ratings.count_documents(query)
 
         return ratings, total
@@ -233,6 +402,10 @@ class RatingService:
         result = await self.db.ratings.find_one_and_update(
             {"_id": ObjectId(rating_id)}, {"$set": update_dict}, return_document=True
         )
+        if result:
+            await self._apply_rating_change(
+                rating.solution_slug, added_score=result["score"], removed_score=rating.score
+            )
         return RatingInDB(**result) if result else None
 
     async def delete_rating(self, rating_id: str, username: str, is_superuser: bool) -> bool:
@@ -248,6 +421,8 @@ class RatingService:
             )
 
         result = await self.db.ratings.delete_one({"_id": ObjectId(rating_id)})
+        if result.deleted_count > 0:
+            await self._apply_rating_change(rating.solution_slug, removed_score=rating.score)
         return result.deleted_count > 0
 
     async def get_solution_adopted_usernames(self, solution_slug: str) -> set[str]:
@@ -269,3 +444,9 @@ class RatingService:
             return set()
 
         return set(result[0]["usernames"])
+
+
+@lru_cache
+def get_rating_service() -> RatingService:
+    """Get the application-scoped RatingService instance"""
+    return RatingService()
@@ -0,0 +1,346 @@
+import asyncio
+import heapq
+import logging
+import math
+import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
+
+from app.core.config import settings
+from app.core.indexes import SOLUTION_TEXT_WEIGHTS
+from app.models.solution import Solution
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Score multipliers for query terms that only match a longer term or a similar term
+PREFIX_MATCH_FACTOR = 0.8
+FUZZY_MATCH_FACTOR = 0.5
+# Minimum trigram similarity (Jaccard) for a term to count as a typo of the query term
+FUZZY_MIN_SIMILARITY = 0.35
+# Maximum number of index terms a single query term expands to
+MAX_TERM_EXPANSIONS = 50
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(term: str) -> Set[str]:
+    """Get the padded character trigrams of a term"""
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """In-memory inverted index with prefix and typo-tolerant matching and BM25 ranking.
+
+    Field values are tokenized and every token occurrence counts with the weight of
+    its field, so a match in a heavily weighted field ranks higher.
+    """
+
+    def __init__(self, weights: Mapping[str, float], k1: float = 1.2, b: float = 0.75):
+        self.weights = dict(weights)
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, float]] = {}  # term -> {doc_id: weighted term frequency}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}  # doc_id -> {term: weighted term frequency}
+        self._doc_lengths: Dict[str, float] = {}
+        self._documents: Dict[str, Any] = {}
+        self._terms: List[str] = []  # Sorted for prefix lookups
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)  # trigram -> terms
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._documents
+
+    def add(self, doc_id: str, fields: Mapping[str, Any], payload: Any = None) -> None:
+        """Add a document to the index, replacing any previous version
+
+        Args:
+            doc_id: Unique document identifier
+            fields: Field values to index; list values are indexed item by item
+            payload: Object returned for the document by search, defaults to the fields
+        """
+        self.remove(doc_id)
+        self._add(doc_id, fields, payload, sort_terms=True)
+
+    def add_many(self, documents: Iterable[Tuple[str, Mapping[str, Any], Any]]) -> None:
+        """Add many documents, sorting the term list once instead of for every new term
+
+        Args:
+            documents: (doc_id, fields, payload) tuples, as the arguments of add
+        """
+        documents = {doc_id: (fields, payload) for doc_id, fields, payload in documents}
+        # Replaced documents are removed while the term list is still sorted
+        for doc_id in documents:
+            self.remove(doc_id)
+        for doc_id, (fields, payload) in documents.items():
+            self._add(doc_id, fields, payload, sort_terms=False)
+        self._terms.sort()
+
+    def _add(self, doc_id: str, fields: Mapping[str, Any], payload: Any, sort_terms: bool) -> None:
+        frequencies: Dict[str, float] = defaultdict(float)
+        for field, weight in self.weights.items():
+            value = fields.get(field)
+            if not value:
+                continue
+            text = " ".join(str(item) for item in value) if isinstance(value, (list, tuple)) else str(value)
+            for token in tokenize(text):
+                frequencies[token] += weight
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if sort_terms:
+                    insort(self._terms, term)
+                else:
+                    self._terms.append(term)
+                for gram in trigrams(term):
+                    self._trigrams[gram].add(term)
+            postings[doc_id] = frequency
+
+        length = sum(frequencies.values())
+        self._doc_terms[doc_id] = dict(frequencies)
+        self._doc_lengths[doc_id] = length
+        self._documents[doc_id] = fields if payload is None else payload
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index if present"""
+        if doc_id not in self._documents:
+            return
+
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+                for gram in trigrams(term):
+                    terms = self._trigrams[gram]
+                    terms.discard(term)
+                    if not terms:
+                        del self._trigrams[gram]
+
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        del self._documents[doc_id]
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        """Get index terms starting with the prefix, excluding the prefix itself"""
+        terms = []
+        position = bisect_left(self._terms, prefix)
+        while position < len(self._terms) and len(terms) < MAX_TERM_EXPANSIONS:
+            term = self._terms[position]
+            if not term.startswith(prefix):
+                break
+            if term != prefix:
+                terms.append(term)
+            position += 1
+        return terms
+
+    def _similar_terms(self, token: str) -> Dict[str, float]:
+        """Get index terms whose trigrams are similar to the token's, with their similarity"""
+        token_grams = trigrams(token)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in token_grams:
+            for term in self._trigrams.get(gram, ()):
+                shared[term] += 1
+
+        similar = {}
+        for term, count in shared.items():
+            similarity = count / (len(token_grams) + len(trigrams(term)) - count)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                similar[term] = similarity
+        return dict(heapq.nlargest(MAX_TERM_EXPANSIONS, similar.items(), key=lambda item: item[1]))
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        """Map a query token to the index terms it matches and their score multipliers.
+
+        Exact and prefix matches are used when there are any, otherwise similar terms are.
+        """
+        expansions = {term: PREFIX_MATCH_FACTOR for term in self._prefix_terms(token)}
+        if token in self._postings:
+            expansions[token] = 1.0
+        if not expansions:
+            expansions = {
+                term: FUZZY_MATCH_FACTOR * similarity for term, similarity in self._similar_terms(token).items()
+            }
+        return expansions
+
+    def search(self, query: str, skip: int = 0, limit: Optional[int] = None) -> Tuple[List[Tuple[Any, float]], int]:
+        """Search the index, requiring every query token to match a document
+
+        Args:
+            query: The search query
+            skip: Number of matches to skip
+            limit: Maximum number of matches to return, None for all matches
+
+        Returns:
+            Tuple of (page of (payload, score) pairs, best first; total number of matches)
+        """
+        tokens = tokenize(query)
+        if not tokens or not self._documents:
+            return [], 0
+
+        document_count = len(self._documents)
+        average_length = self._total_length / document_count or 1.0
+
+        scores: Optional[Dict[str, float]] = None
+        for token in tokens:
+            token_scores: Dict[str, float] = {}
+            for term, factor in self._expand(token).items():
+                postings = self._postings[term]
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    if scores is not None and doc_id not in scores:
+                        continue
+                    normalization = 1 - self.b + self.b * self._doc_lengths[doc_id] / average_length
+                    score = factor * idf * frequency * (self.k1 + 1) / (frequency + self.k1 * normalization)
+                    # A token counts once per document, with its best matching term
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc_id: scores[doc_id] + score for doc_id, score in token_scores.items()}
+            if not scores:
+                return [], 0
+
+        count = skip + limit if limit else len(scores)
+        ranked = heapq.nlargest(count, scores.items(), key=lambda item: item[1])[skip:]
+        return [(self._documents[doc_id], score) for doc_id, score in ranked], len(scores)
+
+
+class SolutionSearchIndex:
+    """Keeps an in-memory search index of approved solutions.
+
+    The index is built at startup when SEARCH_INDEX_ENABLED is set, updated by the
+    solution, rating, category and group write paths, and rebuilt periodically to pick
+    up changes made by other worker processes. Changes made while a rebuild reads the
+    collection are applied to the new index before it replaces the old one.
+    """
+
+    def __init__(self):
+        self.index = SearchIndex(SOLUTION_TEXT_WEIGHTS)
+        self.collection = None
+        self.ready = False
+        self._task: Optional[asyncio.Task] = None
+        # Solutions changed while a build reads the collection, by ID; None for deleted ones
+        self._changes: Optional[Dict[str, Optional[Mapping[str, Any]]]] = None
+
+    async def build(self) -> int:
+        """Rebuild the index from the approved solutions and return the number indexed"""
+        self._changes = {}
+        try:
+            solutions = await self.collection.find({"review_status": "APPROVED"}).to_list(length=None)
+            index = SearchIndex(SOLUTION_TEXT_WEIGHTS)
+            index.add_many((str(solution["_id"]), solution, Solution(**solution)) for solution in solutions)
+            # Changes made while the collection was read went to the old index, apply them to the new one
+            for solution_id, solution in self._changes.items():
+                self._apply(index, solution_id, solution)
+            # Swap in the new index at once so searches never see a partial build
+            self.index = index
+            self.ready = True
+            return len(index)
+        finally:
+            self._changes = None
+
+    @staticmethod
+    def _apply(index: SearchIndex, solution_id: str, solution: Optional[Mapping[str, Any]]) -> None:
+        if solution and solution.get("review_status") == "APPROVED":
+            index.add(solution_id, solution, Solution(**solution))
+        else:
+            index.remove(solution_id)
+
+    def _record_change(self, solution_id: str, solution: Optional[Mapping[str, Any]]) -> bool:
+        """Record a changed solution for the index, returning whether the current index should apply it"""
+        if self._changes is not None:
+            self._changes[solution_id] = solution
+        return self.ready
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Build the index and start refreshing it periodically"""
+        self.collection = db.solutions
+        count = await self.build()
+        self._task = asyncio.create_task(self._refresh_periodically())
+        logger.info(f"Search index built with {count} solutions")
+
+    async def stop(self) -> None:
+        """Stop refreshing the index"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(settings.SEARCH_INDEX_REFRESH_SECONDS)
+            try:
+                await self.build()
+            except PyMongoError as e:
+                logger.error(f"Search index refresh failed: {str(e)}")
+
+    async def refresh_solution(self, slug: str) -> None:
+        """Re-index a solution after it changed, dropping it if it is no longer approved"""
+        await self.refresh_solutions({"slug": slug})
+
+    @property
+    def active(self) -> bool:
+        """Whether the index is built or being built, so solution changes need to reach it"""
+        return self.ready or self._changes is not None
+
+    async def refresh_solutions(self, query: Mapping[str, Any]) -> None:
+        """Re-index the solutions matching a query after they changed, such as by a category rename"""
+        if not self.active:
+            return
+        async for solution in self.collection.find(query):
+            self.index_solution(solution)
+
+    def index_solution(self, solution: Mapping[str, Any]) -> None:
+        """Re-index a changed solution document, dropping it if it is no longer approved"""
+        solution_id = str(solution["_id"])
+        if self._record_change(solution_id, solution):
+            self._apply(self.index, solution_id, solution)
+
+    def remove_solution(self, solution_id: Union[ObjectId, str]) -> None:
+        """Drop a deleted solution from the index"""
+        solution_id = str(solution_id)
+        if self._record_change(solution_id, None):
+            self.index.remove(solution_id)
+
+    def search(self, keyword: str, skip: int = 0, limit: Optional[int] = None) -> Tuple[List[Solution], int]:
+        """Search approved solutions by prefix and typo-tolerant keyword matching
+
+        Args:
+            keyword: The search keyword
+            skip: Number of matches to skip
+            limit: Maximum number of matches to return, None for all matches
+
+        Returns:
+            Tuple of (page of matching solutions ranked by BM25 score, total number of matches)
+        """
+        matches, total = self.index.search(keyword, skip=skip, limit=limit)
+        return [solution for solution, _ in matches], total
+
+
+@lru_cache
+def get_search_index() -> SolutionSearchIndex:
+    """Get the process-wide SolutionSearchIndex instance"""
+    return SolutionSearchIndex()
@@ -1,5 +1,6 @@
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -176,3 +177,9 @@ class SiteConfigService:
                 continue
 
         return result
+
+
+@lru_cache
+def get_site_config_service() -> SiteConfigService:
+    """Get the application-scoped SiteConfigService instance"""
+    return SiteConfigService()
@@ -1,20 +1,35 @@
+import asyncio
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from app.core.cache import GROUPS_CACHE, SUGGEST_CACHE, TAGS_CACHE, TECH_RADAR_CACHE, invalidate
+from app.core.config import settings
 from app.core.database import get_database
+from app.core.pagination import apply_cursor, keyset_sort, next_cursor
 from app.models.history import ChangeType
 from app.models.solution import Solution, SolutionCreate, SolutionInDB, SolutionUpdate
-from app.services.category_service import CategoryService
-from app.services.group_service import GroupService
-from app.services.history_service import HistoryService
+from app.services.category_service import get_category_service
+from app.services.group_service import get_group_service
+from app.services.history_service import get_history_service
 from app.services.rating_service import RatingService
-from app.services.tag_service import TagService
+from app.services.search_index import get_search_index
+from app.services.tag_service import get_tag_service
 from bson import ObjectId
 from fastapi import logger
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 VALID_SORT_FIELDS = {"name", "category", "created_at", "updated_at"}
+RECOMMEND_STATUS_ORDER = ["ADOPT", "TRIAL", "ASSESS", "HOLD", "EXIT"]
+SEARCH_FACET_FIELDS = ["category", "department", "tags", "recommend_status"]
+STATUS_FIELDS = ["recommend_status", "review_status"]
+MAINTAINER_FIELDS = {"maintainer_id", "maintainer_name", "maintainer_email"}
+# Largest page returned inside a $facet output document; larger pages are read through a cursor
+FACET_PAGE_MAX_LIMIT = 100
+# Attempts to store a solution when concurrent writers keep taking the allocated slug
+SLUG_ALLOCATION_ATTEMPTS = 5
 
 
 def generate_slug(name: str) -> str:
@@ -29,15 +44,106 @@ def generate_slug(name: str) -> str:
     return name_slug
 
 
+def next_available_slug(base_slug: str, existing_slugs: Iterable[str]) -> str:
+    """Get the first of base_slug, base_slug-1, base_slug-2, ... that is not taken
+
+    Args:
+        base_slug: The slug generated from the solution name
+        existing_slugs: Taken slugs; only base_slug and its numbered variants matter
+
+    Returns:
+        The first free slug
+    """
+    taken = set(existing_slugs)
+    if base_slug not in taken:
+        return base_slug
+    counter = 1
+    while f"{base_slug}-{counter}" in taken:
+        counter += 1
+    return f"{base_slug}-{counter}"
+
+
+def allocate_slugs(base_slug: str, current_slugs: List[str], existing_slugs: Iterable[str]) -> List[str]:
+    """Allocate distinct slugs for solutions that are renamed to the same name at once
+
+    A solution keeps its current slug when it is already base_slug or one of its numbered
+    variants and no other solution has it; the others get the first free variants.
+
+    Args:
+        base_slug: The slug generated from the new name
+        current_slugs: The current slugs of the renamed solutions
+        existing_slugs: Slugs taken by other solutions
+
+    Returns:
+        The allocated slugs, in the order of current_slugs
+    """
+    pattern = re.compile(rf"{re.escape(base_slug)}(-\d+)?")
+    taken = set(existing_slugs)
+    slugs: List[Optional[str]] = [None] * len(current_slugs)
+    for i, slug in enumerate(current_slugs):
+        if slug and pattern.fullmatch(slug) and slug not in taken:
+            slugs[i] = slug
+            taken.add(slug)
+    for i, slug in enumerate(slugs):
+        if slug is None:
+            slugs[i] = next_available_slug(base_slug, taken)
+            taken.add(slugs[i])
+    return slugs
+
+
+def changed_solution_fields(
+    old_values: dict, update_dict: dict, status_change_justifications: Optional[Dict[str, str]] = None
+) -> List[dict]:
+    """Get the history entries of the fields a solution update changed
+
+    Args:
+        old_values: The values of the updated fields before the update
+        update_dict: The fields set by the update
+        status_change_justifications: Optional dictionary mapping status fields to their justifications
+
+    Returns:
+        List of changed fields with their old and new values
+    """
+    changed_fields = []
+    for field_name, new_value in update_dict.items():
+        # Bookkeeping fields and justifications are not tracked in history
+        if field_name in ["slug", "updated_at", "updated_by", "status_change_justifications"]:
+            continue
+        old_value = old_values.get(field_name)
+        if old_value != new_value:
+            field_data = {
+                "field_name": field_name,
+                "old_value": old_value,
+                "new_value": new_value,
+            }
+
+            # Add status_change_justification for status fields if provided
+            if field_name in STATUS_FIELDS and status_change_justifications:
+                field_data["status_change_justification"] = status_change_justifications.get(field_name)
+
+            changed_fields.append(field_data)
+    return changed_fields
+
+
+def _is_slug_conflict(error: DuplicateKeyError) -> bool:
+    """Check whether a duplicate key error was caused by the unique slug index"""
+    return "slug" in (error.details or {}).get("keyPattern", {})
+
+
+def _is_slug_write_conflict(write_error: dict) -> bool:
+    """Check whether a bulk write error was caused by the unique slug index"""
+    return write_error.get("code") == 11000 and "slug" in write_error.get("keyPattern", {})
+
+
 class SolutionService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.solutions
-        self.category_service = CategoryService()
-        self.group_service = GroupService()
-        self.tag_service = TagService()
-        self.rating_service = RatingService()
-        self.history_service = HistoryService()
+        self.category_service = get_category_service()
+        self.group_service = get_group_service()
+        self.tag_service = get_tag_service()
+        self.history_service = get_history_service()
+        self.search_index = get_search_index()
 
     async def _get_user_info(self, username: str) -> Optional[dict]:
         """Get user information from users collection
@@ -86,19 +192,9 @@ class SolutionService:
         Returns:
             List of processed tag names
         """
-        formatted_tags = []
-        # Get unique tags first
-        unique_tags = list(set(tags))
-        for tag_name in unique_tags:
-            # Create tag if it doesn't exist
-            tag = await self.tag_service.get_tag_by_name(tag_name)
-            if not tag:
-                from app.models.tag import TagCreate
-
-                tag_create = TagCreate(name=tag_name, description=f"Tag for {tag_name}")
-                tag = await self.tag_service.create_tag(tag_create, username)
-            formatted_tags.append(tag.name)
-        return formatted_tags
+        # Resolve all tags in one query and create the missing ones in one bulk write
+        tags = await self.tag_service.ensure_tags(tags, username)
+        return [tag.name for tag in tags]
 
     async def _process_solution_update(
         self,
@@ -125,18 +221,15 @@ class SolutionService:
         if "tags" in update_dict:
             update_dict["tags"] = await self._process_tags(update_dict["tags"], username)
 
-        # Handle maintainer fields update
-        maintainer_fields = {"maintainer_id", "maintainer_name", "maintainer_email"}
-
         # Ensure maintainer_id is lowercase if provided
         if "maintainer_id" in update_dict and update_dict["maintainer_id"]:
             update_dict["maintainer_id"] = update_dict["maintainer_id"].lower()
 
         if existing_solution:
             # Check if existing solution has any maintainer field
-            has_existing_maintainer = any(getattr(existing_solution, field) for field in maintainer_fields)
+            has_existing_maintainer = any(getattr(existing_solution, field) for field in MAINTAINER_FIELDS)
 
-            has_maintainer_update = any(field in update_dict for field in maintainer_fields)
+            has_maintainer_update = any(field in update_dict for field in MAINTAINER_FIELDS)
 
             if not has_existing_maintainer and not has_maintainer_update and username:
                 # If no maintainer info exists and no update provided, use current user
@@ -184,24 +277,32 @@ class SolutionService:
             Number of solutions deleted
         """
         # Get solutions before deleting for history records
-        cursor = self.collection.find({"name": name})
-        solutions = [SolutionInDB(**solution) async for solution in cursor]
+        solutions = await self.collection.find({"name": name}, {"name": 1}).to_list(length=None)
 
         if not solutions:
             return 0
 
-        result = await self.collection.delete_many({"name": name})
+        solution_ids = [solution["_id"] for solution in solutions]
+        result = await self.collection.delete_many({"_id": {"$in": solution_ids}})
+        # Tag and group usage counts, the tech radar and suggestions are cached
+        await invalidate(TAGS_CACHE, GROUPS_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+        for solution_id in solution_ids:
+            self.search_index.remove_solution(solution_id)
 
-        # Record history for each deleted solution
-        for solution in solutions:
-            await self.history_service.record_object_change(
-                object_type="solution",
-                object_id=str(solution.id),
-                object_name=solution.name,
-                change_type=ChangeType.DELETE,
-                username=username or "system",
-                change_summary=f"Deleted solution '{solution.name}' as part of bulk delete by name",
-            )
+        # Record history for all deleted solutions with one write
+        await self.history_service.record_changes(
+            [
+                self.history_service.build_change_record(
+                    object_type="solution",
+                    object_id=str(solution["_id"]),
+                    object_name=solution["name"],
+                    change_type=ChangeType.DELETE,
+                    username=username or "system",
+                    change_summary=f"Deleted solution '{solution['name']}' as part of bulk delete by name",
+                )
+                for solution in solutions
+            ]
+        )
 
         return result.deleted_count
 
@@ -218,17 +319,88 @@ class SolutionService:
         Returns:
             List of updated solutions
         """
-        # Get all solutions with the same name
-        solutions = []
-        async for solution in self.collection.find({"name": name}):
-            solutions.append(SolutionInDB(**solution))
+        documents = await self.collection.find({"name": name}).to_list(length=None)
+        if not documents:
+            return []
+        solutions = [SolutionInDB(**document) for document in documents]
 
-        # Update each solution individually
-        updated_solutions = []
+        # Category, group and tags are processed once for all solutions
+        update_dict = solution_update.model_dump(exclude_unset=True)
+        shared_dict = dict(update_dict)
+        await self._process_solution_update(shared_dict, username)
+
+        # Solutions without maintainer info get the current user, as in update_solution
+        user = None
+        if username and not any(field in update_dict for field in MAINTAINER_FIELDS):
+            if any(not any(getattr(solution, field) for field in MAINTAINER_FIELDS) for solution in solutions):
+                user = await self._get_user_info(username)
+
+        set_dicts = []
         for solution in solutions:
-            updated = await self.update_solution(solution, solution_update, username)
-            if updated:
-                updated_solutions.append(updated)
+            set_dict = dict(shared_dict)
+            if user and not any(getattr(solution, field) for field in MAINTAINER_FIELDS):
+                set_dict["maintainer_id"] = username
+                set_dict["maintainer_name"] = user.get("full_name")
+                set_dict["maintainer_email"] = user.get("email")
+            if "recommend_status" in set_dict and set_dict["recommend_status"] != solution.recommend_status:
+                set_dict["recommen_status_updated_at"] = datetime.utcnow()
+            set_dicts.append(set_dict)
+
+        # Apply all updates with one bulk write; renamed solutions need distinct slugs, which are
+        # allocated again for the updates that lose their slug to a concurrent writer
+        pending = list(range(len(solutions)))
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            if "name" in update_dict:
+                base_slug = generate_slug(update_dict["name"])
+                taken_slugs = await self._taken_slugs(base_slug, [solutions[i].id for i in pending])
+                slugs = allocate_slugs(base_slug, [documents[i].get("slug") for i in pending], taken_slugs)
+                for i, slug in zip(pending, slugs):
+                    set_dicts[i]["slug"] = slug
+            try:
+                await self.collection.bulk_write(
+                    [UpdateOne({"_id": solutions[i].id}, {"$set": set_dicts[i]}) for i in pending], ordered=False
+                )
+                break
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                if (
+                    "name" not in update_dict
+                    or not all(_is_slug_write_conflict(error) for error in write_errors)
+                    or attempt == SLUG_ALLOCATION_ATTEMPTS - 1
+                ):
+                    raise
+                pending = [pending[error["index"]] for error in write_errors]
+
+        # Tag and group usage counts, the tech radar and suggestions are cached
+        await invalidate(TAGS_CACHE, GROUPS_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+
+        # The updated solutions are the fetched documents with the updates applied, no re-read needed
+        updated_solutions = []
+        history_records = []
+        for solution, document, set_dict in zip(solutions, documents, set_dicts):
+            updated_document = {**document, **set_dict}
+            updated_solution = SolutionInDB(**updated_document)
+            updated_solutions.append(updated_solution)
+            self.search_index.index_solution(updated_document)
+
+            old_values = {field: getattr(solution, field) for field in update_dict.keys()}
+            changed_fields = changed_solution_fields(old_values, set_dict)
+            if changed_fields:
+                has_status_change = any(field["field_name"] in STATUS_FIELDS for field in changed_fields)
+                history_records.append(
+                    self.history_service.build_change_record(
+                        object_type="solution",
+                        object_id=str(solution.id),
+                        object_name=updated_solution.name,
+                        change_type=ChangeType.UPDATE,
+                        username=username or "system",
+                        changed_fields=changed_fields,
+                        change_summary="Status changed" if has_status_change else None,
+                    )
+                )
+
+        # Record history for all updated solutions with one write
+        await self.history_service.record_changes(history_records)
 
         return updated_solutions
 
@@ -249,12 +421,32 @@ class SolutionService:
         if username:
             solution_dict["created_by"] = username
 
-        result = await self.collection.insert_one(solution_dict)
-        created_solution = await self.get_solution_by_id(str(result.inserted_id))
+        # Initialize materialized rating fields maintained by RatingService
+        solution_dict.update(RatingService.initial_rating_fields())
+
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            try:
+                result = await self.collection.insert_one(solution_dict)
+                break
+            except DuplicateKeyError as e:
+                # Another solution took the slug since it was allocated, allocate again
+                if not _is_slug_conflict(e) or attempt == SLUG_ALLOCATION_ATTEMPTS - 1:
+                    raise
+                solution_dict["slug"] = await self.ensure_unique_slug(base_slug)
+        # Tag and group usage counts, the tech radar and suggestions are cached
+        await invalidate(TAGS_CACHE, GROUPS_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+        self.search_index.index_solution(solution_dict)
+        # insert_one adds the generated _id to solution_dict
+        created_solution = SolutionInDB(**solution_dict)
 
         # Record history for creation
         if created_solution:
-            changed_fields = [{"field_name": k, "old_value": None, "new_value": v} for k, v in solution_dict.items()]
+            rating_fields = RatingService.initial_rating_fields()
+            changed_fields = [
+                {"field_name": k, "old_value": None, "new_value": v}
+                for k, v in solution_dict.items()
+                if k not in rating_fields
+            ]
             await self.history_service.record_object_change(
                 object_type="solution",
                 object_id=str(result.inserted_id),
@@ -274,7 +466,30 @@ class SolutionService:
             return SolutionInDB(**solution)
         return None
 
-    async def get_solutions(
+    def _parse_sort(self, sort: str) -> tuple[str, int]:
+        """Parse a sort parameter into a validated (field, direction) pair
+
+        Args:
+            sort: Sort field, prefixed with - for descending order
+
+        Returns:
+            Tuple of (sort_field, sort_direction)
+        """
+        sort_direction = ASCENDING
+
+        if sort.startswith("-"):
+            sort_field = sort[1:]  # Remove the minus sign
+            sort_direction = DESCENDING
+        else:
+            sort_field = sort
+
+        # Validate sort field
+        if sort_field not in VALID_SORT_FIELDS:
+            raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
+
+        return sort_field, sort_direction
+
+    async def _find_solutions(
         self,
         skip: int = 0,
         limit: int = 100,
@@ -286,8 +501,17 @@ class SolutionService:
         review_status: Optional[str] = None,
         tags: Optional[List[str]] = None,
         sort: str = "name",
-    ) -> List[SolutionInDB]:
-        """Get all solutions with filtering and pagination"""
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[int], Optional[str]]:
+        """Find a page of solution documents with filtering and sorting, with the filtered total
+
+        When a cursor is given, skip is ignored and the page starts after the cursor position.
+        The total is not counted in that case, so deep pages cost the same as the first one.
+
+        Returns:
+            Tuple of (page of solution documents, total number of solutions matching the filters
+            or None when paginating by cursor, cursor for the next page or None on the last page)
+        """
         query = {}
 
         # Add filters if provided
@@ -307,23 +531,78 @@ class SolutionService:
             # Match solutions that have all the specified tags
             query["tags"] = {"$all": tags}
 
-        # Parse sort parameter
-        sort_field = "name"
-        sort_direction = ASCENDING
+        sort_field, sort_direction = self._parse_sort(sort)
+        sort_spec = keyset_sort(sort_field, sort_direction)
+
+        if cursor:
+            query = apply_cursor(query, sort_field, sort_direction, cursor)
+            solutions = await self.collection.find(query).sort(sort_spec).limit(limit).to_list(length=limit)
+            return solutions, None, next_cursor(solutions, sort_field, limit)
+
+        # Unfiltered lists can use the collection metadata count instead of counting documents
+        estimated_total = not query and settings.SOLUTIONS_ESTIMATED_TOTAL_ENABLED
+        # The page goes into the one $facet output document, which is capped at 16 MB, so large pages
+        # and a limit of 0 (all remaining solutions, like cursor.limit(0)) are read through a cursor
+        if estimated_total or not limit or limit > FACET_PAGE_MAX_LIMIT:
+            find_cursor = self.collection.find(query, allow_disk_use=True).sort(sort_spec).skip(skip).limit(limit)
+            if estimated_total:
+                count = self.collection.estimated_document_count()
+            else:
+                count = self.collection.count_documents(query)
+            solutions, total = await asyncio.gather(find_cursor.to_list(length=limit or None), count)
+            return solutions, total, next_cursor(solutions, sort_field, limit)
+
+        # Sort before $facet so the sort can use an index (every sort key has one ending with _id); the
+        # page and the total come back together. A filter can still make the planner sort in memory,
+        # which may then spill to disk instead of failing at the 100 MB sort limit.
+        pipeline = [
+            {"$match": query},
+            {"$sort": dict(sort_spec)},
+            {"$facet": {"items": [{"$skip": skip}, {"$limit": limit}], "total": [{"$count": "count"}]}},
+        ]
+        result = await self.collection.aggregate(pipeline, allowDiskUse=True).to_list(length=1)
+        result = result[0] if result else {}
+        solutions = result.get("items", [])
+        total = result["total"][0]["count"] if result.get("total") else 0
+        return solutions, total, next_cursor(solutions, sort_field, limit)
 
-        if sort.startswith("-"):
-            sort_field = sort[1:]  # Remove the minus sign
-            sort_direction = DESCENDING
-        else:
-            sort_field = sort
+    async def get_solutions(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category: Optional[str] = None,
+        department: Optional[str] = None,
+        team: Optional[str] = None,
+        recommend_status: Optional[str] = None,
+        stage: Optional[str] = None,
+        review_status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        sort: str = "name",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SolutionInDB], Optional[int], Optional[str]]:
+        """Get solutions with filtering and pagination
 
-        # Validate sort field
-        if sort_field not in VALID_SORT_FIELDS:
-            raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
+        Args:
+            cursor: Cursor from a previous page to continue after, replaces skip
 
-        cursor = self.collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-        solutions = await cursor.to_list(length=limit)
-        return [SolutionInDB(**solution) for solution in solutions]
+        Returns:
+            Tuple of (page of solutions, total number of solutions matching the filters or None
+            when paginating by cursor, cursor for the next page or None on the last page)
+        """
+        solutions, total, next_page_cursor = await self._find_solutions(
+            skip=skip,
+            limit=limit,
+            category=category,
+            department=department,
+            team=team,
+            recommend_status=recommend_status,
+            stage=stage,
+            review_status=review_status,
+            tags=tags,
+            sort=sort,
+            cursor=cursor,
+        )
+        return [SolutionInDB(**solution) for solution in solutions], total, next_page_cursor
 
     async def get_solution_by_slug(self, slug: str) -> Optional[SolutionInDB]:
         """Get a solution by slug"""
@@ -333,20 +612,22 @@ class SolutionService:
         return None
 
     async def ensure_unique_slug(self, slug: str, exclude_id: Optional[str] = None) -> str:
-        """Ensure the slug is unique by appending a number if necessary"""
-        base_slug = slug
-        counter = 1
-        while True:
-            # Check if slug exists
-            query = {"slug": slug}
-            if exclude_id:
-                query["_id"] = {"$ne": ObjectId(exclude_id)}
-            existing = await self.collection.find_one(query)
-            if not existing:
-                return slug
-            # If exists, append counter and try again
-            slug = f"{base_slug}-{counter}"
-            counter += 1
+        """Ensure the slug is unique by appending a number if necessary
+
+        All taken variants of the slug are fetched in one query; the anchored prefix
+        regex uses the slug index. A concurrent writer can still take the returned slug,
+        so callers retry on a duplicate key error of the unique slug index.
+        """
+        exclude_ids = [ObjectId(exclude_id)] if exclude_id else []
+        return next_available_slug(slug, await self._taken_slugs(slug, exclude_ids))
+
+    async def _taken_slugs(self, slug: str, exclude_ids: List[ObjectId]) -> List[str]:
+        """Get the slug and its numbered variants that solutions other than exclude_ids have"""
+        query = {"slug": {"$regex": rf"^{re.escape(slug)}(-\d+)?$"}}
+        if exclude_ids:
+            query["_id"] = {"$nin": exclude_ids}
+        existing = await self.collection.find(query, {"slug": 1}).to_list(length=None)
+        return [doc["slug"] for doc in existing]
 
     async def update_solution(
         self,
@@ -389,52 +670,38 @@ class SolutionService:
         ):
             update_dict["recommen_status_updated_at"] = datetime.utcnow()
 
-        result = await self.collection.update_one({"_id": existing_solution.id}, {"$set": update_dict})
-        if result.modified_count:
-            updated_solution = await self.get_solution_by_id(str(existing_solution.id))
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            try:
+                updated_document = await self.collection.find_one_and_update(
+                    {"_id": existing_solution.id}, {"$set": update_dict}, return_document=ReturnDocument.AFTER
+                )
+                break
+            except DuplicateKeyError as e:
+                # Another solution took the slug since it was allocated, allocate again
+                if "slug" not in update_dict or not _is_slug_conflict(e) or attempt == SLUG_ALLOCATION_ATTEMPTS - 1:
+                    raise
+                update_dict["slug"] = await self.ensure_unique_slug(base_slug, str(existing_solution.id))
+        if updated_document:
+            # Tag and group usage counts, the tech radar and suggestions are cached
+            await invalidate(TAGS_CACHE, GROUPS_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+            updated_solution = SolutionInDB(**updated_document)
+            self.search_index.index_solution(updated_document)
 
             # Record history
-            if updated_solution:
-                # Remove fields that don't need to be tracked in history
-                history_update_dict = {
-                    k: v for k, v in update_dict.items() if k not in ["slug", "updated_at", "updated_by"]
-                }
-
-                # Record changes if there are any
-                if history_update_dict:
-                    changed_fields = []
-                    for field_name, new_value in history_update_dict.items():
-                        if field_name == "status_change_justifications":
-                            continue  # Skip this field for history tracking
-                        old_value = old_values.get(field_name)
-                        if old_value != new_value:
-                            field_data = {
-                                "field_name": field_name,
-                                "old_value": old_value,
-                                "new_value": new_value,
-                            }
-
-                            # Add status_change_justification for status fields if provided
-                            if field_name in ["recommend_status", "review_status"] and status_change_justifications:
-                                field_data["status_change_justification"] = status_change_justifications.get(field_name)
-
-                            changed_fields.append(field_data)
-
-                    if changed_fields:
-                        # Determine if any status fields were changed
-                        has_status_change = any(
-                            field["field_name"] in ["recommend_status", "review_status"] for field in changed_fields
-                        )
-
-                        await self.history_service.record_object_change(
-                            object_type="solution",
-                            object_id=str(existing_solution.id),
-                            object_name=updated_solution.name,
-                            change_type=ChangeType.UPDATE,
-                            username=username or "system",
-                            changed_fields=changed_fields,
-                            change_summary="Status changed" if has_status_change else None,
-                        )
+            changed_fields = changed_solution_fields(old_values, update_dict, status_change_justifications)
+            if changed_fields:
+                # Determine if any status fields were changed
+                has_status_change = any(field["field_name"] in STATUS_FIELDS for field in changed_fields)
+
+                await self.history_service.record_object_change(
+                    object_type="solution",
+                    object_id=str(existing_solution.id),
+                    object_name=updated_solution.name,
+                    change_type=ChangeType.UPDATE,
+                    username=username or "system",
+                    changed_fields=changed_fields,
+                    change_summary="Status changed" if has_status_change else None,
+                )
 
             return updated_solution
         return None
@@ -464,6 +731,9 @@ class SolutionService:
         result = await self.collection.delete_one({"_id": ObjectId(solution_id)})
 
         if result.deleted_count > 0:
+            # Tag and group usage counts, the tech radar and suggestions are cached
+            await invalidate(TAGS_CACHE, GROUPS_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+            self.search_index.remove_solution(solution_id)
             # Record deletion in history
             await self.history_service.record_object_change(
                 object_type="solution",
@@ -486,6 +756,9 @@ class SolutionService:
         result = await self.collection.delete_one({"slug": slug})
 
         if result.deleted_count > 0:
+            # Tag and group usage counts, the tech radar and suggestions are cached
+            await invalidate(TAGS_CACHE, GROUPS_CACHE, TECH_RADAR_CACHE, SUGGEST_CACHE)
+            self.search_index.remove_solution(solution.id)
             # Record deletion in history
             await self.history_service.record_object_change(
                 object_type="solution",
@@ -513,6 +786,16 @@ class SolutionService:
             logger.error(f"Error getting departments: {str(e)}")
             raise
 
+    async def get_teams(self) -> List[str]:
+        """Get all unique team names from solutions"""
+        teams = await self.collection.distinct("team")
+        return sorted([team for team in teams if team])
+
+    async def get_approved_solution_names(self) -> List[str]:
+        """Get the unique names of approved solutions"""
+        names = await self.collection.distinct("name", {"review_status": "APPROVED"})
+        return sorted([name for name in names if name])
+
     async def get_solutions_with_ratings(
         self,
         skip: int = 0,
@@ -525,9 +808,21 @@ class SolutionService:
         review_status: Optional[str] = None,
         tags: Optional[List[str]] = None,
         sort: str = "name",
-    ) -> List[Solution]:
-        """Get solutions with ratings"""
-        solutions = await self.get_solutions(
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Solution], Optional[int], Optional[str]]:
+        """Get solutions with ratings
+
+        Rating fields are materialized on the solution documents by RatingService,
+        so no rating lookups are needed here.
+
+        Args:
+            cursor: Cursor from a previous page to continue after, replaces skip
+
+        Returns:
+            Tuple of (page of solutions, total number of solutions matching the filters or None
+            when paginating by cursor, cursor for the next page or None on the last page)
+        """
+        solutions, total, next_page_cursor = await self._find_solutions(
             skip=skip,
             limit=limit,
             category=category,
@@ -538,57 +833,34 @@ class SolutionService:
             review_status=review_status,
             tags=tags,
             sort=sort,
+            cursor=cursor,
         )
-
-        # Convert to Solution model and add ratings
-        result = []
-        for solution_in_db in solutions:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution_in_db.model_dump()
-            rating_summary = await self.rating_service.get_rating_summary(solution_in_db.slug)
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            result.append(Solution(**solution_dict))
-
-        return result
+        return [Solution(**solution) for solution in solutions], total, next_page_cursor
 
     async def get_solution_by_id_with_rating(self, solution_id: str) -> Optional[Solution]:
         """Get a solution by ID with rating"""
-        solution = await self.get_solution_by_id(solution_id)
+        solution = await self.collection.find_one({"_id": ObjectId(solution_id)})
         if solution:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution.model_dump()
-            rating_summary = await self.rating_service.get_rating_summary(solution.slug)
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            return Solution(**solution_dict)
+            return Solution(**solution)
         return None
 
     async def get_solution_by_slug_with_rating(self, slug: str) -> Optional[Solution]:
         """Get a solution by slug with rating"""
-        solution = await self.get_solution_by_slug(slug)
+        solution = await self.collection.find_one({"slug": slug})
         if solution:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution.model_dump()
-            rating_summary = await self.rating_service.get_rating_summary(solution.slug)
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            return Solution(**solution_dict)
+            return Solution(**solution)
         return None
 
     async def get_solution_by_name_with_rating(self, name: str) -> Optional[Solution]:
         """Get a solution by name with rating"""
         solution = await self.collection.find_one({"name": name})
         if solution:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution
-            rating_summary = await self.rating_service.get_rating_summary(solution["slug"])
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            return Solution(**solution_dict)
+            return Solution(**solution)
         return None
 
-    async def search_solutions(self, keyword: str) -> List[Solution]:
+    async def search_solutions(
+        self, keyword: str, skip: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[Solution], int, Dict[str, Dict[str, int]]]:
         """Search solutions by keyword using text similarity
         Searches across:
         - name (highest weight)
@@ -599,84 +871,73 @@ class SolutionService:
         - team
         - maintainer_name
         - pros and cons
-        Returns all approved matches sorted by recommend_status (ADOPT first) and then by text relevance score
-        """
-        # Create text index with field weights if it doesn't exist
-        await self.collection.create_index(
-            [
-                ("name", "text"),
-                ("brief", "text"),
-                ("description", "text"),
-                ("category", "text"),
-                ("department", "text"),
-                ("team", "text"),
-                ("maintainer_name", "text"),
-                ("pros", "text"),
-                ("cons", "text"),
-            ],
-            weights={
-                "name": 10,  # Highest priority
-                "brief": 8,  # Second priority
-                "description": 5,  # Third priority
-                "category": 3,
-                "department": 3,
-                "team": 3,
-                "maintainer_name": 2,
-                "pros": 1,
-                "cons": 1,
-            },
-        )
+        Approved matches are sorted by recommend_status (ADOPT first), then by rating and then by text score.
+        Relies on the weighted text index declared in app.core.indexes
 
-        # Create index for recommend_status for faster sorting
-        await self.collection.create_index([("recommend_status", 1)])
+        Args:
+            keyword: The search keyword
+            skip: Number of matches to skip
+            limit: Maximum number of matches to return, None for all matches
 
-        # Perform text search with simple match
-        pipeline = [{"$match": {"$text": {"$search": keyword}, "review_status": "APPROVED"}}]
+        Returns:
+            Tuple of (page of matching solutions, total number of matches, facet counts). Facet counts map
+            each of category, department, tags and recommend_status to {value: count}, most common first.
+        """
+        page = [
+            # Recommend status first (ADOPT first, unknown last), then rating, then relevance
+            {"$sort": {"status_order": 1, "rating": -1, "score": -1}},
+            {"$skip": skip},
+        ]
+        if limit:
+            page.append({"$limit": limit})
+        page.append({"$project": {"status_order": 0, "score": 0}})
+
+        # A page goes into the one $facet output document, which is capped at 16 MB, so large pages and
+        # all matches (no limit) are streamed through a separate cursor
+        in_facet = bool(limit) and limit <= FACET_PAGE_MAX_LIMIT
+        facet_stages = {"items": page} if in_facet else {}
+        facet_stages["total"] = [{"$count": "count"}]
+        for field in SEARCH_FACET_FIELDS:
+            # Tags are an array, so count each tag of a solution separately
+            stages = [{"$unwind": "$tags"}] if field == "tags" else []
+            stages.append({"$group": {"_id": f"${field}", "count": {"$sum": 1}}})
+            stages.append({"$sort": {"count": -1, "_id": 1}})
+            facet_stages[field] = stages
+
+        matches = [
+            {"$match": {"$text": {"$search": keyword}, "review_status": "APPROVED"}},
+            {
+                "$addFields": {
+                    "score": {"$meta": "textScore"},
+                    "status_order": {"$indexOfArray": [RECOMMEND_STATUS_ORDER, "$recommend_status"]},
+                }
+            },
+            {
+                "$addFields": {
+                    "status_order": {
+                        "$cond": [{"$lt": ["$status_order", 0]}, len(RECOMMEND_STATUS_ORDER), "$status_order"]
+                    }
+                }
+            },
+        ]
 
-        solutions = await self.collection.aggregate(pipeline).to_list(length=None)
+        if in_facet:
+            result = await self.collection.aggregate(matches + [{"$facet": facet_stages}]).to_list(length=1)
+            items = result[0]["items"] if result else []
+        else:
+            items, result = await asyncio.gather(
+                self.collection.aggregate(matches + page, allowDiskUse=True).to_list(length=None),
+                self.collection.aggregate(matches + [{"$facet": facet_stages}]).to_list(length=1),
+            )
+        result = result[0] if result else {}
 
-        # Group solutions by recommend status and add ratings
-        adopt_solutions = []
-        trial_solutions = []
-        assess_solutions = []
-        hold_solutions = []
-        exit_solutions = []
-        other_solutions = []
-
-        # Add ratings and group by status
-        for solution in solutions:
-            rating_summary = await self.rating_service.get_rating_summary(solution["slug"])
-            solution["rating"] = rating_summary["average"]
-            solution["rating_count"] = rating_summary["count"]
-            solution_obj = Solution(**solution)
-
-            # Group by recommendation status
-            if solution["recommend_status"] == "ADOPT":
-                adopt_solutions.append(solution_obj)
-            elif solution["recommend_status"] == "TRIAL":
-                trial_solutions.append(solution_obj)
-            elif solution["recommend_status"] == "ASSESS":
-                assess_solutions.append(solution_obj)
-            elif solution["recommend_status"] == "HOLD":
-                hold_solutions.append(solution_obj)
-            elif solution["recommend_status"] == "EXIT":
-                exit_solutions.append(solution_obj)
-            else:
-                other_solutions.append(solution_obj)
-
-        # Sort each group by rating
-        for solutions_list in [
-            adopt_solutions,
-            trial_solutions,
-            assess_solutions,
-            hold_solutions,
-            exit_solutions,
-            other_solutions,
-        ]:
-            solutions_list.sort(key=lambda x: (x.rating or 0), reverse=True)
-
-        # Combine all groups maintaining order by status
-        return adopt_solutions + trial_solutions + assess_solutions + hold_solutions + exit_solutions + other_solutions
+        solutions = [Solution(**solution) for solution in items]
+        total = result["total"][0]["count"] if result.get("total") else 0
+        facets = {
+            field: {bucket["_id"]: bucket["count"] for bucket in result.get(field, []) if bucket["_id"]}
+            for field in SEARCH_FACET_FIELDS
+        }
+        return solutions, total, facets
 
     async def get_user_solutions(
         self, username: str, skip: int = 0, limit: int = 100, sort: str = "name"
@@ -695,34 +956,11 @@ class SolutionService:
         # Query for solutions where user is creator or maintainer
         query = {"$or": [{"created_by": username}, {"maintainer_id": username}]}
 
-        # Parse sort parameter
-        sort_field = "name"
-        sort_direction = ASCENDING
-
-        if sort.startswith("-"):
-            sort_field = sort[1:]  # Remove the minus sign
-            sort_direction = DESCENDING
-        else:
-            sort_field = sort
-
-        # Validate sort field
-        if sort_field not in VALID_SORT_FIELDS:
-            raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
+        sort_field, sort_direction = self._parse_sort(sort)
 
         cursor = self.collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
         solutions = await cursor.to_list(length=limit)
-
-        # Convert to Solution model and add ratings
-        result = []
-        for solution in solutions:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution
-            rating_summary = await self.rating_service.get_rating_summary(solution["slug"])
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            result.append(Solution(**solution_dict))
-
-        return result
+        return [Solution(**solution) for solution in solutions]
 
     async def count_user_solutions(self, username: str) -> int:
         """Get total number of solutions created by or maintained by the user"""
@@ -744,3 +982,9 @@ class SolutionService:
             return True
 
         return solution.created_by == username or solution.maintainer_id == username
+
+
+@lru_cache
+def get_solution_service() -> SolutionService:
+    """Get the application-scoped SolutionService instance"""
+    return SolutionService()
@@ -0,0 +1,140 @@
+import asyncio
+import heapq
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from cachetools import LRUCache
+
+from app.core.cache import SUGGEST_CACHE, get_cache
+from app.models.suggest import Suggestion
+from app.services.category_service import get_category_service
+from app.services.solution_service import get_solution_service
+from app.services.tag_service import get_tag_service
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Suggestions of earlier types rank first among otherwise equal matches
+SUGGESTION_TYPE_ORDER = ["solution", "category", "tag", "department", "team"]
+
+# Upper bound for the number of distinct values loaded per source
+MAX_SOURCE_VALUES = 10000
+
+
+class SuggestIndex:
+    """Immutable prefix index over short values, backed by one sorted array.
+
+    Every value is indexed from the start of each of its words, so "kube" completes
+    both "Kubernetes" and "Azure Kubernetes Service". Completions are ranked by whether
+    the match starts the value, then by type, then by weight and length.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, int]], memo_size: int = 4096):
+        """
+        Args:
+            entries: (text, type, weight) tuples; a higher weight ranks higher
+            memo_size: Number of recent completions to remember
+        """
+        rows = []
+        for text, kind, weight in entries:
+            lowered = text.lower()
+            rank = SUGGESTION_TYPE_ORDER.index(kind)
+            for word in WORD_PATTERN.finditer(lowered):
+                start = word.start()
+                rows.append((lowered[start:], (start > 0, rank, -weight, len(text), text), kind, text))
+        rows.sort(key=lambda row: row[0])
+
+        self._keys = [row[0] for row in rows]
+        self._rows = [row[1:] for row in rows]
+        self._memo: LRUCache = LRUCache(maxsize=memo_size)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """Get the best completions of a prefix
+
+        Args:
+            prefix: The typed text, matched case-insensitively
+            limit: Maximum number of completions to return
+
+        Returns:
+            List of (text, type) pairs, best first
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+
+        memo_key = (prefix, limit)
+        completions = self._memo.get(memo_key)
+        if completions is not None:
+            return completions
+
+        # Keep the best-ranked row of each value that has several matching words
+        best: Dict[Tuple[str, str], tuple] = {}
+        position = bisect_left(self._keys, prefix)
+        while position < len(self._keys) and self._keys[position].startswith(prefix):
+            sort_key, kind, text = self._rows[position]
+            current = best.get((kind, text))
+            if current is None or sort_key < current:
+                best[(kind, text)] = sort_key
+            position += 1
+
+        ranked = heapq.nsmallest(limit, best.items(), key=lambda item: item[1])
+        completions = [(text, kind) for (kind, text), _ in ranked]
+        self._memo[memo_key] = completions
+        return completions
+
+
+class SuggestService:
+    def __init__(self):
+        self.solution_service = get_solution_service()
+        self.category_service = get_category_service()
+        self.tag_service = get_tag_service()
+        # Holds the current SuggestIndex, invalidated on solution, tag and category writes
+        self.suggest_cache = get_cache(SUGGEST_CACHE, maxsize=1, ttl=600)
+        self._build_lock = asyncio.Lock()
+
+    async def _build_index(self) -> SuggestIndex:
+        """Build the suggest index from solutions, tags, categories, departments and teams"""
+        tags = await self.tag_service.get_tags(limit=MAX_SOURCE_VALUES)
+        categories = await self.category_service.get_categories(limit=MAX_SOURCE_VALUES, sort="name")
+
+        entries = [(name, "solution", 0) for name in await self.solution_service.get_approved_solution_names()]
+        entries += [(category.name, "category", 0) for category in categories]
+        entries += [(tag.name, "tag", tag.usage_count) for tag in tags]
+        entries += [(department, "department", 0) for department in await self.solution_service.get_departments()]
+        entries += [(team, "team", 0) for team in await self.solution_service.get_teams()]
+        return SuggestIndex(entries)
+
+    async def get_index(self) -> SuggestIndex:
+        """Get the current suggest index, building it if it was invalidated"""
+        index = self.suggest_cache.get("index")
+        if index is None:
+            # Only one request rebuilds the index, the others wait for it
+            async with self._build_lock:
+                index = self.suggest_cache.get("index")
+                if index is None:
+                    index = await self._build_index()
+                    self.suggest_cache["index"] = index
+        return index
+
+    async def suggest(self, q: str, limit: int = 10) -> List[Suggestion]:
+        """Get autocomplete suggestions for the typed text
+
+        Args:
+            q: The typed text
+            limit: Maximum number of suggestions to return
+
+        Returns:
+            List of suggestions, best first
+        """
+        index = await self.get_index()
+        return [Suggestion(text=text, type=kind) for text, kind in index.complete(q, limit)]
+
+
+@lru_cache
+def get_suggest_service() -> SuggestService:
+    """Get the application-scoped SuggestService instance"""
+    return SuggestService()
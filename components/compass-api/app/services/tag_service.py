@@ -1,19 +1,24 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 from bson import ObjectId
-from cachetools import TTLCache, keys
+from cachetools import keys
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
+from app.core.cache import SUGGEST_CACHE, TAGS_CACHE, get_cache, invalidate
 from app.core.database import get_database
 from app.models.tag import Tag, TagCreate, TagInDB, TagUpdate, format_tag_name
+from app.services.search_index import get_search_index
 
 
 class TagService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.tags
-        # Create a cache with 1-hour TTL
-        self.tags_cache = TTLCache(maxsize=100, ttl=3600)
+        # Process-wide cache with 1-hour TTL, shared by all instances and invalidated on writes
+        self.tags_cache = get_cache(TAGS_CACHE, maxsize=100, ttl=3600)
 
     async def create_tag(self, tag: TagCreate, username: Optional[str] = None) -> TagInDB:
         """Create a new tag"""
@@ -35,7 +40,7 @@ class TagService:
 
         result = await self.collection.insert_one(tag_dict)
         # Clear cache since data has been updated
-        self.tags_cache.clear()
+        await invalidate(TAGS_CACHE, SUGGEST_CACHE)
         return await self.get_tag_by_id(str(result.inserted_id))
 
     async def get_tag_by_id(self, tag_id: str) -> Optional[TagInDB]:
@@ -57,6 +62,69 @@ class TagService:
             return TagInDB(**tag)
         return None
 
+    async def get_tags_by_names(self, names: List[str]) -> List[TagInDB]:
+        """Get the existing tags of several names in a single query
+
+        Args:
+            names: Tag names, formatted before matching
+
+        Returns:
+            The existing tags in the order of their first name, duplicates removed
+        """
+        formatted_names = list(dict.fromkeys(format_tag_name(name) for name in names))
+        docs = await self.collection.find({"name": {"$in": formatted_names}}).to_list(length=None)
+        tags_by_name = {doc["name"]: TagInDB(**doc) for doc in docs}
+        return [tags_by_name[name] for name in formatted_names if name in tags_by_name]
+
+    async def ensure_tags(self, names: List[str], username: Optional[str] = None) -> List[TagInDB]:
+        """Get the tags of several names, creating the missing ones
+
+        Missing tags are created with one unordered bulk upsert. The unique index on the tag
+        name makes concurrent writers creating the same tag converge on a single document.
+
+        Args:
+            names: Tag names, formatted before use; names that format to nothing are skipped
+            username: The username creating missing tags
+
+        Returns:
+            The tags in the order of their first name, duplicates removed
+        """
+        formatted_names = [name for name in dict.fromkeys(format_tag_name(name) for name in names) if name]
+        if not formatted_names:
+            return []
+
+        tags = await self.get_tags_by_names(formatted_names)
+        existing_names = {tag.name for tag in tags}
+        missing_names = [name for name in formatted_names if name not in existing_names]
+        if not missing_names:
+            return tags
+
+        now = datetime.utcnow()
+        operations = []
+        for name in missing_names:
+            tag_dict = {
+                "name": name,
+                "description": f"Tag for {name}",
+                "created_at": now,
+                "updated_at": now,
+                "usage_count": 0,
+            }
+            if username:
+                tag_dict["created_by"] = username
+                tag_dict["updated_by"] = username
+            operations.append(UpdateOne({"name": name}, {"$setOnInsert": tag_dict}, upsert=True))
+
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # A concurrent writer inserted the same tag between our upsert's match and insert
+            if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+                raise
+        # Clear cache since data has been updated
+        await invalidate(TAGS_CACHE, SUGGEST_CACHE)
+
+        return await self.get_tags_by_names(formatted_names)
+
     async def get_tag_usage_counts(self, tag_names: List[str] = None) -> dict:
         """Get usage counts for multiple tags in a single query
 
@@ -180,12 +248,13 @@ class TagService:
 
             # Then remove the source tag
             await self.db.solutions.update_many({"tags": source_tag.name}, {"$pull": {"tags": source_tag.name}})
+            await get_search_index().refresh_solutions({"tags": target_tag.name})
 
             # Delete the source tag
             await self.collection.delete_one({"_id": ObjectId(source_tag_id)})
 
             # Clear cache since data has been updated
-            self.tags_cache.clear()
+            await invalidate(TAGS_CACHE, SUGGEST_CACHE)
 
             # Return the target tag
             return target_tag
@@ -227,6 +296,7 @@ class TagService:
                             }
                         },
                     )
+                    await get_search_index().refresh_solutions({"tags": update_dict["name"]})
 
             # Update the tag itself
             update_dict["updated_at"] = datetime.utcnow()
@@ -235,7 +305,7 @@ class TagService:
 
             result = await self.collection.update_one({"_id": ObjectId(tag_id)}, {"$set": update_dict})
             # Clear cache since data has been updated
-            self.tags_cache.clear()
+            await invalidate(TAGS_CACHE, SUGGEST_CACHE)
             if result.modified_count:
                 return await self.get_tag_by_id(tag_id)
             return None
@@ -256,6 +326,12 @@ class TagService:
             if not tag:
                 return False
 
+            # The solutions no longer match the tag once it is removed, so find them for the search index first
+            search_index = get_search_index()
+            solution_ids = []
+            if search_index.active:
+                solution_ids = await self.db.solutions.distinct("_id", {"tags": tag.name})
+
             # Remove tag from all solutions that use it
             await self.db.solutions.update_many(
                 {"tags": tag.name},
@@ -264,11 +340,13 @@ class TagService:
                     "$set": {"updated_at": datetime.utcnow(), "updated_by": "system"},
                 },
             )
+            if solution_ids:
+                await search_index.refresh_solutions({"_id": {"$in": solution_ids}})
 
             # Delete the tag
             result = await self.collection.delete_one({"_id": object_id})
             # Clear cache since data has been updated
-            self.tags_cache.clear()
+            await invalidate(TAGS_CACHE, SUGGEST_CACHE)
             return result.deleted_count > 0
         except ValueError as e:
             raise e
@@ -320,6 +398,10 @@ class TagService:
             return False
 
         result = await self.db.solutions.update_one({"slug": solution_slug}, {"$addToSet": {"tags": formatted_name}})
+        if result.modified_count:
+            # Usage counts of cached tags have changed
+            await invalidate(TAGS_CACHE, SUGGEST_CACHE)
+            await get_search_index().refresh_solution(solution_slug)
         return result.modified_count > 0
 
     async def remove_solution_tag_by_name(self, solution_slug: str, name: str) -> bool:
@@ -338,6 +420,10 @@ class TagService:
             return False
 
         result = await self.db.solutions.update_one({"slug": solution_slug}, {"$pull": {"tags": formatted_name}})
+        if result.modified_count:
+            # Usage counts of cached tags have changed
+            await invalidate(TAGS_CACHE, SUGGEST_CACHE)
+            await get_search_index().refresh_solution(solution_slug)
         return result.modified_count > 0
 
     async def count_tags(self, show_all: bool = False) -> int:
@@ -360,3 +446,9 @@ class TagService:
 
         # Count tags with usage > 0
         return len([count for count in usage_counts.values() if count > 0])
+
+
+@lru_cache
+def get_tag_service() -> TagService:
+    """Get the application-scoped TagService instance"""
+    return TagService()
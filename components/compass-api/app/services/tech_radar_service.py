@@ -1,17 +1,57 @@
-from datetime import datetime
-from typing import Dict, List
+import hashlib
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
 
+from cachetools import keys
+
+from app.core.cache import TECH_RADAR_CACHE, get_cache
 from app.core.database import get_database
-from app.models.category import CategoryInDB
-from app.models.solution import RecommendStatusEnum
 from app.models.tech_radar import TechRadarData, TechRadarEntry
 
+# Recommend statuses in ring order, from innermost (0) to outermost (4)
+RADAR_RINGS = ["ADOPT", "TRIAL", "ASSESS", "HOLD", "EXIT"]
+NEW_ENTRY_DAYS = 14
+
+
+class TechRadarSnapshot(NamedTuple):
+    """Precomputed tech radar payload with its HTTP validators"""
+
+    body: bytes
+    etag: str
+    last_modified: datetime
+
 
 class TechRadarService:
     def __init__(self):
         self.db = get_database()
         self.solutions = self.db.solutions
         self.categories = self.db.categories
+        # Process-wide cache invalidated on solution, category and group writes.
+        # The 1-hour TTL lets the 14-day "new" flags and the radar date age out.
+        self.radar_cache = get_cache(TECH_RADAR_CACHE, maxsize=100, ttl=3600)
+
+    async def get_tech_radar_snapshot(self, group: Optional[str] = None) -> TechRadarSnapshot:
+        """Get the serialized tech radar payload for a group, building it on a cache miss
+
+        Args:
+            group: Optional group name to filter solutions by group
+
+        Returns:
+            The cached snapshot with its JSON body, ETag and last modified time
+        """
+        cache_key = keys.hashkey(group)
+        snapshot = self.radar_cache.get(cache_key)
+        if snapshot is None:
+            radar_data = await self.get_tech_radar_data(group=group)
+            body = radar_data.model_dump_json().encode()
+            snapshot = TechRadarSnapshot(
+                body=body,
+                etag=f'"{hashlib.sha1(body).hexdigest()}"',
+                last_modified=datetime.utcnow().replace(microsecond=0),
+            )
+            self.radar_cache[cache_key] = snapshot
+        return snapshot
 
     async def get_tech_radar_data(self, group: str = None) -> TechRadarData:
         """Generate tech radar data from approved solutions.
@@ -25,55 +65,40 @@ class TechRadarService:
         if group:
             query["group"] = group
 
-        # Get solutions matching query
-        cursor = self.solutions.find(query)
-
-        # Status to ring mapping (0-based index)
-        status_to_ring: Dict[RecommendStatusEnum, int] = {
-            "ADOPT": 0,
-            "TRIAL": 1,
-            "ASSESS": 2,
-            "HOLD": 3,
-            "EXIT": 4,
-        }
-
-        entries: List[TechRadarEntry] = []
-        async for solution in cursor:
-            # Get category information
-            category_data = await self.categories.find_one({"name": solution["category"]})
-            if not category_data:
-                continue  # Skip if category not found
-
-            # Parse category data using CategoryInDB model
-            category = CategoryInDB(**category_data)
-
-            # Skip if radar_quadrant is negative
-            if category.radar_quadrant < 0:
-                continue
-
-            # Logic: prioritize recommen_status_updated_at, then created_at
-            is_new_or_recommend_status_changed = False
-            now = datetime.utcnow()
-            rs_updated_at = solution.get("recommen_status_updated_at")
-            if rs_updated_at:
-                if (now - rs_updated_at).days < 14:
-                    is_new_or_recommend_status_changed = True
-            else:
-                created_at = solution.get("created_at")
-                if created_at and (now - created_at).days < 14:
-                    is_new_or_recommend_status_changed = True
-
-            # Create radar entry
-            entry = TechRadarEntry(
-                quadrant=category.radar_quadrant,
-                ring=status_to_ring[solution["recommend_status"]],
-                label=solution["name"],
-                link=f"/tech-radar/items/{solution.get('slug', '')}",
-                active=True,
-                moved=0,
-                is_new_or_recommend_status_changed=is_new_or_recommend_status_changed,
-            )
-            entries.append(entry)
+        # Solutions whose recommend status changed (or, if never changed, that were
+        # created) after this cutoff are flagged as new on the radar
+        new_since = datetime.utcnow() - timedelta(days=NEW_ENTRY_DAYS)
+
+        pipeline = [
+            {"$match": query},
+            # Join each solution to its category once, server-side
+            {
+                "$lookup": {
+                    "from": "categories",
+                    "localField": "category",
+                    "foreignField": "name",
+                    "as": "category_doc",
+                }
+            },
+            {"$unwind": "$category_doc"},
+            {"$match": {"category_doc.radar_quadrant": {"$gte": 0}}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "quadrant": "$category_doc.radar_quadrant",
+                    "ring": {"$indexOfArray": [RADAR_RINGS, "$recommend_status"]},
+                    "label": "$name",
+                    "link": {"$concat": ["/tech-radar/items/", {"$ifNull": ["$slug", ""]}]},
+                    "is_new_or_recommend_status_changed": {
+                        "$gt": [{"$ifNull": ["$recommen_status_updated_at", "$created_at"]}, new_since]
+                    },
+                }
+            },
+            # Skip solutions with an unknown recommend status
+            {"$match": {"ring": {"$gte": 0}}},
+        ]
+
+        entries: List[TechRadarEntry] = [TechRadarEntry(**entry) async for entry in self.solutions.aggregate(pipeline)]
 
         # Create and return radar data with current date
         return TechRadarData.create_current(entries)
@@ -101,12 +126,10 @@ class TechRadarService:
 
     def get_radar_rings(self) -> List[Dict[str, str]]:
         """Get radar rings in order (ADOPT, TRIAL, ASSESS, HOLD, EXIT)."""
-        # Define rings in order from innermost to outermost
-        rings = [
-            "ADOPT",  # Innermost ring (0)
-            "TRIAL",  # (1)
-            "ASSESS",  # (2)
-            "HOLD",  # (3)
-            "EXIT",  # Outermost ring (4)
-        ]
-        return [{"name": ring} for ring in rings]
+        return [{"name": ring} for ring in RADAR_RINGS]
+
+
+@lru_cache
+def get_tech_radar_service() -> TechRadarService:
+    """Get the application-scoped TechRadarService instance"""
+    return TechRadarService()
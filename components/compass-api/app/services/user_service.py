@@ -1,22 +1,87 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
-import httpx
 from cachetools import TTLCache, keys
 from fastapi import HTTPException, status
-
+from pymongo import ASCENDING
+
+from app.core.cache import (
+    LOGINS_CACHE,
+    PRINCIPALS_CACHE,
+    USER_PROFILES_CACHE,
+    clear_local_entry,
+    get_cache,
+    invalidate,
+)
 from app.core.config import settings
+from app.core.http_client import shared_http_client
 from app.core.mongodb import get_database
-from app.core.password import get_password_hash, verify_password
+from app.core.pagination import apply_cursor, keyset_sort, next_cursor
+from app.core.password import get_password_hash_async, verify_password_async
 from app.models.user import User, UserCreate, UserInDB, UserPasswordUpdate, UserUpdate
 
+logger = logging.getLogger(__name__)
+
+
+class Avatar(NamedTuple):
+    """Avatar image with its HTTP validator"""
+
+    content: bytes
+    media_type: str
+    etag: str
+
+
+def avatar_color(username: str) -> str:
+    """Get the background color of a generated avatar, derived from a stable hash of the username"""
+    return f"#{int(hashlib.sha256(username.encode()).hexdigest(), 16) % 0xFFFFFF:06x}"
+
+
+def _make_avatar(content: Union[bytes, str], media_type: str) -> Avatar:
+    if isinstance(content, str):
+        content = content.encode()
+    return Avatar(content=content, media_type=media_type, etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+
+
+def _read_disk_avatar(path: str) -> Optional[Tuple[bytes, str]]:
+    """Read an avatar file written by _write_disk_avatar, None if missing or older than the cache TTL"""
+    try:
+        if time.time() - os.path.getmtime(path) > settings.AVATAR_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "rb") as file:
+            media_type, content = file.read().split(b"\n", 1)
+    except (OSError, ValueError):
+        return None
+    return content, media_type.decode()
+
+
+def _write_disk_avatar(path: str, content: bytes, media_type: str) -> None:
+    """Write an avatar file as its media type line followed by the content"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(media_type.encode() + b"\n" + content)
+    # Replace atomically so concurrent readers never see a partial file
+    os.replace(temp_path, path)
+
 
 class UserService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.users
-        # Create a cache with 1-day TTL (86400 seconds)
-        self.avatar_cache = TTLCache(maxsize=1000, ttl=86400)
+        # Least recently used avatars are evicted once their total size exceeds AVATAR_CACHE_MAX_BYTES
+        self.avatar_cache = TTLCache(
+            maxsize=settings.AVATAR_CACHE_MAX_BYTES,
+            ttl=settings.AVATAR_CACHE_TTL_SECONDS,
+            getsizeof=lambda avatar: len(avatar.content),
+        )
+        # Process-wide username -> full name cache for author names on listings, invalidated on user writes
+        self.full_name_cache = get_cache(USER_PROFILES_CACHE, maxsize=5000, ttl=300)
 
     async def _get_user_or_404(self, username: str) -> UserInDB:
         """Get a user by username or raise 404 if not found."""
@@ -97,7 +162,7 @@ class UserService:
     async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Authenticate a user."""
         user = await self.get_user_by_username(username)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             return None
         return User.model_validate(user)
 
@@ -108,7 +173,8 @@ class UserService:
         username: Optional[str] = None,
         is_active: Optional[bool] = None,
         is_superuser: Optional[bool] = None,
-    ) -> list[User]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[list[User], Optional[str]]:
         """Get all users with pagination and filtering.
 
         Args:
@@ -117,9 +183,10 @@ class UserService:
             username: Optional filter by username (case-insensitive partial match)
             is_active: Optional filter by active status
             is_superuser: Optional filter by superuser status
+            cursor: Optional cursor from a previous page to continue after, replaces skip
 
         Returns:
-            List of matching users
+            Tuple of (matching users, cursor for the next page or None on the last page)
         """
         # Build query
         query = {}
@@ -130,11 +197,13 @@ class UserService:
         if is_superuser is not None:
             query["is_superuser"] = is_superuser
 
-        cursor = self.collection.find(query).sort("username", 1).skip(skip).limit(limit)
-        users = []
-        async for user_dict in cursor:
-            users.append(User(**user_dict))
-        return users
+        find_cursor = self.collection.find(apply_cursor(query, "username", ASCENDING, cursor))
+        find_cursor = find_cursor.sort(keyset_sort("username", ASCENDING)).limit(limit)
+        if not cursor:
+            find_cursor = find_cursor.skip(skip)
+        documents = await find_cursor.to_list(length=limit)
+        users = [User(**user_dict) for user_dict in documents]
+        return users, next_cursor(documents, "username", limit)
 
     async def get_user_for_api(self, username: str) -> Optional[User]:
         """Get a user by username for API response."""
@@ -153,7 +222,7 @@ class UserService:
             {
                 "created_at": datetime.utcnow(),
                 "updated_at": datetime.utcnow(),
-                "hashed_password": get_password_hash(user.password) if user.password else "",
+                "hashed_password": await get_password_hash_async(user.password) if user.password else "",
             }
         )
 
@@ -180,18 +249,19 @@ class UserService:
                 detail="External users cannot change their password",
             )
 
-        if not verify_password(password_update.current_password, user.hashed_password):
+        if not await verify_password_async(password_update.current_password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Current password is incorrect",
             )
 
         update_data = self._prepare_update_data(
-            {"hashed_password": get_password_hash(password_update.new_password)},
+            {"hashed_password": await get_password_hash_async(password_update.new_password)},
             current_username,
         )
 
         result = await self.collection.update_one({"username": username}, {"$set": update_data})
+        clear_local_entry(PRINCIPALS_CACHE, username)
         return result.modified_count > 0
 
     async def update_user_by_username(
@@ -222,6 +292,8 @@ class UserService:
         result = await self.collection.find_one_and_update(
             {"username": username}, {"$set": update_data}, return_document=True
         )
+        # Full names, authenticated users and external logins are cached
+        await invalidate(USER_PROFILES_CACHE, PRINCIPALS_CACHE, LOGINS_CACHE)
         return User(**result) if result else None
 
     async def update_external_user(self, username: str, full_name: str, email: str) -> Optional[User]:
@@ -231,6 +303,11 @@ class UserService:
         result = await self.collection.find_one_and_update(
             {"username": username}, {"$set": update_data}, return_document=True
         )
+        # Runs on every external login, so refresh the cached entries of this user in place instead of
+        # invalidating the whole caches; other workers pick the change up when their entries expire
+        if result:
+            self.full_name_cache[username] = result["full_name"]
+            clear_local_entry(PRINCIPALS_CACHE, username)
         return User(**result) if result else None
 
     async def admin_update_user(
@@ -254,7 +331,7 @@ class UserService:
             update_dict = {k: v for k, v in update_dict.items() if k in allowed_fields}
         else:
             if new_password is not None:
-                update_dict["hashed_password"] = get_password_hash(new_password)
+                update_dict["hashed_password"] = await get_password_hash_async(new_password)
             if "username" in update_dict:
                 update_dict["username"] = update_dict["username"].lower()
                 await self._check_username_uniqueness(update_dict["username"], username)
@@ -264,6 +341,8 @@ class UserService:
         result = await self.collection.find_one_and_update(
             {"username": username}, {"$set": update_data}, return_document=True
         )
+        # Full names, authenticated users and external logins are cached
+        await invalidate(USER_PROFILES_CACHE, PRINCIPALS_CACHE, LOGINS_CACHE)
         return User(**result) if result else None
 
     async def admin_delete_user(self, username: str, admin_username: str) -> bool:
@@ -284,6 +363,8 @@ class UserService:
             )
 
         result = await self.collection.delete_one({"username": username})
+        # Full names, authenticated users and external logins are cached
+        await invalidate(USER_PROFILES_CACHE, PRINCIPALS_CACHE, LOGINS_CACHE)
         return result.deleted_count > 0
 
     async def count_users(
@@ -314,11 +395,36 @@ class UserService:
 
     async def get_user_info(self, username: str) -> Optional[dict]:
         """Get basic user info (username and full_name) for display purposes."""
-        user = await self.collection.find_one({"username": username}, {"full_name": 1})
-        if user:
-            return {"username": username, "full_name": user["full_name"]}
+        full_names = await self.get_full_names([username])
+        if username in full_names:
+            return {"username": username, "full_name": full_names[username]}
         return None
 
+    async def get_full_names(self, usernames: Iterable[str]) -> Dict[str, str]:
+        """Resolve the full names of many users, with one query for those not cached
+
+        Args:
+            usernames: Usernames to resolve, duplicates are allowed
+
+        Returns:
+            Dictionary mapping each existing username to its full name
+        """
+        full_names = {}
+        missing = set()
+        for username in set(usernames):
+            full_name = self.full_name_cache.get(username)
+            if full_name is None:
+                missing.add(username)
+            else:
+                full_names[username] = full_name
+
+        if missing:
+            cursor = self.collection.find({"username": {"$in": list(missing)}}, {"username": 1, "full_name": 1})
+            async for user in cursor:
+                full_names[user["username"]] = self.full_name_cache[user["username"]] = user["full_name"]
+
+        return full_names
+
     async def get_users_by_usernames(self, usernames: List[str]) -> List[User]:
         """Get multiple users by their usernames.
 
@@ -337,39 +443,65 @@ class UserService:
             users.append(User(**user_dict))
         return users
 
-    async def get_user_avatar(self, username: str) -> tuple[bytes | str, str]:
+    async def get_user_avatar(self, username: str) -> Avatar:
         """Get an avatar for a user.
         If AVATAR_SERVER_ENABLED is true and URL is configured, fetches from the configured avatar server.
         Otherwise, returns a generated SVG avatar.
-        Response is cached for 1 day.
+        Avatars are cached in memory and, for fetched avatars, in AVATAR_CACHE_DIR when configured.
 
         Args:
             username: The username to get avatar for
 
         Returns:
-            Tuple of (content, media_type) where:
-                content: The avatar content (bytes for images, str for SVG)
-                media_type: The content type of the avatar
+            The avatar with its content, media type and ETag
         """
         # Generate cache key based on username and avatar server settings
         cache_key = keys.hashkey(username, settings.AVATAR_SERVER_ENABLED, settings.AVATAR_SERVER_URL)
 
         # Try to get from cache
-        if cache_key in self.avatar_cache:
-            return (self.avatar_cache[cache_key]["content"], self.avatar_cache[cache_key]["media_type"])
+        avatar = self.avatar_cache.get(cache_key)
+        if avatar is not None:
+            return avatar
 
         # Generate or fetch avatar
         if settings.AVATAR_SERVER_ENABLED and settings.AVATAR_SERVER_URL:
-            content, media_type = await self._fetch_external_avatar(username)
+            avatar = await self._get_external_avatar(username)
         else:
-            content, media_type = self._generate_svg_avatar(username)
+            avatar = _make_avatar(*self._generate_svg_avatar(username))
 
-        # Cache the response
-        self.avatar_cache[cache_key] = {"content": content, "media_type": media_type}
+        # Cache the avatar unless it alone exceeds the cache size
+        if len(avatar.content) <= self.avatar_cache.maxsize:
+            self.avatar_cache[cache_key] = avatar
 
-        return content, media_type
+        return avatar
 
-    async def _fetch_external_avatar(self, username: str) -> tuple[bytes, str]:
+    async def _get_external_avatar(self, username: str) -> Avatar:
+        """Get a fetched avatar from the disk cache, fetching it from the avatar server on a miss.
+        Generated fallback avatars are not written to disk, so a failed fetch is retried later.
+
+        Args:
+            username: The username to get avatar for
+
+        Returns:
+            The avatar
+        """
+        path = None
+        if settings.AVATAR_CACHE_DIR:
+            url = settings.AVATAR_SERVER_URL.format(username=username)
+            path = os.path.join(settings.AVATAR_CACHE_DIR, hashlib.sha256(url.encode()).hexdigest())
+            cached = await asyncio.to_thread(_read_disk_avatar, path)
+            if cached is not None:
+                return _make_avatar(*cached)
+
+        content, media_type, fetched = await self._fetch_external_avatar(username)
+        if path and fetched:
+            try:
+                await asyncio.to_thread(_write_disk_avatar, path, content, media_type)
+            except OSError as e:
+                logger.warning(f"Could not write avatar to disk cache: {str(e)}")
+        return _make_avatar(content, media_type)
+
+    async def _fetch_external_avatar(self, username: str) -> tuple[bytes | str, str, bool]:
         """Fetch avatar from external avatar server.
         If the fetch fails for any reason (network error, non-200 status, etc.),
         falls back to generated SVG avatar.
@@ -378,21 +510,20 @@ class UserService:
             username: The username to fetch avatar for
 
         Returns:
-            Tuple of (content, media_type)
+            Tuple of (content, media_type, fetched) where fetched is False for the fallback avatar
         """
         try:
             avatar_url = settings.AVATAR_SERVER_URL.format(username=username)
-            async with httpx.AsyncClient(verify=False) as client:
-                response = await client.get(avatar_url)
-                if response.status_code == 200:
-                    return response.content, response.headers.get("content-type", "image/png")
+            response = await shared_http_client.get(avatar_url)
+            if response.status_code == 200:
+                return response.content, response.headers.get("content-type", "image/png"), True
         except Exception:
             # Log error if needed
             pass
 
         # If we get here, either the request failed or returned non-200 status
         # Fallback to generated avatar
-        return self._generate_svg_avatar(username)
+        return *self._generate_svg_avatar(username), False
 
     def _generate_svg_avatar(self, username: str) -> tuple[str, str]:
         """Generate an SVG avatar for a user.
@@ -406,9 +537,8 @@ class UserService:
         # Get the first two letters of the username (uppercase)
         first_letters = username[:2].upper() if len(username) >= 2 else (username[0].upper() if username else "?")
 
-        # Generate a consistent color based on the username
-        color = f"#{hash(username) % 0xFFFFFF:06x}"
-
+        # Generate a consistent color based on the username, the same in every process
+        color = avatar_color(username)
         # Create SVG template
         svg = f'''<?xml version="1.0" encoding="UTF-8"?>
     <svg width="100" height="100" version="1.1" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">
@@ -419,3 +549,9 @@ class UserService:
     </svg>'''
 
         return svg, "image/svg+xml"
+
+
+@lru_cache
+def get_user_service() -> UserService:
+    """Get the application-scoped UserService instance"""
+    return UserService()
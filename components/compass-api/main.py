@@ -6,9 +6,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
-from app.core.mongodb import connect_to_mongo, close_mongo_connection
+from app.core.cache import cache_invalidation_listener
+from app.core.config import settings
+from app.core.http_client import shared_http_client
+from app.core.password import password_hasher_pool
+from app.core.indexes import ensure_indexes
+from app.core.mongodb import connect_to_mongo, close_mongo_connection, get_database
 from app.routers import api_router
-from app.services.user_service import UserService
+from app.services.history_writer import get_history_writer
+from app.services.search_index import get_search_index
+from app.services.user_service import get_user_service
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -19,17 +26,45 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
+    await shared_http_client.start()
+
+    # Apply declared indexes once instead of on the request path
+    failed_indexes = await ensure_indexes(get_database())
+    if failed_indexes:
+        logger.error(f"Some indexes could not be created: {', '.join(failed_indexes)}")
+    else:
+        logger.info("Index bootstrap completed")
 
     # Ensure default admin exists
-    user_service = UserService()
+    user_service = get_user_service()
     try:
         await user_service.ensure_default_admin()
         logger.info("Default admin user check completed")
     except Exception as e:
         logger.error(f"Error ensuring default admin user: {e}")
 
+    # Clear local caches when other workers change cached data
+    if settings.CACHE_INVALIDATION_BROADCAST_ENABLED:
+        await cache_invalidation_listener.start(get_database())
+
+    # Build the in-memory search index
+    if settings.SEARCH_INDEX_ENABLED:
+        try:
+            await get_search_index().start(get_database())
+        except Exception as e:
+            logger.error(f"Error building search index: {e}")
+
+    # Write history records behind the requests that produce them
+    if settings.HISTORY_WRITE_MODE == "async":
+        await get_history_writer().start(get_database())
+
     yield
-    # Shutdown
+    # Shutdown, writing queued history records while the database connection is still open
+    await get_history_writer().stop()
+    await get_search_index().stop()
+    await cache_invalidation_listener.stop()
+    await shared_http_client.stop()
+    password_hasher_pool.shutdown()
     await close_mongo_connection()
 
 
@@ -0,0 +1,51 @@
+"""
+Script to compare the declared MongoDB indexes with the indexes in the database.
+This script will:
+1. Connect to MongoDB using the same .env config as the API
+2. Print declared indexes that are missing, existing indexes that are not declared,
+   and indexes whose unique option differs from the declaration
+3. Create the missing indexes (only with --apply)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.indexes import diff_indexes, ensure_indexes  # noqa: E402
+from app.core.mongodb import close_mongo_connection, connect_to_mongo, get_database  # noqa: E402
+
+
+async def main(apply: bool) -> int:
+    await connect_to_mongo()
+    try:
+        db = get_database()
+        if apply:
+            failed = await ensure_indexes(db)
+            for index in failed:
+                print(f"Failed to create index: {index}")
+        differences = await diff_indexes(db)
+    finally:
+        await close_mongo_connection()
+
+    if not differences:
+        print("All declared indexes are in place")
+        return 0
+
+    for collection_name, diff in differences.items():
+        print(f"{collection_name}:")
+        for kind in ("missing", "extra", "mismatched"):
+            for index_name in diff[kind]:
+                print(f"  {kind}: {index_name}")
+
+    # Extra indexes are reported but do not fail the check
+    return 1 if any(diff["missing"] or diff["mismatched"] for diff in differences.values()) else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diff declared and actual MongoDB indexes")
+    parser.add_argument("--apply", action="store_true", help="Create missing indexes before diffing")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.apply)))
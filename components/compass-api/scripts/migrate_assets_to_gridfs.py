@@ -0,0 +1,37 @@
+"""
+Script to move asset content stored inline in asset documents into GridFS.
+This script will:
+1. Connect to MongoDB using the same .env config as the API
+2. Find assets whose content is still stored in the data field
+3. Upload their content to the asset_files GridFS bucket and remove the data field (unless --dry-run is given)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.mongodb import close_mongo_connection, connect_to_mongo  # noqa: E402
+from app.services.asset_service import get_asset_service  # noqa: E402
+
+
+async def main(dry_run: bool) -> int:
+    await connect_to_mongo()
+    try:
+        result = await get_asset_service().migrate_inline_assets(dry_run=dry_run)
+    finally:
+        await close_mongo_connection()
+
+    print(f"Inline assets: {result['found']}")
+    if not dry_run:
+        print(f"Migrated assets: {result['migrated']}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move inline asset content into GridFS")
+    parser.add_argument("--dry-run", action="store_true", help="Only count inline assets")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.dry_run)))
@@ -0,0 +1,42 @@
+"""
+Script to rebuild or verify the rating fields stored on solution documents.
+This script will:
+1. Connect to MongoDB using the same .env config as the API
+2. Recompute rating, rating_count and rating_distribution for every solution
+3. Update solutions whose stored fields are out of date (unless --verify-only is given)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.mongodb import close_mongo_connection, connect_to_mongo  # noqa: E402
+from app.services.rating_service import get_rating_service  # noqa: E402
+
+
+async def main(verify_only: bool) -> int:
+    await connect_to_mongo()
+    try:
+        result = await get_rating_service().rebuild_rating_aggregates(verify_only=verify_only)
+    finally:
+        await close_mongo_connection()
+
+    print(f"Checked solutions: {result['checked']}")
+    print(f"Out-of-date solutions: {result['mismatched']}")
+    for slug in result["mismatched_slugs"]:
+        print(f"  - {slug}")
+    if not verify_only:
+        print(f"Updated solutions: {result['updated']}")
+
+    # Non-zero exit code lets CI fail a verification run
+    return 1 if verify_only and result["mismatched"] else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild or verify materialized solution rating fields")
+    parser.add_argument("--verify-only", action="store_true", help="Only report out-of-date solutions")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.verify_only)))
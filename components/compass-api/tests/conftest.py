@@ -8,3 +8,4 @@ os.environ["DEFAULT_ADMIN_USERNAME"] = "admin"
 os.environ["DEFAULT_ADMIN_PASSWORD"] = os.environ["DEFAULT_ADMIN_USERNAME"]
 os.environ["DEFAULT_ADMIN_EMAIL"] = "admin@techcompass.com"
 os.environ["DEFAULT_ADMIN_FULLNAME"] = "System Admin"
+os.environ["HISTORY_WRITE_MODE"] = "sync"
@@ -0,0 +1,68 @@
+from app.core.cache import CacheInvalidationListener, clear_local_entry, get_cache, invalidate
+
+
+async def test_invalidate_clears_shared_cache():
+    cache = get_cache("test-namespace", maxsize=10, ttl=60)
+    cache["key"] = "value"
+
+    # Every caller of the same namespace shares one cache
+    assert get_cache("test-namespace")["key"] == "value"
+
+    await invalidate("test-namespace")
+    assert "key" not in get_cache("test-namespace")
+
+
+def test_clear_local_entry_removes_only_that_key():
+    cache = get_cache("test-entries", maxsize=10, ttl=60)
+    cache["alice"] = 1
+    cache["bob"] = 2
+
+    clear_local_entry("test-entries", "alice")
+    clear_local_entry("test-entries", "missing")
+    clear_local_entry("unknown-namespace", "alice")
+
+    assert "alice" not in cache
+    assert cache["bob"] == 2
+
+
+class TailableCursor:
+    """Cursor that returns its documents with empty await-data waits in between, then dies"""
+
+    def __init__(self, documents):
+        self.results = [result for document in documents for result in (document, None)]
+
+    @property
+    def alive(self):
+        return bool(self.results)
+
+    async def next(self):
+        document = self.results.pop(0)
+        if document is None:
+            raise StopAsyncIteration
+        return document
+
+
+class InvalidationCollection:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def find_one(self, query, projection=None):
+        return next((document for document in self.documents if document["_id"] == query["_id"]), None)
+
+    def find(self, query, cursor_type=None):
+        return TailableCursor(self.documents)
+
+
+async def test_listener_resumes_after_last_seen_invalidation_in_insertion_order():
+    get_cache("test-seen", maxsize=10, ttl=60)["key"] = "value"
+    get_cache("test-unseen", maxsize=10, ttl=60)["key"] = "value"
+    # A lagging host wrote a smaller id after the last seen invalidation
+    collection = InvalidationCollection(
+        [{"_id": 5, "namespaces": ["test-seen"]}, {"_id": 3, "namespaces": ["test-unseen"]}]
+    )
+
+    last_id = await CacheInvalidationListener()._tail(collection, 5)
+
+    assert last_id == 3
+    assert "key" in get_cache("test-seen")
+    assert "key" not in get_cache("test-unseen")
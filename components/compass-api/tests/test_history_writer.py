@@ -0,0 +1,60 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services.history_writer import HistoryWriter
+
+
+class RecordingCollection:
+    def __init__(self):
+        self.batches = []
+
+    async def insert_many(self, documents, ordered=True):
+        self.batches.append(list(documents))
+
+
+async def test_queued_records_are_written_on_stop():
+    collection = RecordingCollection()
+    writer = HistoryWriter()
+    await writer.start(SimpleNamespace(history=collection))
+
+    await writer.write([{"_id": 1}, {"_id": 2}])
+    await writer.write([{"_id": 3}])
+    await writer.stop()
+
+    assert [document["_id"] for batch in collection.batches for document in batch] == [1, 2, 3]
+    assert writer.queue_size() == 0
+
+
+class FailingOnceCollection(RecordingCollection):
+    def __init__(self):
+        super().__init__()
+        self.failed = False
+
+    async def insert_many(self, documents, ordered=True):
+        if not self.failed:
+            self.failed = True
+            raise ValueError("cannot encode document")
+        await super().insert_many(documents, ordered)
+
+
+async def test_failed_batch_does_not_stop_the_writer():
+    collection = FailingOnceCollection()
+    writer = HistoryWriter()
+    await writer.start(SimpleNamespace(history=collection))
+
+    await writer.write([{"_id": 1}])
+    await asyncio.sleep(0)
+    await writer.write([{"_id": 2}])
+    await writer.stop()
+
+    assert collection.batches == [[{"_id": 2}]]
+
+
+async def test_records_are_inserted_directly_until_started():
+    collection = RecordingCollection()
+    writer = HistoryWriter()
+    writer.collection = collection
+
+    await writer.write([{"_id": 1}])
+
+    assert collection.batches == [[{"_id": 1}]]
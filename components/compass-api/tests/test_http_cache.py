@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import pytest
+from starlette.requests import Request
+
+from app.core.http_cache import format_http_date, is_not_modified, parse_range
+
+
+def _request(**headers) -> Request:
+    raw_headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw_headers})
+
+
+def test_is_not_modified_matches_etag():
+    etag = '"abc"'
+    assert is_not_modified(_request(if_none_match='"abc"'), etag)
+    assert is_not_modified(_request(if_none_match='W/"abc", "def"'), etag)
+    assert is_not_modified(_request(if_none_match="*"), etag)
+    assert not is_not_modified(_request(if_none_match='"def"'), etag)
+    assert not is_not_modified(_request(), etag)
+
+
+def test_is_not_modified_prefers_etag_over_date():
+    last_modified = datetime(2024, 1, 1, 12, 0, 0)
+    since = format_http_date(last_modified)
+
+    assert is_not_modified(_request(if_modified_since=since), '"abc"', last_modified)
+    assert not is_not_modified(_request(if_none_match='"def"', if_modified_since=since), '"abc"', last_modified)
+    assert not is_not_modified(_request(if_modified_since=since), '"abc"', datetime(2024, 1, 2))
+    assert not is_not_modified(_request(if_modified_since="garbage"), '"abc"', last_modified)
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=990-2000", 1000) == (990, 999)
+    assert parse_range("bytes=-2000", 1000) == (0, 999)
+
+
+def test_parse_range_ignores_unsupported_headers():
+    assert parse_range("items=0-10", 1000) is None
+    assert parse_range("bytes=0-10,20-30", 1000) is None
+    assert parse_range("bytes=abc", 1000) is None
+    assert parse_range("bytes=-", 1000) is None
+
+
+def test_parse_range_rejects_unsatisfiable_ranges():
+    for header in ("bytes=1000-", "bytes=500-100", "bytes=-0"):
+        with pytest.raises(ValueError):
+            parse_range(header, 1000)
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+
+from app.core.pagination import apply_cursor, decode_cursor, encode_cursor, next_cursor
+
+
+def test_cursor_round_trip():
+    last_id = ObjectId()
+    created_at = datetime(2024, 5, 1, 12, 30)
+
+    assert decode_cursor(encode_cursor(created_at, last_id)) == (created_at, last_id)
+    assert decode_cursor(encode_cursor(None, last_id)) == (None, last_id)
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_apply_cursor_continues_after_last_item():
+    last_id = ObjectId()
+    cursor = encode_cursor("docker", last_id)
+
+    assert apply_cursor({}, "name", ASCENDING, None) == {}
+    assert apply_cursor({}, "name", ASCENDING, cursor) == {
+        "$or": [{"name": {"$gt": "docker"}}, {"name": "docker", "_id": {"$gt": last_id}}]
+    }
+    # Nulls sort last in descending order, so they still follow the cursor
+    assert apply_cursor({"team": "A"}, "name", DESCENDING, cursor) == {
+        "$and": [
+            {"team": "A"},
+            {"$or": [{"name": {"$lt": "docker"}}, {"name": "docker", "_id": {"$lt": last_id}}, {"name": None}]},
+        ]
+    }
+
+
+def test_apply_cursor_after_null_sort_value():
+    last_id = ObjectId()
+    cursor = encode_cursor(None, last_id)
+
+    assert apply_cursor({}, "category", ASCENDING, cursor) == {
+        "$or": [{"category": None, "_id": {"$gt": last_id}}, {"category": {"$ne": None}}]
+    }
+    assert apply_cursor({}, "category", DESCENDING, cursor) == {"$or": [{"category": None, "_id": {"$lt": last_id}}]}
+
+
+def test_next_cursor_only_for_full_pages():
+    documents = [{"_id": ObjectId(), "name": "a"}, {"_id": ObjectId(), "name": "b"}]
+
+    assert next_cursor(documents, "name", 3) is None
+    assert decode_cursor(next_cursor(documents, "name", 2)) == ("b", documents[-1]["_id"])
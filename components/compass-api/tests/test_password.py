@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.password import PasswordHasherPool
+
+
+async def test_pool_runs_function_in_worker_thread():
+    pool = PasswordHasherPool(workers=2, max_pending=10)
+    try:
+        assert await pool.run(lambda a, b: a + b, 1, 2) == 3
+        assert pool.stats() == {"workers": 2, "running": 0, "waiting": 0}
+    finally:
+        pool.shutdown()
+
+
+async def test_pool_rejects_calls_when_queue_is_full():
+    pool = PasswordHasherPool(workers=1, max_pending=1)
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def block():
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+
+    try:
+        running = asyncio.create_task(pool.run(block))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.create_task(pool.run(lambda: None))
+        await asyncio.sleep(0)
+        assert pool.stats()["waiting"] == 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run(lambda: None)
+        assert exc_info.value.status_code == 503
+
+        release.set()
+        await asyncio.gather(running, waiting)
+    finally:
+        pool.shutdown()
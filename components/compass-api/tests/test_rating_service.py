@@ -0,0 +1,14 @@
+from app.services.rating_service import RatingService
+
+
+def test_build_rating_summary():
+    summary = RatingService._build_rating_summary({"average": 11 / 3, "count": 3, "scores": [5, 5, 1]})
+    assert summary == {"average": 3.67, "count": 3, "distribution": {"1": 1, "2": 0, "3": 0, "4": 0, "5": 2}}
+
+
+def test_initial_rating_fields():
+    fields = RatingService.initial_rating_fields()
+    assert fields["rating"] == 0
+    assert fields["rating_count"] == 0
+    assert fields["rating_sum"] == 0
+    assert fields["rating_distribution"] == {str(i): 0 for i in range(1, 6)}
@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from app.services.search_index import SearchIndex, SolutionSearchIndex
+
+WEIGHTS = {"name": 10, "brief": 8, "description": 5, "pros": 1}
+
+
+def _build_index() -> SearchIndex:
+    index = SearchIndex(WEIGHTS)
+    index.add("1", {"name": "Kubernetes", "brief": "Container orchestration", "description": "Run containers"})
+    index.add("2", {"name": "Docker", "brief": "Container runtime", "description": "Build and run containers"})
+    index.add("3", {"name": "Prometheus", "brief": "Monitoring", "pros": ["Works with Kubernetes"]})
+    return index
+
+
+def _ids(matches):
+    return [payload["name"] for payload, _ in matches]
+
+
+def test_prefix_and_fuzzy_matching():
+    index = _build_index()
+
+    matches, total = index.search("kube")
+    assert total == 2
+    # A match in the name outweighs a match in the pros
+    assert _ids(matches) == ["Kubernetes", "Prometheus"]
+
+    matches, _ = index.search("kubernetse")
+    assert _ids(matches)[0] == "Kubernetes"
+
+
+def test_all_tokens_must_match_and_pagination():
+    index = _build_index()
+
+    matches, total = index.search("container docker")
+    assert total == 1
+    assert _ids(matches) == ["Docker"]
+
+    matches, total = index.search("containers", skip=1, limit=1)
+    assert total == 2
+    assert len(matches) == 1
+
+
+def test_remove_and_replace_documents():
+    index = _build_index()
+
+    index.remove("1")
+    assert "1" not in index
+    assert _ids(index.search("kubernetes")[0]) == ["Prometheus"]
+
+    index.add("2", {"name": "Podman", "brief": "Daemonless containers"})
+    assert index.search("docker") == ([], 0)
+    assert _ids(index.search("podman")[0]) == ["Podman"]
+    assert len(index) == 2
+
+
+def test_add_many_matches_add():
+    index = SearchIndex(WEIGHTS)
+    index.add("1", {"name": "Kafka"})
+    index.add_many(
+        [
+            ("1", {"name": "Kubernetes", "brief": "Container orchestration"}, None),
+            ("2", {"name": "Docker", "brief": "Container runtime"}, None),
+        ]
+    )
+
+    assert index._terms == sorted(index._terms)
+    assert index.search("kafka") == ([], 0)
+    matches, total = index.search("cont")
+    assert total == 2
+    assert sorted(_ids(matches)) == ["Docker", "Kubernetes"]
+
+
+class ChangingCursor:
+    """Cursor whose read lets a write happen, as a request can while a build awaits it"""
+
+    def __init__(self, documents, on_read):
+        self.documents = documents
+        self.on_read = on_read
+
+    async def to_list(self, length=None):
+        self.on_read()
+        return self.documents
+
+
+def _solution(solution_id, name):
+    return {
+        "_id": solution_id,
+        "name": name,
+        "slug": name.lower(),
+        "description": f"{name} description",
+        "brief": name,
+        "department": "Platform",
+        "team": "Core",
+        "review_status": "APPROVED",
+    }
+
+
+async def test_changes_during_build_are_kept():
+    search_index = SolutionSearchIndex()
+    kafka_id, redis_id = ObjectId(), ObjectId()
+    documents = [_solution(kafka_id, "Kafka"), _solution(redis_id, "Redis")]
+
+    def write_during_read():
+        search_index.index_solution(_solution(kafka_id, "Pulsar"))
+        search_index.remove_solution(redis_id)
+
+    search_index.collection = SimpleNamespace(find=lambda query: ChangingCursor(documents, write_during_read))
+
+    assert await search_index.build() == 1
+    assert [solution.name for solution in search_index.search("pulsar")[0]] == ["Pulsar"]
+    assert search_index.search("redis") == ([], 0)
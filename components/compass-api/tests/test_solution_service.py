@@ -1,7 +1,37 @@
-from app.services.solution_service import generate_slug
+from app.services.solution_service import allocate_slugs, changed_solution_fields, generate_slug, next_available_slug
 
 def test_generate_slug():
     # Test with a valid title
     title = "Test Title"
     expected_slug = "test-title"
-    assert generate_slug(title) == expected_slug
\ No newline at end of file
+    assert generate_slug(title) == expected_slug
+
+def test_next_available_slug():
+    assert next_available_slug("docker", []) == "docker"
+    assert next_available_slug("docker", ["docker"]) == "docker-1"
+    assert next_available_slug("docker", ["docker", "docker-1", "docker-2"]) == "docker-3"
+    # The first gap is reused
+    assert next_available_slug("docker", ["docker", "docker-2"]) == "docker-1"
+    assert next_available_slug("docker", ["docker-1"]) == "docker"
+
+def test_allocate_slugs():
+    # Solutions keep matching slugs, others get the first free variants
+    assert allocate_slugs("docker", ["docker-2", "podman", "old"], ["docker"]) == ["docker-2", "docker-1", "docker-3"]
+    assert allocate_slugs("docker", ["podman", "old"], []) == ["docker", "docker-1"]
+    # A slug taken by another solution is not kept
+    assert allocate_slugs("docker", ["docker"], ["docker"]) == ["docker-1"]
+
+def test_changed_solution_fields():
+    changed_fields = changed_solution_fields(
+        {"name": "Docker", "recommend_status": "TRIAL"},
+        {"name": "Docker", "recommend_status": "ADOPT", "slug": "docker", "updated_by": "admin"},
+        {"recommend_status": "Widely used"},
+    )
+    assert changed_fields == [
+        {
+            "field_name": "recommend_status",
+            "old_value": "TRIAL",
+            "new_value": "ADOPT",
+            "status_change_justification": "Widely used",
+        }
+    ]
@@ -0,0 +1,34 @@
+from app.services.suggest_service import SuggestIndex
+
+
+def _build_index() -> SuggestIndex:
+    return SuggestIndex(
+        [
+            ("Kubernetes", "solution", 0),
+            ("Azure Kubernetes Service", "solution", 0),
+            ("kubernetes", "tag", 5),
+            ("kafka", "tag", 2),
+            ("Kafka Platform Team", "team", 0),
+            ("Kafka", "solution", 0),
+        ]
+    )
+
+
+def test_complete_matches_any_word_and_ranks_prefix_matches_first():
+    index = _build_index()
+
+    assert index.complete("kube") == [
+        ("Kubernetes", "solution"),
+        ("kubernetes", "tag"),
+        ("Azure Kubernetes Service", "solution"),
+    ]
+    assert index.complete("KUBE", limit=1) == [("Kubernetes", "solution")]
+
+
+def test_complete_orders_by_type_then_weight():
+    index = _build_index()
+
+    assert index.complete("ka") == [("Kafka", "solution"), ("kafka", "tag"), ("Kafka Platform Team", "team")]
+    assert index.complete("platform") == [("Kafka Platform Team", "team")]
+    assert index.complete("zzz") == []
+    assert index.complete("  ") == []
@@ -0,0 +1,21 @@
+from app.services.user_service import _make_avatar, _read_disk_avatar, _write_disk_avatar, avatar_color
+
+
+def test_avatar_color_is_stable():
+    # Derived from sha256, so every process renders the same color
+    assert avatar_color("alice") == "#66df64"
+    assert avatar_color("alice") != avatar_color("bob")
+    assert avatar_color("alice").startswith("#") and len(avatar_color("alice")) == 7
+
+
+def test_avatar_etag_depends_on_content():
+    assert _make_avatar("<svg/>", "image/svg+xml").etag == _make_avatar(b"<svg/>", "image/svg+xml").etag
+    assert _make_avatar(b"a", "image/png").etag != _make_avatar(b"b", "image/png").etag
+
+
+def test_disk_avatar_round_trip(tmp_path):
+    path = str(tmp_path / "avatars" / "key")
+    assert _read_disk_avatar(path) is None
+
+    _write_disk_avatar(path, b"\x89PNG\n\x00data", "image/png")
+    assert _read_disk_avatar(path) == (b"\x89PNG\n\x00data", "image/png")